@@ -8,6 +8,7 @@ import asyncio
 from typing import Optional, List, Deque
 from pathlib import Path
 
+import aiofiles
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
@@ -49,6 +50,17 @@ def normalize_model_name(model: str) -> str:
     return MODEL_NAME_MAP.get(model_lower, "sensevoice-small")
 
 
+# 上传文件落盘的分块大小
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def save_upload_file(file: UploadFile, file_path: str) -> None:
+    """分块异步写入上传文件，不阻塞事件循环，也不把整个文件读入内存"""
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
+
+
 # 依赖注入
 _transcription_service = TranscriptionService()
 _file_service = FileService()
@@ -121,9 +133,7 @@ async def transcribe_file(
             Path(file.filename).suffix
         )
 
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        await save_upload_file(file, file_path)
 
         # 验证文件
         is_valid, error_msg = await file_service.validate_file(
@@ -214,9 +224,7 @@ async def transcribe_batch(
                 Path(file.filename).suffix
             )
 
-            with open(file_path, "wb") as f:
-                content = await file.read()
-                f.write(content)
+            await save_upload_file(file, file_path)
 
             is_valid, error_msg = await file_service.validate_file(
                 file_path,
@@ -141,6 +141,7 @@ class Settings(BaseSettings):
     # 任务配置
     # ============================================================
     MAX_CONCURRENT_TASKS: int = 3
+    MAX_CONCURRENT_TRANSCRIPTIONS: int = 1  # 批量处理时同时推理的任务数，其余任务的音频提取与之重叠
     TASK_TIMEOUT: int = 3600  # seconds
     TASK_CLEANUP_INTERVAL: int = 3600  # seconds
     TASK_RETENTION_HOURS: int = 24
@@ -3,7 +3,6 @@ Video Transcriber 核心模块包
 """
 
 from .downloader import audio_extractor, extract_audio_from_video
-from .sensevoice_transcriber import create_sensevoice_transcriber, SenseVoiceTranscriber
 from .engine import transcription_engine, transcribe_video_file
 
 __version__ = "1.0.0"
@@ -18,3 +17,11 @@ __all__ = [
     # 引擎
     "transcription_engine", "transcribe_video_file"
 ]
+
+
+def __getattr__(name):
+    """SenseVoice 转录器按需导入，避免包导入时加载 torch / funasr"""
+    if name in ("create_sensevoice_transcriber", "SenseVoiceTranscriber"):
+        from . import sensevoice_transcriber
+        return getattr(sensevoice_transcriber, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,10 @@
 """
 
 import os
+import re
 import shutil
+import stat
+import functools
 import subprocess
 import asyncio
 from pathlib import Path
@@ -17,6 +20,29 @@ from loguru import logger
 from models.schemas import MediaFileInfo, MediaFormat
 from utils.ffmpeg import configure_pydub_ffmpeg, get_ffmpeg_path
 
+_DURATION_PATTERN = re.compile(r"Duration:\s*(\d+):(\d+):(\d+\.\d+)")
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_media_duration(file_path: str, mtime: float, size: int) -> Optional[float]:
+    """
+    读取媒体头部的时长信息，按 (路径, 修改时间, 文件大小) 缓存
+
+    只指定输入、不指定输出时 ffmpeg 解析完容器头部即退出，不会解码整个文件。
+    """
+    ffmpeg = get_ffmpeg_path() or "ffmpeg"
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-i", file_path],
+        capture_output=True, timeout=30
+    )
+    # 从 stderr 中解析时长，格式: Duration: HH:MM:SS.ms
+    output = result.stderr.decode("utf-8", errors="replace")
+    match = _DURATION_PATTERN.search(output)
+    if match:
+        h, m, s = float(match.group(1)), float(match.group(2)), float(match.group(3))
+        return h * 3600 + m * 60 + s
+    return None
+
 
 class AudioExtractor:
     """音频提取器"""
@@ -71,15 +97,18 @@ class AudioExtractor:
         try:
             path = Path(file_path)
 
-            if not path.exists():
+            # 一次 stat 同时完成存在性、类型和大小检查
+            try:
+                st = path.stat()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"文件不存在: {file_path}")
 
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 raise ValueError(f"路径不是文件: {file_path}")
 
             # 获取文件信息
             file_name = path.name
-            file_size = path.stat().st_size
+            file_size = st.st_size
             file_ext = path.suffix.lower()
 
             # 检测媒体格式
@@ -115,19 +144,8 @@ class AudioExtractor:
     def _get_media_duration(self, file_path: str) -> Optional[float]:
         """获取媒体时长"""
         try:
-            ffmpeg = get_ffmpeg_path() or "ffmpeg"
-            result = subprocess.run(
-                [ffmpeg, "-i", file_path, "-f", "null", "-"],
-                capture_output=True, timeout=30
-            )
-            # 从 stderr 中解析时长，格式: Duration: HH:MM:SS.ms
-            output = result.stderr.decode("utf-8", errors="replace")
-            import re
-            match = re.search(r"Duration:\s*(\d+):(\d+):(\d+\.\d+)", output)
-            if match:
-                h, m, s = float(match.group(1)), float(match.group(2)), float(match.group(3))
-                return h * 3600 + m * 60 + s
-            return None
+            st = os.stat(file_path)
+            return _probe_media_duration(os.path.abspath(file_path), st.st_mtime, st.st_size)
         except Exception as e:
             logger.warning(f"无法获取媒体时长: {e}")
             return None
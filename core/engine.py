@@ -132,12 +132,25 @@ class VideoTranscriptionEngine:
                 total_progress = 50 + (progress * 0.45)
                 update_progress(total_progress, "正在进行语音识别...")
 
-            # 使用 SenseVoice 转录器
-            from .sensevoice_transcriber import create_sensevoice_transcriber
-            transcriber = create_sensevoice_transcriber(
-                model_name=options.model.value if hasattr(options.model, 'value') else str(options.model),
-                model_cache_dir=str(self.temp_dir / "models_cache")
-            )
+            model_name = options.model.value if hasattr(options.model, 'value') else str(options.model)
+            if model_name == TranscriptionModel.SENSEVOICE_SMALL.value:
+                # 使用 SenseVoice 转录器
+                from .sensevoice_transcriber import create_sensevoice_transcriber
+                transcriber = create_sensevoice_transcriber(
+                    model_name=model_name,
+                    model_cache_dir=str(self.temp_dir / "models_cache"),
+                    compute_type=options.compute_type
+                )
+            else:
+                # Whisper 系列模型使用 faster-whisper 后端
+                from .transcriber import create_transcriber
+                transcriber = create_transcriber(
+                    model_name=TranscriptionModel(model_name),
+                    model_cache_dir=str(self.temp_dir / "models_cache"),
+                    backend="faster_whisper",
+                    compute_type=options.compute_type,
+                    vad_filter=options.vad_filter
+                )
 
             transcription_result = await transcriber.transcribe_audio(
                 audio_path=audio_path,
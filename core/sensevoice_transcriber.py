@@ -5,11 +5,16 @@ SenseVoice 语音转录器
 """
 
 import os
+import re
 import time
+import queue
 import asyncio
+import contextlib
+import functools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple, Union
 
 import torch
 import numpy as np
@@ -40,6 +45,73 @@ except ImportError:
     AudioChunker = None
     logger.warning("音频分块模块不可用，长音频处理可能会遇到显存不足问题")
 
+# SenseVoice 特殊标记（<|zh|>、<|NEUTRAL|>、<|Speech|>、<|woitn|> 等）与相邻空白组成的连续片段
+# 片段中含空白时折叠为单个空格，否则直接删除，等价于"先删标记、再折叠空白"的两步处理
+_SPECIAL_TOKEN_RUN_PATTERN = re.compile(r'(?:<\|[A-Za-z_]+\|>|\s)+')
+_WHITESPACE_PATTERN = re.compile(r'\s')
+
+# 标点结果缓存：只缓存短片段（"嗯"、"啊"、"um" 等重复出现的填充词）
+_PUNCTUATION_CACHE_SIZE = 4096
+_PUNCTUATION_CACHE_MAX_TEXT_LENGTH = 64
+
+# SenseVoice 不提供片段级置信度，统一使用的固定置信度
+_SEGMENT_CONFIDENCE = 0.95
+
+# 分块流水线：分割与推理重叠进行，队列容量限制磁盘上等待转录的块数
+_CHUNK_QUEUE_SIZE = 2
+_CHUNKS_DONE = object()
+
+# SenseVoice 推理参数中与调用无关的固定部分（device / language 按调用传入）
+# 使用较小的 batch_size_s 适配 8GB 显存
+_REC_CONFIG_KWARGS = {
+    "batch_size_s": 60,   # 每段60秒，避免 OOM
+    "merge_vad": True,    # 合并 vad
+    "merge_length_s": 5,  # 合并长度
+}
+# 分块结果只保留文本，跳过时间戳计算
+_CHUNK_REC_CONFIG_KWARGS = {**_REC_CONFIG_KWARGS, "output_timestamp": False}
+
+# GPU 上按 compute_type 选择的 autocast 精度，未列出的取值保持 FP32
+_CUDA_AUTOCAST_DTYPES = {
+    "float16": torch.float16,
+    "int8_float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+}
+# CPU 上对 Linear 层做 int8 动态量化的 compute_type
+_CPU_INT8_COMPUTE_TYPES = ("int8", "int8_float16")
+
+
+def _special_token_run_replacement(run: str) -> str:
+    """特殊标记片段的替换文本"""
+    return ' ' if _WHITESPACE_PATTERN.search(run) else ''
+
+
+def _build_segment(
+    start_time: float,
+    end_time: float,
+    text: str,
+    confidence: float = _SEGMENT_CONFIDENCE
+) -> TranscriptionSegment:
+    """
+    构建转录片段（跳过 pydantic 逐字段校验）
+
+    结果解析循环中的字段均由本模块生成、类型已确定，只需保留
+    end_time > start_time 这一项约束，与 TranscriptionSegment 的校验器一致。
+    """
+    if end_time <= start_time:
+        raise ValueError('end_time must be greater than start_time')
+    return TranscriptionSegment.model_construct(
+        start_time=start_time,
+        end_time=end_time,
+        text=text,
+        confidence=confidence
+    )
+
+
+def _init_infer_thread() -> None:
+    """推理工作线程初始化：限制 torch 计算线程数，避免与其他线程争用 CPU"""
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+
 
 class SenseVoiceTranscriber:
     """SenseVoice 语音转录器"""
@@ -66,7 +138,8 @@ class SenseVoiceTranscriber:
         enable_chunking: bool = True,
         chunk_duration_seconds: int = 180,
         chunk_overlap_seconds: int = 2,
-        min_duration_for_chunking: int = 300
+        min_duration_for_chunking: int = 300,
+        compute_type: Optional[str] = None
     ):
         """
         初始化 SenseVoice 转录器
@@ -82,6 +155,8 @@ class SenseVoiceTranscriber:
             chunk_duration_seconds: 每块时长（秒），默认180秒（3分钟）
             chunk_overlap_seconds: 块之间重叠时间（秒），默认2秒
             min_duration_for_chunking: 超过此时长（秒）才启用分块，默认300秒（5分钟）
+            compute_type: 计算精度 ('float32', 'float16', 'bfloat16', 'int8', 'int8_float16')，
+                None 则保持 FP32
         """
         if not FUNASR_AVAILABLE:
             raise RuntimeError(
@@ -93,6 +168,7 @@ class SenseVoiceTranscriber:
         self.default_language = language
         self.enable_punctuation = enable_punctuation
         self.clean_special_tokens = clean_special_tokens
+        self.compute_type = compute_type
 
         # 音频分块处理配置
         self.enable_chunking = enable_chunking and CHUNKING_AVAILABLE
@@ -129,6 +205,15 @@ class SenseVoiceTranscriber:
         self._model_loaded = False
         self._punctuation_loaded = False
 
+        # 专用单线程推理执行器，模型加载与推理都固定在同一线程，
+        # 避免与事件循环默认线程池中的其他任务相互阻塞
+        self._infer_executor: Optional[ThreadPoolExecutor] = None
+
+        # 短片段标点结果缓存，键为 (文本, 语言)
+        self._punctuation_cache = functools.lru_cache(maxsize=_PUNCTUATION_CACHE_SIZE)(
+            self._add_punctuation
+        )
+
         # 语言映射
         self.language_map = {
             "auto": "auto",
@@ -162,6 +247,16 @@ class SenseVoiceTranscriber:
 
         return device
 
+    def _get_infer_executor(self) -> ThreadPoolExecutor:
+        """获取推理执行器（卸载模型后按需重建）"""
+        if self._infer_executor is None:
+            self._infer_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="sensevoice-infer",
+                initializer=_init_infer_thread
+            )
+        return self._infer_executor
+
     async def load_model(self, model_name: Optional[str] = None) -> None:
         """
         加载 SenseVoice 模型 (线程安全)
@@ -182,7 +277,7 @@ class SenseVoiceTranscriber:
 
                 loop = asyncio.get_running_loop()
                 self.model = await loop.run_in_executor(
-                    None,
+                    self._get_infer_executor(),
                     self._load_model_sync
                 )
                 self._model_loaded = True
@@ -258,6 +353,9 @@ class SenseVoiceTranscriber:
             except Exception as e:
                 logger.warning(f"模型移至 GPU 失败: {e}，继续使用 CPU")
 
+        if self.device == "cpu" and self.compute_type in _CPU_INT8_COMPUTE_TYPES:
+            self._quantize_model_int8()
+
         load_time = time.time() - start_time
         logger.info(f"SenseVoice 模型加载完成 (耗时 {load_time:.2f} 秒)")
 
@@ -272,13 +370,35 @@ class SenseVoiceTranscriber:
 
         return self.model
 
+    def _quantize_model_int8(self) -> None:
+        """CPU 推理时将 SenseVoice 的 Linear 层动态量化为 int8"""
+        try:
+            self.model.model = torch.ao.quantization.quantize_dynamic(
+                self.model.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("SenseVoice 模型已动态量化为 int8")
+        except Exception as e:
+            logger.warning(f"int8 动态量化失败: {e}，继续使用 FP32")
+
+    def _generate(self, **kwargs) -> Any:
+        """调用 model.generate()，GPU 上按 compute_type 在 autocast 下推理"""
+        autocast_dtype = _CUDA_AUTOCAST_DTYPES.get(self.compute_type) if self.device == "cuda" else None
+        context = (
+            torch.autocast("cuda", dtype=autocast_dtype)
+            if autocast_dtype is not None else contextlib.nullcontext()
+        )
+        with context:
+            return self.model.generate(**kwargs)
+
     async def transcribe_audio(
         self,
         audio_path: str,
         language: Language = Language.AUTO,
         with_timestamps: bool = False,
         temperature: float = 0.0,
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        partial_callback: Optional[Callable[[str], None]] = None,
+        batch_size: Optional[int] = None
     ) -> TranscriptionResult:
         """
         转录音频文件
@@ -289,6 +409,8 @@ class SenseVoiceTranscriber:
             with_timestamps: 是否包含时间戳
             temperature: 采样温度 (SenseVoice 忽略此参数)
             progress_callback: 进度回调函数
+            partial_callback: 部分结果回调，分块转录时每完成一块即以该块文本调用（在推理线程中调用）
+            batch_size: 合批推理的片段数 (SenseVoice 按 batch_size_s 动态合批，忽略此参数)
 
         Returns:
             TranscriptionResult: 转录结果
@@ -314,12 +436,13 @@ class SenseVoiceTranscriber:
             # 执行转录
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                self._get_infer_executor(),
                 self._transcribe_sync,
                 audio_path,
                 lang,
                 with_timestamps,
-                progress_callback
+                progress_callback,
+                partial_callback
             )
 
             if progress_callback:
@@ -346,7 +469,11 @@ class SenseVoiceTranscriber:
         }
         return lang_map.get(language, "auto")
 
-    def _clean_special_tokens(self, text: str) -> str:
+    def _clean_special_tokens(
+        self,
+        text: str,
+        with_index_map: bool = False
+    ) -> Union[str, Tuple[str, List[int]]]:
         """
         清理SenseVoice输出的特殊标记
 
@@ -358,39 +485,64 @@ class SenseVoiceTranscriber:
 
         Args:
             text: 原始文本
+            with_index_map: 是否同时返回原始文本下标到清理后文本下标的映射
+                （长度为 len(text) + 1），用于在整段文本只清理一次后切分各片段
 
         Returns:
-            清理后的文本
+            清理后的文本；with_index_map 为 True 时返回 (清理后的文本, 下标映射)
         """
-        import re
-
         if not text or not self.clean_special_tokens:
+            if with_index_map:
+                return text, list(range(len(text) + 1))
             return text
 
-        # 定义所有需要清理的特殊标记模式
-        # 格式: <|标记内容|>
-        patterns = [
-            # 语言标记
-            r'<\|(zh|en|ja|ko|yue|nospeech)\|>',
-            # 情感标记
-            r'<\|(NEUTRAL|HAPPY|SAD|ANGRY|EMO_UNKNOWN)\|>',
-            # 事件标记
-            r'<\|(Speech|Music|BGM)\|>',
-            # 其他可能的特殊标记（通用模式）
-            r'<\|[A-Za-z_]+\|>',
-        ]
-
-        cleaned_text = text
-        for pattern in patterns:
-            cleaned_text = re.sub(pattern, '', cleaned_text)
-
-        # 清理多余的空白字符
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-        cleaned_text = cleaned_text.strip()
+        if '<|' not in text:
+            # 快速路径：不含特殊标记时只需折叠空白，str.split 在 C 层完成扫描
+            cleaned_text = " ".join(text.split())
+            if cleaned_text == text:
+                if with_index_map:
+                    return text, list(range(len(text) + 1))
+                return text
+            if not with_index_map:
+                logger.info(f"特殊标记已清理: 原始长度={len(text)}, 清理后长度={len(cleaned_text)}")
+                return cleaned_text
+
+        if not with_index_map:
+            cleaned_text = _SPECIAL_TOKEN_RUN_PATTERN.sub(
+                lambda match: _special_token_run_replacement(match.group()), text
+            ).strip()
+        else:
+            parts = []
+            index_map: List[int] = []
+            pos = 0
+            out_len = 0
+            for match in _SPECIAL_TOKEN_RUN_PATTERN.finditer(text):
+                start, end = match.span()
+                kept = text[pos:start]
+                replacement = _special_token_run_replacement(match.group())
+                parts.append(kept)
+                parts.append(replacement)
+                index_map.extend(range(out_len, out_len + len(kept)))
+                out_len += len(kept)
+                # 被替换片段内的所有位置都映射到替换文本的起点
+                index_map.extend([out_len] * (end - start))
+                out_len += len(replacement)
+                pos = end
+            kept = text[pos:]
+            parts.append(kept)
+            index_map.extend(range(out_len, out_len + len(kept) + 1))
+
+            joined = "".join(parts)
+            cleaned_text = joined.strip()
+            lead = len(joined) - len(joined.lstrip())
+            limit = len(cleaned_text)
+            index_map = [min(max(i - lead, 0), limit) for i in index_map]
 
         if cleaned_text != text:
             logger.info(f"特殊标记已清理: 原始长度={len(text)}, 清理后长度={len(cleaned_text)}")
 
+        if with_index_map:
+            return cleaned_text, index_map
         return cleaned_text
 
     async def _load_punctuation_model(self) -> None:
@@ -405,7 +557,7 @@ class SenseVoiceTranscriber:
             logger.info("正在加载标点符号模型...")
             loop = asyncio.get_running_loop()
             self.punctuation_model = await loop.run_in_executor(
-                None,
+                self._get_infer_executor(),
                 self._load_punctuation_sync
             )
             self._punctuation_loaded = True
@@ -532,6 +684,24 @@ class SenseVoiceTranscriber:
             logger.error(traceback.format_exc())
             return text
 
+    def _add_punctuation_cached(self, text: str, lang: str = "zh") -> str:
+        """
+        为片段添加标点符号，短片段复用缓存结果
+
+        长录音中 SenseVoice 经常重复输出相同的短片段（语气词、填充词），
+        逐个调用标点模型代价较高，短文本按 (文本, 语言) 缓存。
+
+        Args:
+            text: 片段文本
+            lang: 语言代码
+
+        Returns:
+            添加标点符号后的文本
+        """
+        if len(text) >= _PUNCTUATION_CACHE_MAX_TEXT_LENGTH:
+            return self._add_punctuation(text, lang)
+        return self._punctuation_cache(text, lang)
+
     def _extract_punctuation_text(self, result) -> str:
         """从标点符号模型结果中提取文本"""
         try:
@@ -572,8 +742,8 @@ class SenseVoiceTranscriber:
             return str(result)
         except Exception as e:
             logger.warning(f"提取标点符号文本失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            # 由 loguru 在确实输出 DEBUG 时才格式化堆栈
+            logger.opt(exception=True).debug("提取标点符号文本异常堆栈")
             return ""
 
     def _transcribe_sync(
@@ -581,7 +751,8 @@ class SenseVoiceTranscriber:
         audio_path: str,
         language: str,
         with_timestamps: bool,
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> TranscriptionResult:
         """同步执行转录"""
         import time
@@ -595,11 +766,11 @@ class SenseVoiceTranscriber:
                 raise Exception("模型未加载，请先调用load_model()")
 
             # 验证音频文件
-            import os
-            if not os.path.exists(audio_path):
+            try:
+                file_size = os.stat(audio_path).st_size
+            except FileNotFoundError:
                 raise Exception(f"音频文件不存在: {audio_path}")
 
-            file_size = os.path.getsize(audio_path)
             if file_size == 0:
                 raise Exception(f"音频文件为空: {audio_path}")
 
@@ -626,37 +797,25 @@ class SenseVoiceTranscriber:
                                f"将启用分块处理（每块 {self.chunk_duration_seconds}s）")
                     # 使用同步分块处理方法
                     return self._transcribe_with_chunking_sync(
-                        audio_path, language_str, with_timestamps, progress_callback, start_time
+                        audio_path, language_str, with_timestamps, progress_callback, start_time,
+                        partial_callback
                     )
                 else:
                     logger.info(f"音频时长 {audio_duration:.1f}s 不需要分块处理")
             # ========== 音频分块处理结束 ==========
 
-            # SenseVoice 推理参数
-            # 使用较小的 batch_size_s 适配 8GB 显存
-            rec_config_kwargs = {
-                "batch_size_s": 60,   # 每段60秒，避免 OOM
-                "merge_vad": True,    # 合并 vad
-                "merge_length_s": 5,  # 合并长度
-                "device": self.device, # 确保使用正确的设备
-            }
-
-            # 语言检测参数
-            if language_str != "auto":
-                rec_config_kwargs["language"] = language_str
-            else:
-                rec_config_kwargs["language"] = "auto"  # 自动检测语言
-
             # 执行推理
             logger.info("正在执行 SenseVoice 推理...")
             logger.info(f"推理参数: batch_size_s=60, merge_vad=True, merge_length_s=5, language={language_str}")
             inference_start = time.time()
 
             try:
-                result = self.model.generate(
+                result = self._generate(
                     input=audio_path,
                     cache_path=self.model_cache_dir,
-                    **rec_config_kwargs
+                    device=self.device,      # 确保使用正确的设备
+                    language=language_str,   # "auto" 表示自动检测语言
+                    **_REC_CONFIG_KWARGS
                 )
             except Exception as inference_error:
                 logger.error(f"SenseVoice model.generate() 抛出异常: {type(inference_error).__name__}: {inference_error}")
@@ -807,12 +966,24 @@ class SenseVoiceTranscriber:
                 progress_callback(80)
 
             # 提取转录文本和时间戳
-            text = ""
+            # 原始文本分段收集后一次性拼接，并记录每个片段在整段文本中的位置，
+            # 以便后处理时只对整段文本清理一次，再按位置切回各片段
+            text_parts: List[str] = []
+            seg_spans: List[Tuple[int, int]] = []
+            raw_len = 0
             segments = []
             detected_lang = language_str if language_str != "auto" else "zh"
 
             logger.info(f"处理 SenseVoice 结果，共 {len(first_result)} 个片段")
 
+            def append_text(part: str) -> Tuple[int, int]:
+                """追加原始文本，返回其去除首尾空白后在整段文本中的 (起, 止) 下标"""
+                nonlocal raw_len
+                span_start = raw_len + len(part) - len(part.lstrip())
+                text_parts.append(part)
+                raw_len += len(part)
+                return span_start, span_start + len(part.strip())
+
             try:
                 # SenseVoice 返回格式可能是多种格式，需要灵活处理
                 # 格式1: 字符串列表 ["句子1", "句子2"]
@@ -834,7 +1005,7 @@ class SenseVoiceTranscriber:
                         # 如果没有 sentence 键，直接将整个字典转换为字符串
                         sentence = str(first_result)
 
-                    text += sentence
+                    span = append_text(sentence)
 
                     # 获取时间戳
                     start_time = 0.0
@@ -856,12 +1027,8 @@ class SenseVoiceTranscriber:
                     if end_time <= start_time:
                         end_time = start_time + 0.001
 
-                    segments.append(TranscriptionSegment(
-                        start_time=start_time,
-                        end_time=end_time,
-                        text=sentence.strip(),
-                        confidence=0.95
-                    ))
+                    segments.append(_build_segment(start_time, end_time, sentence.strip()))
+                    seg_spans.append(span)
 
                 # 如果是列表或元组
                 elif isinstance(first_result, (list, tuple)):
@@ -880,19 +1047,17 @@ class SenseVoiceTranscriber:
                                 try:
                                     clean_text = str(sentence).strip()
                                     if clean_text:
-                                        text += clean_text
-                                        segments.append(TranscriptionSegment(
-                                            start_time=0.0,
-                                            end_time=0.0,
-                                            text=clean_text,
-                                            confidence=0.95
-                                        ))
+                                        span = append_text(clean_text)
+                                        segments.append(_build_segment(0.0, 0.0, clean_text))
+                                        seg_spans.append(span)
                                 except Exception as e:
                                     logger.warning(f"处理字符串片段失败: {e}")
 
                         # 如果是字典列表
                         elif isinstance(first_element, dict):
                             logger.info("处理字典列表")
+                            # 拿到第一个确定的（非 auto）语言后不再逐条查找
+                            lang_locked = False
                             for item in first_result:
                                 try:
                                     # 获取句子文本
@@ -902,7 +1067,7 @@ class SenseVoiceTranscriber:
                                     if not sentence:
                                         sentence = str(item)
 
-                                    text += sentence
+                                    span = append_text(sentence)
 
                                     # 获取时间戳
                                     start_time = 0.0
@@ -916,21 +1081,18 @@ class SenseVoiceTranscriber:
                                             pass
 
                                     # 获取语言
-                                    item_lang = item.get("language", detected_lang)
-                                    if item_lang:
-                                        detected_lang = item_lang
+                                    if not lang_locked:
+                                        item_lang = item.get("language")
+                                        if item_lang:
+                                            detected_lang = item_lang
+                                            lang_locked = item_lang != "auto"
 
-                                    segments.append(TranscriptionSegment(
-                                        start_time=start_time,
-                                        end_time=end_time,
-                                        text=sentence.strip(),
-                                        confidence=0.95
-                                    ))
+                                    segments.append(_build_segment(start_time, end_time, sentence.strip()))
+                                    seg_spans.append(span)
 
                                 except Exception as e:
                                     logger.warning(f"处理字典片段失败: {e}")
-                                    import traceback
-                                    logger.debug(traceback.format_exc())
+                                    logger.opt(exception=True).debug("处理字典片段异常堆栈")
 
                         else:
                             logger.warning(f"未知的列表元素类型: {type(first_element)}")
@@ -939,52 +1101,40 @@ class SenseVoiceTranscriber:
                                 try:
                                     item_text = str(item).strip()
                                     if item_text:
-                                        text += item_text
-                                        segments.append(TranscriptionSegment(
-                                            start_time=0.0,
-                                            end_time=0.0,
-                                            text=item_text,
-                                            confidence=0.95
-                                        ))
+                                        span = append_text(item_text)
+                                        segments.append(_build_segment(0.0, 0.0, item_text))
+                                        seg_spans.append(span)
                                 except Exception as e:
                                     logger.warning(f"处理片段失败: {e}")
                 else:
                     logger.warning(f"未知的 first_result 类型: {type(first_result)}")
                     # 尝试直接转换为字符串
-                    text = str(first_result)
-                    segments.append(TranscriptionSegment(
-                        start_time=0.0,
-                        end_time=0.0,
-                        text=text,
-                        confidence=0.95
-                    ))
+                    raw_text = str(first_result)
+                    span = append_text(raw_text)
+                    segments.append(_build_segment(0.0, 0.0, raw_text))
+                    seg_spans.append(span)
 
             except Exception as e:
                 logger.error(f"处理 SenseVoice 结果时出错: {e}")
                 import traceback
                 logger.error(f"堆栈跟踪:\n{traceback.format_exc()}")
 
+            text = "".join(text_parts)
+
             # 计算整体置信度
-            try:
-                if segments:
-                    avg_confidence = sum(seg.confidence for seg in segments) / len(segments)
-                    confidence = avg_confidence
-                else:
-                    confidence = 0.95  # 默认置信度
-            except Exception as e:
-                logger.warning(f"计算置信度时出错: {e}")
-                confidence = 0.95
+            # SenseVoice 不输出片段级置信度，所有片段均使用固定值，平均值即为该常量
+            confidence = _SEGMENT_CONFIDENCE
 
             processing_time = time.time() - start_time
             logger.info(f"转录完成，文本长度: {len(text)}, 片段数: {len(segments)}")
 
             # 文本后处理
             if text:
-                # 步骤1: 清理特殊标记
-                text = self._clean_special_tokens(text)
-                # 更新segments中的文本
-                for seg in segments:
-                    seg.text = self._clean_special_tokens(seg.text)
+                # 步骤1: 清理特殊标记（整段文本只清理一次，按下标映射切回各片段）
+                if self.clean_special_tokens:
+                    text, index_map = self._clean_special_tokens(text, with_index_map=True)
+                    for seg, (raw_start, raw_end) in zip(segments, seg_spans):
+                        seg.text = text[index_map[raw_start]:index_map[raw_end]].strip()
 
                 # 步骤2: 添加标点符号
                 if self.enable_punctuation:
@@ -997,7 +1147,7 @@ class SenseVoiceTranscriber:
                             # 更新segments中的文本
                             for seg in segments:
                                 if seg.text:
-                                    seg.text = self._add_punctuation(seg.text, detected_lang)
+                                    seg.text = self._add_punctuation_cached(seg.text, detected_lang)
                         else:
                             logger.info("标点符号处理无变化")
                     except Exception as e:
@@ -1038,7 +1188,8 @@ class SenseVoiceTranscriber:
         language: str,
         with_timestamps: bool,
         progress_callback: Optional[Callable[[float], None]],
-        start_time: float
+        start_time: float,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> TranscriptionResult:
         """
         使用分块处理转录长音频（同步版本）
@@ -1049,80 +1200,104 @@ class SenseVoiceTranscriber:
             with_timestamps: 是否包含时间戳
             progress_callback: 进度回调
             start_time: 开始时间
+            partial_callback: 每块转录完成后以该块文本调用
 
         Returns:
             TranscriptionResult: 转录结果
         """
         import time
         import os
-        import asyncio
 
         try:
-            # 分割音频 - 同步调用
-            logger.info("开始分割音频...")
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                chunks = loop.run_until_complete(self.audio_chunker.split_audio(
-                    audio_path,
-                    temp_dir=self.model_cache_dir
-                ))
-            finally:
-                loop.close()
-
-            if not chunks:
+            # 规划分块，随后由生产者线程逐块分割，当前线程边分割边推理
+            total_duration = self.audio_chunker.get_audio_duration(audio_path)
+            total_chunks = len(self.audio_chunker.plan_chunks(total_duration))
+            if total_chunks == 0:
                 raise Exception("音频分割失败，未生成任何块")
 
-            logger.info(f"音频已分割为 {len(chunks)} 个块")
+            logger.info(f"开始分割音频: 总时长 {total_duration:.1f} 秒，共 {total_chunks} 个块（分割与转录并行）")
+
+            chunk_queue: "queue.Queue" = queue.Queue(maxsize=_CHUNK_QUEUE_SIZE)
+            stop_event = threading.Event()
+            producer = threading.Thread(
+                target=self._produce_chunks,
+                args=(audio_path, total_duration, chunk_queue, stop_event),
+                name="sensevoice-chunker",
+                daemon=True
+            )
+            producer.start()
 
             # 处理每个块
             chunk_results = []
-            total_chunks = len(chunks)
-
-            for i, (chunk_path, chunk_start, chunk_end) in enumerate(chunks):
-                try:
-                    logger.info(f"处理块 {i+1}/{total_chunks}: {chunk_start:.1f}s - {chunk_end:.1f}s")
-
-                    # 更新进度
-                    if progress_callback:
-                        progress = 20 + (60 * (i + 1) / total_chunks)
-                        progress_callback(progress)
-
-                    # 处理单个块 - 同步调用
-                    chunk_result = self._transcribe_single_chunk_sync(
-                        chunk_path, language, with_timestamps, chunk_start, chunk_end
-                    )
-                    chunk_results.append(chunk_result)
+            chunk_paths = []
 
-                    # 记录每个块的文本长度
-                    chunk_text = chunk_result.get("text", "")
-                    logger.info(f"块 {i+1} 转录完成: 文本长度 {len(chunk_text)} 字符")
+            try:
+                i = 0
+                while True:
+                    item = chunk_queue.get()
+                    if item is _CHUNKS_DONE:
+                        break
+                    if isinstance(item, Exception):
+                        if chunk_paths:
+                            raise item
+                        # 尚未产出任何块时与 split_audio 一致，回退为整段处理
+                        logger.error(f"音频分割失败: {item}，回退为整段处理")
+                        item = (audio_path, 0.0, total_duration, None)
+                        total_chunks = 1
+
+                    chunk_path, chunk_start, chunk_end, chunk_samples = item
+                    chunk_paths.append(chunk_path)
 
-                    # 释放 GPU 内存
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
+                    try:
+                        logger.info(f"处理块 {i+1}/{total_chunks}: {chunk_start:.1f}s - {chunk_end:.1f}s")
+
+                        # 更新进度
+                        if progress_callback:
+                            progress = 20 + (60 * (i + 1) / total_chunks)
+                            progress_callback(progress)
+
+                        # 处理单个块 - 同步调用
+                        chunk_result = self._transcribe_single_chunk_sync(
+                            chunk_path, language, with_timestamps, chunk_start, chunk_end,
+                            samples=chunk_samples
+                        )
+                        chunk_results.append(chunk_result)
+
+                        # 记录每个块的文本长度
+                        chunk_text = chunk_result.get("text", "")
+                        logger.info(f"块 {i+1} 转录完成: 文本长度 {len(chunk_text)} 字符")
+                        if partial_callback and chunk_text:
+                            partial_callback(chunk_text)
 
-                except Exception as e:
-                    logger.error(f"处理块 {i+1} 失败: {e}")
-                    # 继续处理下一个块，不中断整个流程
-                    chunk_results.append({
-                        "text": "",
-                        "segments": [],
-                        "language": language,
-                        "confidence": 0.0,
-                        "processing_time": 0.0,
-                        "start_time": chunk_start,
-                        "end_time": chunk_end
-                    })
-
-            # 清理临时文件 - 同步调用
-            chunk_paths = [chunk[0] for chunk in chunks]
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.audio_chunker.cleanup_chunks(chunk_paths))
+                    except Exception as e:
+                        logger.error(f"处理块 {i+1} 失败: {e}")
+                        # 继续处理下一个块，不中断整个流程
+                        chunk_results.append({
+                            "text": "",
+                            "segments": [],
+                            "language": language,
+                            "confidence": 0.0,
+                            "processing_time": 0.0,
+                            "start_time": chunk_start,
+                            "end_time": chunk_end
+                        })
+
+                    i += 1
             finally:
-                loop.close()
+                # 停止生产者，并回收已分割但未转录的块
+                stop_event.set()
+                producer.join()
+                while not chunk_queue.empty():
+                    item = chunk_queue.get_nowait()
+                    if isinstance(item, tuple):
+                        chunk_paths.append(item[0])
+
+                # 清理临时文件 - 后台线程删除，不占用返回结果的关键路径
+                self.audio_chunker.cleanup_chunks_in_background(chunk_paths)
+
+                # 全部块处理完后统一释放 GPU 缓存，缓存分配器在块之间复用显存
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
 
             # 合并结果
             logger.info("合并分块转录结果...")
@@ -1135,9 +1310,7 @@ class SenseVoiceTranscriber:
             final_text = merged_result.get("text", "")
 
             if final_text:
-                # 清理特殊标记
-                final_text = self._clean_special_tokens(final_text)
-
+                # 特殊标记已在各块转录时清理
                 # 添加标点符号（如果启用）
                 if self.enable_punctuation:
                     try:
@@ -1164,13 +1337,64 @@ class SenseVoiceTranscriber:
             logger.error(f"堆栈跟踪:\n{traceback.format_exc()}")
             raise Exception(f"分块转录失败: {str(e)}")
 
+    def _produce_chunks(
+        self,
+        audio_path: str,
+        total_duration: float,
+        chunk_queue: "queue.Queue",
+        stop_event: threading.Event
+    ) -> None:
+        """
+        分块生产者（在独立线程中运行）
+
+        逐块调用 ffmpeg 分割音频，并预先把块文件解码为采样数组，每准备好一块
+        就放入队列，读盘与解码因此和上一块的推理重叠进行；分割异常会作为队列
+        元素传给消费者，最后放入结束标记。消费者设置 stop_event 后提前退出，
+        未能交付的块文件由生产者自行删除。
+
+        Args:
+            audio_path: 音频文件路径
+            total_duration: 音频总时长（秒）
+            chunk_queue: 块队列
+            stop_event: 停止信号
+        """
+        def put(item) -> bool:
+            while not stop_event.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for chunk in self.audio_chunker.iter_chunks(
+                audio_path,
+                temp_dir=self.model_cache_dir,
+                total_duration=total_duration
+            ):
+                try:
+                    samples = self.audio_chunker.load_chunk_samples(chunk[0])
+                except Exception as e:
+                    # 预读失败时交给 funasr 按文件路径读取
+                    logger.debug(f"预读音频块失败 {chunk[0]}: {e}")
+                    samples = None
+                if not put((*chunk, samples)):
+                    Path(chunk[0]).unlink(missing_ok=True)
+                    return
+        except Exception as e:
+            if not put(e):
+                return
+        put(_CHUNKS_DONE)
+
     def _transcribe_single_chunk_sync(
         self,
         chunk_path: str,
         language: str,
         with_timestamps: bool,
         chunk_start: float,
-        chunk_end: float
+        chunk_end: float,
+        samples: Optional[np.ndarray] = None
     ) -> dict:
         """
         转录单个音频块（同步版本）
@@ -1181,6 +1405,7 @@ class SenseVoiceTranscriber:
             with_timestamps: 是否包含时间戳
             chunk_start: 块开始时间
             chunk_end: 块结束时间
+            samples: 已预读的 16kHz 采样，提供时直接送入模型，不再读取文件
 
         Returns:
             dict: 转录结果
@@ -1190,37 +1415,29 @@ class SenseVoiceTranscriber:
         try:
             start = time.time()
 
-            # 验证文件
-            if not os.path.exists(chunk_path):
-                raise Exception(f"音频块文件不存在: {chunk_path}")
-
-            file_size = os.path.getsize(chunk_path)
-            logger.debug(f"处理音频块: {chunk_path}, 大小: {file_size} 字节")
-
-            # SenseVoice 推理参数
-            rec_config_kwargs = {
-                "batch_size_s": 60,   # 每段60秒，避免 OOM
-                "merge_vad": True,
-                "merge_length_s": 5,
-                "device": self.device,  # 确保使用正确的设备
-            }
+            if samples is None:
+                # 验证文件
+                if not os.path.exists(chunk_path):
+                    raise Exception(f"音频块文件不存在: {chunk_path}")
 
-            if language != "auto":
-                rec_config_kwargs["language"] = language
+                file_size = os.path.getsize(chunk_path)
+                logger.debug(f"处理音频块: {chunk_path}, 大小: {file_size} 字节")
             else:
-                rec_config_kwargs["language"] = "auto"
+                logger.debug(f"处理音频块: {chunk_path}, 已预读 {len(samples)} 个采样")
 
             # 执行推理
-            result = self.model.generate(
-                input=chunk_path,
+            result = self._generate(
+                input=chunk_path if samples is None else samples,
                 cache_path=self.model_cache_dir,
-                **rec_config_kwargs
+                device=self.device,  # 确保使用正确的设备
+                language=language,
+                **_CHUNK_REC_CONFIG_KWARGS
             )
 
             processing_time = time.time() - start
 
-            # 提取文本
-            text = self._extract_text_from_result(result)
+            # 提取文本，并在合并前逐块清理特殊标记
+            text = self._clean_special_tokens(self._extract_text_from_result(result))
 
             return {
                 "text": text,
@@ -1261,57 +1478,110 @@ class SenseVoiceTranscriber:
         import os
 
         try:
-            # 分割音频
-            logger.info("开始分割音频...")
-            chunks = await self.audio_chunker.split_audio(
+            # 规划分块，生产者任务逐块分割，消费者边分割边推理
+            total_duration = self.audio_chunker.get_audio_duration(audio_path)
+            total_chunks = len(self.audio_chunker.plan_chunks(total_duration))
+            if total_chunks == 0:
+                raise Exception("音频分割失败，未生成任何块")
+
+            logger.info(f"开始分割音频: 总时长 {total_duration:.1f} 秒，共 {total_chunks} 个块（分割与转录并行）")
+
+            chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=_CHUNK_QUEUE_SIZE)
+            loop = asyncio.get_running_loop()
+            chunk_iter = self.audio_chunker.iter_chunks(
                 audio_path,
-                temp_dir=self.model_cache_dir
+                temp_dir=self.model_cache_dir,
+                total_duration=total_duration
             )
+            # 生产者写出的全部块文件，以及线程池中正在进行的分割
+            split_paths: List[str] = []
+            pending_split: Optional[asyncio.Future] = None
 
-            if not chunks:
-                raise Exception("音频分割失败，未生成任何块")
+            async def produce() -> None:
+                nonlocal pending_split
+                try:
+                    while True:
+                        # ffmpeg 分割为阻塞调用，放到线程池执行；取消生产者不会中断
+                        # 正在进行的分割，shield 保留其结果供消费者回收
+                        pending_split = loop.run_in_executor(None, next, chunk_iter, _CHUNKS_DONE)
+                        chunk = await asyncio.shield(pending_split)
+                        pending_split = None
+                        if chunk is _CHUNKS_DONE:
+                            break
+                        split_paths.append(chunk[0])
+                        # 与同步路径的队列项保持一致：(路径, 起点, 终点, 预读采样)，此处不预读
+                        await chunk_queue.put((*chunk, None))
+                except Exception as e:
+                    await chunk_queue.put(e)
+                await chunk_queue.put(_CHUNKS_DONE)
 
-            logger.info(f"音频已分割为 {len(chunks)} 个块")
+            producer = asyncio.ensure_future(produce())
 
             # 处理每个块
             chunk_results = []
-            total_chunks = len(chunks)
+            chunk_paths = []
 
-            for i, (chunk_path, chunk_start, chunk_end) in enumerate(chunks):
-                try:
-                    logger.info(f"处理块 {i+1}/{total_chunks}: {chunk_start:.1f}s - {chunk_end:.1f}s")
+            try:
+                i = 0
+                while True:
+                    item = await chunk_queue.get()
+                    if item is _CHUNKS_DONE:
+                        break
+                    if isinstance(item, Exception):
+                        if chunk_paths:
+                            raise item
+                        # 尚未产出任何块时与 split_audio 一致，回退为整段处理
+                        logger.error(f"音频分割失败: {item}，回退为整段处理")
+                        item = (audio_path, 0.0, total_duration, None)
+                        total_chunks = 1
+
+                    chunk_path, chunk_start, chunk_end, chunk_samples = item
+                    chunk_paths.append(chunk_path)
 
-                    # 更新进度
-                    if progress_callback:
-                        progress = 20 + (60 * (i + 1) / total_chunks)
-                        progress_callback(progress)
+                    try:
+                        logger.info(f"处理块 {i+1}/{total_chunks}: {chunk_start:.1f}s - {chunk_end:.1f}s")
 
-                    # 处理单个块
-                    chunk_result = await self._transcribe_single_chunk(
-                        chunk_path, language, with_timestamps, chunk_start, chunk_end
-                    )
-                    chunk_results.append(chunk_result)
+                        # 更新进度
+                        if progress_callback:
+                            progress = 20 + (60 * (i + 1) / total_chunks)
+                            progress_callback(progress)
 
-                    # 释放 GPU 内存
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
+                        # 处理单个块
+                        chunk_result = await self._transcribe_single_chunk(
+                            chunk_path, language, with_timestamps, chunk_start, chunk_end
+                        )
+                        chunk_results.append(chunk_result)
 
-                except Exception as e:
-                    logger.error(f"处理块 {i+1} 失败: {e}")
-                    # 继续处理下一个块，不中断整个流程
-                    chunk_results.append({
-                        "text": "",
-                        "segments": [],
-                        "language": language,
-                        "confidence": 0.0,
-                        "processing_time": 0.0,
-                        "start_time": chunk_start,
-                        "end_time": chunk_end
-                    })
-
-            # 清理临时文件
-            chunk_paths = [chunk[0] for chunk in chunks]
-            await self.audio_chunker.cleanup_chunks(chunk_paths)
+                    except Exception as e:
+                        logger.error(f"处理块 {i+1} 失败: {e}")
+                        # 继续处理下一个块，不中断整个流程
+                        chunk_results.append({
+                            "text": "",
+                            "segments": [],
+                            "language": language,
+                            "confidence": 0.0,
+                            "processing_time": 0.0,
+                            "start_time": chunk_start,
+                            "end_time": chunk_end
+                        })
+
+                    i += 1
+            finally:
+                # 停止生产者：等线程池中未完成的分割结束并登记其写出的块，再关闭分割生成器
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+                if pending_split is not None:
+                    chunk = (await asyncio.gather(pending_split, return_exceptions=True))[0]
+                    if isinstance(chunk, tuple):
+                        split_paths.append(chunk[0])
+                chunk_iter.close()
+
+                # 清理临时文件（包括已分割但未转录的块） - 后台线程删除，不占用返回结果的关键路径
+                self.audio_chunker.cleanup_chunks_in_background(split_paths)
+
+                # 全部块处理完后统一释放 GPU 缓存，缓存分配器在块之间复用显存
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
 
             # 合并结果
             logger.info("合并分块转录结果...")
@@ -1324,9 +1594,7 @@ class SenseVoiceTranscriber:
             final_text = merged_result.get("text", "")
 
             if final_text:
-                # 清理特殊标记
-                final_text = self._clean_special_tokens(final_text)
-
+                # 特殊标记已在各块转录时清理
                 # 添加标点符号（如果启用）
                 if self.enable_punctuation:
                     try:
@@ -1386,30 +1654,19 @@ class SenseVoiceTranscriber:
             file_size = os.path.getsize(chunk_path)
             logger.debug(f"处理音频块: {chunk_path}, 大小: {file_size} 字节")
 
-            # SenseVoice 推理参数
-            rec_config_kwargs = {
-                "batch_size_s": 60,   # 每段60秒，避免 OOM
-                "merge_vad": True,
-                "merge_length_s": 5,
-                "device": self.device,  # 确保使用正确的设备
-            }
-
-            if language != "auto":
-                rec_config_kwargs["language"] = language
-            else:
-                rec_config_kwargs["language"] = "auto"
-
             # 执行推理
-            result = self.model.generate(
+            result = self._generate(
                 input=chunk_path,
                 cache_path=self.model_cache_dir,
-                **rec_config_kwargs
+                device=self.device,  # 确保使用正确的设备
+                language=language,
+                **_CHUNK_REC_CONFIG_KWARGS
             )
 
             processing_time = time.time() - start
 
-            # 提取文本
-            text = self._extract_text_from_result(result)
+            # 提取文本，并在合并前逐块清理特殊标记
+            text = self._clean_special_tokens(self._extract_text_from_result(result))
 
             return {
                 "text": text,
@@ -1438,6 +1695,16 @@ class SenseVoiceTranscriber:
         text = ""
 
         try:
+            # 快速路径：funasr 的常见返回格式 [{"key": ..., "text": ...}]
+            if type(result) is list and result:
+                first_result = result[0]
+                if type(first_result) is dict and first_result:
+                    return (
+                        first_result.get("sentence", "")
+                        or first_result.get("text", "")
+                        or str(first_result)
+                    )
+
             # 检查结果是否为空
             if result is None:
                 return ""
@@ -1487,14 +1754,13 @@ class SenseVoiceTranscriber:
                 if not text:
                     text = str(first_result)
             elif isinstance(first_result, (list, tuple)):
-                for item in first_result:
-                    if isinstance(item, str):
-                        text += item
-                    elif isinstance(item, dict):
-                        sentence = item.get("sentence", "")
-                        if not sentence:
-                            sentence = item.get("text", "")
-                        text += sentence
+                # 只拼接文本，不构建片段、不解析时间戳和语言
+                text = "".join(
+                    item if isinstance(item, str)
+                    else (item.get("sentence", "") or item.get("text", ""))
+                    for item in first_result
+                    if isinstance(item, (str, dict))
+                )
             else:
                 text = str(first_result)
 
@@ -1515,6 +1781,22 @@ class SenseVoiceTranscriber:
             "cache_dir": self.model_cache_dir
         }
 
+    async def warmup(self) -> None:
+        """加载模型并用一秒静音推理一次，预热 CUDA 上下文与内核"""
+        await self.load_model()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._get_infer_executor(),
+            functools.partial(
+                self._generate,
+                input=np.zeros(16000, dtype=np.float32),
+                cache_path=self.model_cache_dir,
+                device=self.device,
+                language="auto",
+                **_CHUNK_REC_CONFIG_KWARGS
+            )
+        )
+
     async def unload_model(self) -> None:
         """卸载模型以释放内存"""
         with self.model_lock:
@@ -1529,6 +1811,13 @@ class SenseVoiceTranscriber:
 
                 logger.info("SenseVoice 模型已卸载")
 
+            self._punctuation_cache.cache_clear()
+
+            # 关闭推理执行器，下次加载模型时重建
+            if self._infer_executor is not None:
+                self._infer_executor.shutdown(wait=False)
+                self._infer_executor = None
+
 
 def create_sensevoice_transcriber(
     model_name: str = "sensevoice-small",
@@ -1540,7 +1829,8 @@ def create_sensevoice_transcriber(
     enable_chunking: bool = True,
     chunk_duration_seconds: int = 300,
     chunk_overlap_seconds: int = 2,
-    min_duration_for_chunking: int = 600
+    min_duration_for_chunking: int = 600,
+    compute_type: Optional[str] = None
 ) -> SenseVoiceTranscriber:
     """
     创建 SenseVoice 转录器实例
@@ -1556,6 +1846,7 @@ def create_sensevoice_transcriber(
         chunk_duration_seconds: 每块时长（秒），默认180秒（3分钟）
         chunk_overlap_seconds: 块之间重叠时间（秒），默认2秒
         min_duration_for_chunking: 超过此时长（秒）才启用分块，默认300秒（5分钟）
+        compute_type: 计算精度，None 则保持 FP32
 
     Returns:
         SenseVoiceTranscriber: SenseVoice 转录器实例
@@ -1570,7 +1861,8 @@ def create_sensevoice_transcriber(
         enable_chunking=enable_chunking,
         chunk_duration_seconds=chunk_duration_seconds,
         chunk_overlap_seconds=chunk_overlap_seconds,
-        min_duration_for_chunking=min_duration_for_chunking
+        min_duration_for_chunking=min_duration_for_chunking,
+        compute_type=compute_type
     )
 
 
@@ -5,62 +5,256 @@
 新项目应使用 SenseVoice 转录器 (core.sensevoice_transcriber)。
 """
 
+import gc
 import os
+import sys
 import time
+import atexit
 import asyncio
+import hashlib
+import weakref
+import functools
 import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable, Union
+from typing import Optional, Dict, Any, List, Callable, Tuple, Union
 
 import torch
-import whisper
 import numpy as np
 from loguru import logger
 
+# openai-whisper 后端，只使用 faster-whisper 时可不安装
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+# 可选的 CTranslate2 后端 (faster-whisper)，可用时优先使用
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# 可选的 ONNX Runtime 后端 (optimum)，需显式指定 backend="onnx"
+try:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import AutoProcessor, pipeline as hf_pipeline
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# onnxruntime-gpu 编译了 TensorRT 时，ONNX 后端在 CUDA 上改用 TensorRT FP16 引擎
+TENSORRT_AVAILABLE = ONNX_AVAILABLE and "TensorrtExecutionProvider" in ort.get_available_providers()
+
 from models.schemas import (
     TranscriptionResult, TranscriptionSegment, TranscriptionModel,
     Language, OutputFormat
 )
+from utils.audio import get_audio_chunker
 from utils.common import retry_on_exception
+from utils.output_formatter import format_output, format_timestamps
+
+# Whisper 模型的输入规格，与 whisper.audio 中的常量一致
+_SAMPLE_RATE = 16000
+_N_SAMPLES = 30 * _SAMPLE_RATE
+
+# GPU 工作线程的线程局部状态（专用 CUDA 流）
+_gpu_thread_state = threading.local()
+
+# 解码音频缓存的容量上限（字节），约 35 分钟 16kHz float32 音频
+_AUDIO_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# VAD 判定为静音所需的最短时长（毫秒），openai 与 faster-whisper 后端一致
+_VAD_MIN_SILENCE_MS = 500
+
+# 页锁定中转缓冲区的容量上限（字节），约 17 分钟 16kHz float32 音频，更长的音频直接拷贝
+_PINNED_STAGING_MAX_BYTES = 64 * 1024 * 1024
+
+# 进程内共享的已加载模型 (弱引用)，键为 (模型名, 设备, 计算精度)，最后一个持有者卸载后即释放
+_shared_models: Dict[Tuple[str, str, str], "weakref.ReferenceType[Any]"] = {}
+_shared_models_lock = threading.Lock()
+
+
+def _load_audio(audio_path: str) -> np.ndarray:
+    """解码为 16kHz 单声道 float32 采样：优先用 openai-whisper (ffmpeg)，未安装时用 faster-whisper (PyAV)"""
+    if WHISPER_AVAILABLE:
+        return whisper.load_audio(audio_path)
+    return decode_audio(audio_path, sampling_rate=_SAMPLE_RATE)
+
+
+def _init_gpu_thread(device: str, device_index: int = 0) -> None:
+    """GPU 工作线程初始化：绑定设备并创建该线程专用的 CUDA 流"""
+    if device == "cuda":
+        torch.cuda.set_device(device_index)
+        _gpu_thread_state.stream = torch.cuda.Stream()
+
+
+def _release_gpu_memory() -> None:
+    """转录器被回收后归还 CUDA 缓存 (解释器退出时 torch 可能已被清理，需先检查)"""
+    torch_module = sys.modules.get("torch")
+    if torch_module is None:
+        return
+    try:
+        if torch_module.cuda.is_available():
+            torch_module.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+def _logprobs_to_confidence_array(logprobs: np.ndarray) -> np.ndarray:
+    """
+    按分段线性规则把 avg_logprob 数组转换为 0-1 范围的置信度 (向量化)
+
+    Args:
+        logprobs: avg_logprob 数组
+
+    Returns:
+        np.ndarray: 置信度数组
+    """
+    # 限制 logprob 范围避免极端值
+    logprobs = np.clip(logprobs, -10.0, 0.0)
+
+    confidences = np.select(
+        [logprobs >= -1.0, logprobs >= -2.0, logprobs >= -3.0, logprobs >= -5.0],
+        [
+            1.0 - (logprobs + 0.5) * 0.1,    # 优秀: 0.85-1.0
+            0.85 - (logprobs + 1.0) * 0.1,   # 良好: 0.75-0.85
+            0.75 - (logprobs + 2.0) * 0.15,  # 一般: 0.60-0.75
+            0.60 - (logprobs + 3.0) * 0.15,  # 较差: 0.30-0.60
+        ],
+        # 很差: 0.0-0.30
+        default=np.maximum(0.0, 0.30 - (logprobs + 5.0) * 0.1)
+    )
+    return np.clip(confidences, 0.0, 1.0)
+
+
+def _run_on_gpu_stream(func: Callable, *args) -> Any:
+    """在当前工作线程的专用 CUDA 流上执行任务（CPU 上直接执行）"""
+    stream = getattr(_gpu_thread_state, "stream", None)
+    if stream is None:
+        return func(*args)
+    with torch.cuda.stream(stream):
+        result = func(*args)
+    stream.synchronize()
+    return result
 
 
 class SpeechTranscriber:
     """语音转录器 (已弃用 - 基于OpenAI Whisper)"""
 
+    # 支持的推理后端
+    BACKENDS = ("faster_whisper", "openai", "onnx")
+
     def __init__(
         self,
         model_name: TranscriptionModel = TranscriptionModel.SENSEVOICE_SMALL,
-        device: Optional[str] = None,
-        model_cache_dir: Optional[str] = None
+        device: Optional[Union[str, List[int]]] = None,
+        model_cache_dir: Optional[str] = None,
+        compile_model: bool = True,
+        backend: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        vad_filter: bool = True,
+        audio_cache_dir: Optional[str] = None
     ):
         """
         初始化转录器
 
         Args:
             model_name: Whisper模型名称
-            device: 计算设备 ('cpu', 'cuda', 'auto')
+            device: 计算设备 ('cpu', 'cuda', 'auto')，或 GPU 编号列表 (如 [0, 1])，
+                列表中的每张 GPU 各加载一个模型副本，批量转录时分担文件
             model_cache_dir: 模型缓存目录
+            compile_model: 是否在 CUDA 上用 torch.compile 编译模型 (仅 openai 后端)
+            backend: 推理后端 ('faster_whisper', 'openai', 'onnx')，None 则自动选择
+            compute_type: 计算精度 ('int8', 'int8_float16', 'float16', 'float32')，None 则按设备自动选择
+            vad_filter: 是否在解码前用 VAD 跳过静音区域
+            audio_cache_dir: 已解码音频的磁盘缓存目录，重复转录同一文件时跳过 ffmpeg 解码，
+                None 则只在内存中缓存
         """
         self.model_name = model_name
         self.model_cache_dir = model_cache_dir or "./models_cache"
-
-        # 确保缓存目录存在
-        Path(self.model_cache_dir).mkdir(parents=True, exist_ok=True)
-
-        # 设置设备
-        self.device = self._determine_device(device)
-        logger.info(f"使用设备: {self.device}")
+        self.compile_model = compile_model
+        self.compute_type = compute_type
+        self.vad_filter = vad_filter
+        self.audio_cache_dir = audio_cache_dir
+
+        # 设置设备；传入 GPU 编号列表时，第一张 GPU 由本实例使用，其余各建一个副本。
+        # 实际设备在首次访问 self.device 时才确定，构造实例不会探测 CUDA
+        self._device_indices = [0]
+        if isinstance(device, (list, tuple)):
+            self._device_indices = [int(index) for index in device] or [0]
+            device = "cuda"
+        self._requested_device = device
+        self._device: Optional[str] = None
+
+        # 其余 GPU 上的转录器副本，首次批量转录时创建
+        self._replicas: Optional[List["SpeechTranscriber"]] = None
+
+        # 推理后端: faster_whisper (CTranslate2) 或 openai (参考实现)
+        self.backend = self._determine_backend(backend)
+        logger.info(f"使用推理后端: {self.backend}")
 
         # 模型实例和加载锁
         self.model = None
         self.model_lock = threading.Lock()
         self._model_loaded = False
+        self._batched_pipeline = None
+
+        # 专用的单线程 GPU 执行器，按提交顺序串行执行模型任务
+        self._gpu_executor: Optional[ThreadPoolExecutor] = None
+
+        # Silero VAD (openai 后端使用，faster_whisper 自带 VAD)
+        self._vad = None
+
+        # openai 后端是否以 FP16 权重推理
+        self._fp16 = False
+
+        # 音频拷入显存用的页锁定中转缓冲区 (只在 GPU 执行器线程中使用)，及其最近一次拷贝的完成事件
+        self._pinned_staging: Optional[torch.Tensor] = None
+        self._staging_copied: Optional["torch.cuda.Event"] = None
+
+        # 已解码音频的 LRU 缓存，键为 (路径, 修改时间, 文件大小)
+        self._audio_cache: "OrderedDict[Tuple[str, float, int], np.ndarray]" = OrderedDict()
+        self._audio_cache_bytes = 0
+        self._audio_cache_lock = threading.Lock()
+
+        # 实例被回收后归还 CUDA 缓存；显式释放请使用 unload_model 或 async with
+        self._finalizer = weakref.finalize(self, _release_gpu_memory)
         
         # 支持的模型信息
         self.model_info = {
-            TranscriptionModel.SENSEVOICE_SMALL: {"size": "244MB", "speed": "4x", "accuracy": "★★★★☆", "description": "多语言语音识别，中文优化"}
+            TranscriptionModel.SENSEVOICE_SMALL: {"size": "244MB", "speed": "4x", "accuracy": "★★★★☆", "description": "多语言语音识别，中文优化"},
+            TranscriptionModel.LARGE_V3_TURBO: {"size": "809MB", "speed": "8x", "accuracy": "★★★★☆", "description": "Whisper 精简解码器，多语言快速转录"}
         }
     
+    @property
+    def device(self) -> str:
+        """计算设备 ('cpu' 或 'cuda')，首次访问时确定"""
+        if self._device is None:
+            self._device = self._determine_device(self._requested_device)
+            logger.info(f"使用设备: {self._torch_device}")
+        return self._device
+
+    @property
+    def device_index(self) -> int:
+        """本实例使用的 GPU 编号"""
+        return self._device_indices[0] if self.device == "cuda" else 0
+
+    @property
+    def _torch_device(self) -> str:
+        """PyTorch 设备字符串，如 'cuda:1'"""
+        return f"cuda:{self.device_index}" if self.device == "cuda" else self.device
+
+    @property
+    def _replica_device_indices(self) -> List[int]:
+        """需要创建副本的其余 GPU 编号"""
+        return self._device_indices[1:] if self.device == "cuda" else []
+
     def _determine_device(self, device: Optional[str]) -> str:
         """确定计算设备"""
         if device == "auto" or device is None:
@@ -75,6 +269,57 @@ class SpeechTranscriber:
             device = "cpu"
         
         return device
+
+    def _determine_backend(self, backend: Optional[str]) -> str:
+        """确定推理后端"""
+        if backend is None or backend == "auto":
+            backend = "faster_whisper" if FASTER_WHISPER_AVAILABLE else "openai"
+        elif backend not in self.BACKENDS:
+            raise ValueError(f"不支持的推理后端: {backend}，可选: {', '.join(self.BACKENDS)}")
+        elif backend == "faster_whisper" and not FASTER_WHISPER_AVAILABLE:
+            logger.warning("指定使用 faster_whisper 但未安装，回退到 openai")
+            backend = "openai"
+        elif backend == "onnx" and not ONNX_AVAILABLE:
+            logger.warning("指定使用 onnx 但未安装 optimum[onnxruntime]，自动选择后端")
+            return self._determine_backend(None)
+
+        if backend == "openai" and not WHISPER_AVAILABLE:
+            raise ImportError("未安装可用的 Whisper 后端，请安装 faster-whisper 或 openai-whisper")
+        return backend
+
+    def _get_gpu_executor(self) -> ThreadPoolExecutor:
+        """获取 GPU 执行器（卸载模型后按需重建）"""
+        if self._gpu_executor is None:
+            self._gpu_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"whisper-gpu{self.device_index}",
+                initializer=_init_gpu_thread,
+                initargs=(self.device, self.device_index)
+            )
+        return self._gpu_executor
+
+    def _select_compute_type(self) -> str:
+        """
+        选择计算精度
+
+        Returns:
+            str: 指定了 compute_type 时直接使用；否则有 Tensor Core 的 GPU 用 int8_float16，
+                 更早的 GPU 用 float16，CPU 用 int8
+        """
+        if self.compute_type:
+            return self.compute_type
+        if self.device == "cuda":
+            major, _ = torch.cuda.get_device_capability(self.device_index)
+            return "int8_float16" if major >= 7 else "float16"
+        return "int8"
+
+    def _loaded_device(self, model: Any) -> str:
+        """获取已加载模型所在的设备"""
+        if self.backend == "faster_whisper":
+            return str(model.model.device)
+        if self.backend == "onnx":
+            return self.device
+        return str(model.device)
     
     async def load_model(self, model_name: Optional[TranscriptionModel] = None) -> None:
         """
@@ -86,33 +331,90 @@ class SpeechTranscriber:
         if model_name:
             self.model_name = model_name
 
-        with self.model_lock:
-            # 检查模型是否已加载且匹配
-            if self._model_loaded and self.model is not None:
-                if str(self.model.device).startswith(self.device):
-                    logger.info(f"模型 {self.model_name} 已加载")
-                    return
+        # 检查模型是否已加载且匹配
+        model = self.model
+        if self._model_loaded and model is not None:
+            if self._loaded_device(model).startswith(self.device):
+                logger.info(f"模型 {self.model_name} 已加载")
+                return
 
-            try:
-                logger.info(f"正在加载Whisper模型: {self.model_name}")
+        try:
+            # 在单线程 GPU 执行器中加载，并发的加载请求在其中排队，不会重复加载
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                self._get_gpu_executor(),
+                _run_on_gpu_stream,
+                self._load_model_if_needed
+            )
 
-                # 在线程池中加载模型，避免阻塞
-                loop = asyncio.get_running_loop()
-                self.model = await loop.run_in_executor(
-                    None,
-                    self._load_model_sync
-                )
-                self._model_loaded = True
+        except Exception as e:
+            logger.error(f"模型加载失败: {e}")
+            raise RuntimeError(f"Whisper模型加载失败: {e}") from e
+
+    def _load_model_if_needed(self) -> None:
+        """在 GPU 执行器中加载模型，只在替换模型引用时持有锁"""
+        if self._model_loaded and self.model is not None:
+            return
+
+        logger.info(f"正在加载Whisper模型: {self.model_name}")
+        key = self._shared_model_key()
+        model = None
+        if key is not None:
+            with _shared_models_lock:
+                ref = _shared_models.get(key)
+                model = ref() if ref is not None else None
+
+        if model is not None:
+            logger.info("复用其他转录器已加载的同一模型")
+            self._record_compute_type(key[2])
+        else:
+            model = self._load_model_sync()
+            if key is not None:
+                with _shared_models_lock:
+                    _shared_models[key] = weakref.ref(model)
 
-                logger.info(f"模型加载完成: {self.model_name}")
+        with self.model_lock:
+            self.model = model
+            self._model_loaded = True
 
-            except Exception as e:
-                logger.error(f"模型加载失败: {e}")
-                raise Exception(f"Whisper模型加载失败: {str(e)}")
+        logger.info(f"模型加载完成: {self.model_name}")
     
-    def _load_model_sync(self) -> whisper.Whisper:
+    def _shared_model_key(self) -> Optional[Tuple[str, str, str]]:
+        """
+        获取可在转录器实例间共享的模型键
+
+        只有 faster_whisper 后端共享：CTranslate2 模型支持多线程并发调用；openai 后端
+        转录时会在模型上挂 KV cache 钩子，不能被多个 GPU 线程同时使用。
+
+        Returns:
+            Optional[Tuple[str, str, str]]: (模型名, 设备, 计算精度)，不可共享时为 None
+        """
+        if self.backend != "faster_whisper":
+            return None
+        return (self.model_name.value, self._torch_device, self._select_compute_type())
+
+    def _load_model_sync(self) -> Union["whisper.Whisper", "WhisperModel"]:
         """同步加载模型"""
-        import time
+        # 首次真正需要缓存目录时才创建
+        Path(self.model_cache_dir).mkdir(parents=True, exist_ok=True)
+
+        if self.backend == "faster_whisper":
+            compute_type = self._select_compute_type()
+            start_time = time.time()
+            logger.info(f"开始加载模型 {self.model_name.value} 到 {self._torch_device} (faster-whisper, {compute_type})...")
+            model = WhisperModel(
+                self.model_name.value,
+                device=self.device,
+                device_index=self.device_index,
+                compute_type=compute_type,
+                download_root=self.model_cache_dir
+            )
+            self._record_compute_type(compute_type)
+            logger.info(f"模型加载完成 (耗时 {time.time() - start_time:.2f} 秒)")
+            return model
+
+        if self.backend == "onnx":
+            return self._load_model_sync_onnx()
 
         # 设置模型下载路径
         os.environ['WHISPER_CACHE_DIR'] = self.model_cache_dir
@@ -146,18 +448,260 @@ class SpeechTranscriber:
 
         start_time = time.time()
 
-        # 加载模型
-        logger.info(f"开始加载模型 {self.model_name.value} 到 {self.device}...")
+        if self.device == "cuda":
+            self._enable_expandable_segments()
+            # 编码器输入固定为 [1, n_mels, 3000]，让 cuDNN 为卷积测出最快算法
+            torch.backends.cudnn.benchmark = True
+
+        # 加载模型：权重先反序列化到 CPU，再整体移到目标设备。直接按 device 加载时
+        # torch.load 会先在显存中建立检查点副本，加载期间显存占用约为模型的两倍
+        logger.info(f"开始加载模型 {self.model_name.value} 到 {self._torch_device}...")
         model = whisper.load_model(
             self.model_name.value,
-            device=self.device,
+            device="cpu",
             download_root=self.model_cache_dir
         )
 
+        # 有 Tensor Core 的 GPU 直接用 FP16 权重，省去每层把 FP32 权重转换为 FP16 的开销；
+        # 在 CPU 上先转换，拷贝到显存的数据量减半。显式指定 compute_type 时以其为准
+        self._fp16 = False
+        if self.device == "cuda":
+            if self.compute_type:
+                self._fp16 = self.compute_type != "float32"
+            else:
+                self._fp16 = torch.cuda.get_device_capability(self.device_index)[0] >= 7
+        if self._fp16:
+            model = model.half()
+        if self.device == "cuda":
+            model = model.to(self._torch_device)
+            # 释放 CPU 上的检查点与权重
+            gc.collect()
+
         load_time = time.time() - start_time
         logger.info(f"模型加载完成 (耗时 {load_time:.2f} 秒)")
 
+        self._record_compute_type("float16" if self._fp16 else "float32")
+        if self.device == "cpu" and self._select_compute_type() == "int8":
+            model = self._quantize_model(model)
+
+        # 新版 openai-whisper 的注意力走 SDPA，由 PyTorch 按设备选用 FlashAttention 等融合内核
+        if self.device == "cuda" and not getattr(whisper.model.MultiHeadAttention, "use_sdpa", False):
+            logger.warning("当前 openai-whisper 版本的注意力未使用 SDPA 融合内核，建议升级到 20240927 及以上")
+
+        if self.compile_model and self.device == "cuda":
+            self._compile_model(model)
+
+        if self.vad_filter and self._vad is None:
+            self._load_vad()
+
         return model
+
+    def _enable_expandable_segments(self) -> None:
+        """
+        让 CUDA 缓存分配器按需扩展内存段
+
+        解码器的 KV 缓存每步增长，默认分配器会为不同长度的张量切出大小不一的块，
+        长时间批量转录后显存碎片化；可扩展段使增长的张量复用同一段地址空间。
+        用户已通过 PYTORCH_CUDA_ALLOC_CONF 配置分配器时不做修改。
+        """
+        if os.environ.get("PYTORCH_CUDA_ALLOC_CONF"):
+            return
+        try:
+            torch.cuda.memory._set_allocator_settings("expandable_segments:True")
+        except Exception as e:
+            logger.debug(f"当前 PyTorch 不支持可扩展显存段: {e}")
+
+    def _load_vad(self) -> None:
+        """加载 Silero VAD，失败时关闭 VAD 过滤"""
+        try:
+            torch.hub.set_dir(os.path.join(self.model_cache_dir, "torch_hub"))
+            vad_model, vad_utils = torch.hub.load(
+                "snakers4/silero-vad", "silero_vad", trust_repo=True
+            )
+            # vad_utils[0] 为 get_speech_timestamps
+            self._vad = (vad_model, vad_utils[0])
+            logger.info("Silero VAD 加载完成")
+        except Exception as e:
+            logger.warning(f"Silero VAD 加载失败，不跳过静音: {e}")
+            self.vad_filter = False
+
+    def _remove_silence(self, audio: np.ndarray) -> Tuple[np.ndarray, List[Tuple[float, float, float]]]:
+        """
+        用 VAD 去掉静音，只保留语音区域并拼接
+
+        Args:
+            audio: 16kHz 单声道采样
+
+        Returns:
+            Tuple: (拼接后的语音采样, [(拼接后起点秒, 原始起点秒, 时长秒), ...])
+        """
+        vad_model, get_speech_timestamps = self._vad
+        speech_timestamps = get_speech_timestamps(
+            torch.from_numpy(audio),
+            vad_model,
+            sampling_rate=_SAMPLE_RATE,
+            min_silence_duration_ms=_VAD_MIN_SILENCE_MS
+        )
+        if not speech_timestamps:
+            return audio[:0], []
+
+        sample_rate = _SAMPLE_RATE
+        speech_map = []
+        position = 0
+        for ts in speech_timestamps:
+            length = ts["end"] - ts["start"]
+            speech_map.append((position / sample_rate, ts["start"] / sample_rate, length / sample_rate))
+            position += length
+
+        speech = np.concatenate([audio[ts["start"]:ts["end"]] for ts in speech_timestamps])
+        logger.debug(f"VAD 保留语音 {position / sample_rate:.1f}s / {len(audio) / sample_rate:.1f}s")
+        return speech, speech_map
+
+    def _restore_timeline(
+        self,
+        whisper_result: Dict[str, Any],
+        speech_map: List[Tuple[float, float, float]]
+    ) -> None:
+        """
+        把去静音后的片段时间映射回原始音频时间轴（原地修改）
+
+        Args:
+            whisper_result: Whisper 结果
+            speech_map: _remove_silence 返回的语音区域映射
+        """
+        trimmed_starts = [region[0] for region in speech_map]
+
+        def to_original(t: float, is_end: bool) -> float:
+            # 恰好落在区域边界上的结束时间归入前一个区域
+            find = bisect_left if is_end else bisect_right
+            trimmed_start, original_start, _ = speech_map[max(0, find(trimmed_starts, t) - 1)]
+            return t - trimmed_start + original_start
+
+        for segment in whisper_result.get("segments", []):
+            segment["start"] = to_original(segment["start"], False)
+            segment["end"] = to_original(segment["end"], True)
+            for word in segment.get("words") or []:
+                word["start"] = to_original(word["start"], False)
+                word["end"] = to_original(word["end"], True)
+
+    def _load_model_sync_onnx(self) -> Any:
+        """
+        加载 ONNX Runtime 版本的 Whisper（首次使用时从 PyTorch 权重导出）
+
+        CUDA 上启用 IO Binding，编码器输出与解码器 KV cache 常驻显存，
+        解码各步之间不再往返拷贝。导出的 ONNX 模型保存在 model_cache_dir/onnx 下，
+        之后加载直接复用，不再重复导出。onnxruntime 支持 TensorRT 时在 CUDA 上
+        使用 TensorRT FP16 引擎，构建好的引擎缓存在 model_cache_dir/trt 下。
+
+        Returns:
+            Any: transformers 语音识别 pipeline
+        """
+        model_id = self.model_name.value
+        if "/" not in model_id:
+            model_id = f"openai/whisper-{model_id}"
+
+        use_cuda = self.device == "cuda"
+        start_time = time.time()
+        logger.info(f"开始加载模型 {model_id} 到 {self._torch_device} (ONNX Runtime)...")
+
+        onnx_dir = Path(self.model_cache_dir) / "onnx" / model_id.replace("/", "--")
+        exported = (onnx_dir / "config.json").exists()
+        if not exported:
+            logger.info(f"首次使用，正在导出 ONNX 模型到 {onnx_dir}...")
+
+        provider = "CPUExecutionProvider"
+        provider_options = None
+        if use_cuda:
+            provider = "CUDAExecutionProvider"
+            provider_options = {"device_id": self.device_index}
+        if use_cuda and TENSORRT_AVAILABLE:
+            provider = "TensorrtExecutionProvider"
+            provider_options.update({
+                "trt_fp16_enable": True,
+                "trt_engine_cache_enable": True,
+                "trt_engine_cache_path": str(Path(self.model_cache_dir) / "trt" / model_id.replace("/", "--"))
+            })
+
+        ort_model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            str(onnx_dir) if exported else model_id,
+            export=not exported,
+            provider=provider,
+            provider_options=provider_options,
+            use_io_binding=use_cuda,
+            cache_dir=self.model_cache_dir
+        )
+        if not exported:
+            ort_model.save_pretrained(onnx_dir)
+        processor = AutoProcessor.from_pretrained(model_id, cache_dir=self.model_cache_dir)
+        model = hf_pipeline(
+            "automatic-speech-recognition",
+            model=ort_model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30
+        )
+
+        self._record_compute_type("float16" if provider == "TensorrtExecutionProvider" else "float32")
+        logger.info(f"模型加载完成 (耗时 {time.time() - start_time:.2f} 秒, {provider})")
+        return model
+
+    def _quantize_model(self, model: "whisper.Whisper") -> "whisper.Whisper":
+        """
+        对 CPU 上的 Whisper 模型做 int8 动态量化（仅线性层）
+
+        Args:
+            model: 已加载的 Whisper 模型
+
+        Returns:
+            whisper.Whisper: 量化后的模型，失败时返回原模型
+        """
+        try:
+            # whisper 的 Linear 子类只在 forward 中做 dtype 转换，CPU FP32 下与 nn.Linear 等价；
+            # quantize_dynamic 按精确类型匹配，需先还原为 nn.Linear 才会被量化
+            for module in model.modules():
+                if isinstance(module, torch.nn.Linear):
+                    module.__class__ = torch.nn.Linear
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            self._record_compute_type("int8")
+            logger.info("已对模型线性层做 int8 动态量化")
+        except Exception as e:
+            logger.warning(f"int8 量化失败，使用 FP32 模型: {e}")
+        return model
+
+    def _record_compute_type(self, compute_type: str) -> None:
+        """在模型信息中记录实际使用的计算精度"""
+        self.model_info.setdefault(self.model_name, {})["compute_type"] = compute_type
+
+    def _compile_model(self, model: "whisper.Whisper") -> None:
+        """
+        用 torch.compile 编译编码器和解码器，并用 30 秒静音预热
+
+        编码器输入形状固定，使用 reduce-overhead (CUDA Graphs)；解码器的序列长度
+        逐 token 变化，使用默认模式并直接按动态形状编译，避免预热后遇到新长度时
+        在用户请求中重新编译。编译在加载阶段完成，首次转录不再承担编译延迟。
+        编译失败时保持 eager 模式。
+
+        Args:
+            model: 已加载的 Whisper 模型
+        """
+        try:
+            start_time = time.time()
+            logger.info("正在编译 Whisper 模型 (torch.compile)...")
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+            model.decoder = torch.compile(model.decoder, fullgraph=False, dynamic=True)
+
+            # 预热与正式转录同在 inference_mode 下，编译结果的守卫条件一致，不会再次编译
+            silence = np.zeros(_N_SAMPLES, dtype=np.float32)
+            with torch.inference_mode():
+                model.transcribe(silence, language="en", temperature=0.0, verbose=None, fp16=self._fp16)
+
+            logger.info(f"模型编译预热完成 (耗时 {time.time() - start_time:.2f} 秒)")
+        except Exception as e:
+            logger.warning(f"torch.compile 编译失败，使用 eager 模式: {e}")
+            model.encoder = getattr(model.encoder, "_orig_mod", model.encoder)
+            model.decoder = getattr(model.decoder, "_orig_mod", model.decoder)
     
     async def transcribe_audio(
         self,
@@ -165,7 +709,10 @@ class SpeechTranscriber:
         language: Language = Language.AUTO,
         with_timestamps: bool = False,
         temperature: float = 0.0,
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        batch_size: Optional[int] = None,
+        audio: Optional[np.ndarray] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> TranscriptionResult:
         """
         转录音频文件
@@ -176,6 +723,10 @@ class SpeechTranscriber:
             with_timestamps: 是否包含时间戳
             temperature: 采样温度
             progress_callback: 进度回调函数
+            batch_size: 合批推理的片段数，仅 faster_whisper 后端有效，None 则逐段解码
+            audio: 已解码的 16kHz 单声道采样，提供时不再读取音频文件
+            partial_callback: 部分结果回调，faster_whisper 后端每解码出一个片段即以其文本调用
+                （在 GPU 线程中调用）；其他后端不逐段回调
             
         Returns:
             TranscriptionResult: 转录结果
@@ -203,6 +754,9 @@ class SpeechTranscriber:
             # 如果需要时间戳，启用word_timestamps
             if with_timestamps:
                 transcribe_options["word_timestamps"] = True
+
+            if batch_size and self.backend == "faster_whisper":
+                transcribe_options["batch_size"] = batch_size
             
             # 执行转录
             if progress_callback:
@@ -210,11 +764,14 @@ class SpeechTranscriber:
 
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                self._get_gpu_executor(),
+                _run_on_gpu_stream,
                 self._transcribe_sync,
                 audio_path,
                 transcribe_options,
-                progress_callback
+                progress_callback,
+                audio,
+                partial_callback
             )
             
             if progress_callback:
@@ -233,13 +790,15 @@ class SpeechTranscriber:
             
         except Exception as e:
             logger.error(f"音频转录失败: {e}")
-            raise Exception(f"音频转录失败: {str(e)}")
+            raise RuntimeError(f"音频转录失败: {e}") from e
     
     def _transcribe_sync(
         self, 
         audio_path: str, 
         options: Dict[str, Any],
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        audio: Optional[np.ndarray] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """同步执行转录"""
         try:
@@ -247,10 +806,7 @@ class SpeechTranscriber:
             if progress_callback:
                 progress_callback(20)
             
-            if self.model is None:
-                raise Exception("模型未加载，请先调用load_model()")
-            
-            result = self.model.transcribe(audio_path, **options)
+            result = self._run_transcribe_with_oom_recovery(audio_path, options, audio, partial_callback)
             
             if progress_callback:
                 progress_callback(80)
@@ -261,6 +817,253 @@ class SpeechTranscriber:
             logger.error(f"Whisper转录失败: {e}")
             raise
     
+    def _load_audio_cached(self, audio_path: str) -> np.ndarray:
+        """
+        解码音频为 16kHz 单声道采样，同一文件未变化时复用上次的解码结果
+
+        Args:
+            audio_path: 音频文件路径
+
+        Returns:
+            np.ndarray: float32 采样
+        """
+        stat = os.stat(audio_path)
+        key = (os.path.abspath(audio_path), stat.st_mtime, stat.st_size)
+
+        with self._audio_cache_lock:
+            audio = self._audio_cache.get(key)
+            if audio is not None:
+                self._audio_cache.move_to_end(key)
+                return audio
+
+        audio = self._decode_audio(audio_path, key)
+        if audio.nbytes > _AUDIO_CACHE_MAX_BYTES:
+            return audio
+
+        with self._audio_cache_lock:
+            if key not in self._audio_cache:
+                self._audio_cache[key] = audio
+                self._audio_cache_bytes += audio.nbytes
+            while self._audio_cache_bytes > _AUDIO_CACHE_MAX_BYTES:
+                _, evicted = self._audio_cache.popitem(last=False)
+                self._audio_cache_bytes -= evicted.nbytes
+        return audio
+
+    def _decode_audio(self, audio_path: str, key: Tuple[str, float, int]) -> np.ndarray:
+        """
+        解码音频；配置了 audio_cache_dir 时先查磁盘缓存
+
+        whisper 经 ffmpeg 解码出的是 16 位 PCM，缓存按 int16 保存，无精度损失且体积只有 float32 的一半。
+        缓存文件名由 (路径, 修改时间, 文件大小) 哈希得到，源文件变化后自然失效。
+        """
+        if not self.audio_cache_dir:
+            return _load_audio(audio_path)
+
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        cache_file = Path(self.audio_cache_dir) / f"{digest}.npy"
+        try:
+            return np.load(cache_file).astype(np.float32) / 32768.0
+        except (OSError, ValueError):
+            pass
+
+        audio = _load_audio(audio_path)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # 先写临时文件再替换，并发写入或中途失败都不会留下残缺的缓存
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp.npy")
+            np.save(tmp_file, np.round(audio * 32768.0).astype(np.int16))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"写入音频解码缓存失败: {e}")
+        return audio
+
+    def _load_audio_for_model(
+        self,
+        audio_path: str,
+        audio: Optional[Union[np.ndarray, torch.Tensor]] = None
+    ) -> Union[str, np.ndarray, torch.Tensor]:
+        """
+        为 openai 后端准备输入音频
+
+        在 CUDA 上先把整段音频一次性拷到显存，whisper 随之在 GPU 上计算整段
+        梅尔频谱，后续每个 30 秒窗口不再单独分配并拷贝到设备。
+
+        Args:
+            audio_path: 音频文件路径
+            audio: 已解码的采样 (可以已在显存中)，None 则按需读取文件
+
+        Returns:
+            Union[str, np.ndarray, torch.Tensor]: CPU 上返回原路径或采样，CUDA 上返回显存中的采样
+        """
+        if isinstance(audio, torch.Tensor):
+            return audio
+        if self.device != "cuda":
+            return audio_path if audio is None else audio
+        if audio is None:
+            audio = _load_audio(audio_path)
+        if audio.nbytes > _PINNED_STAGING_MAX_BYTES:
+            return torch.from_numpy(audio).to(self._torch_device)
+
+        # 经复用的页锁定缓冲区中转，拷贝在当前 CUDA 流上异步排队，不阻塞本线程；
+        # 写入缓冲区前先等上一次拷贝完成
+        if self._staging_copied is not None:
+            self._staging_copied.synchronize()
+        staging = self._pinned_staging
+        if staging is None or staging.numel() < len(audio):
+            staging = self._pinned_staging = torch.empty(len(audio), dtype=torch.float32, pin_memory=True)
+        staging = staging[:len(audio)]
+        staging.numpy()[:] = audio
+
+        device_audio = staging.to(self._torch_device, non_blocking=True)
+        self._staging_copied = torch.cuda.Event()
+        self._staging_copied.record()
+        return device_audio
+
+    def _run_transcribe(
+        self,
+        audio_path: str,
+        options: Dict[str, Any],
+        audio: Optional[np.ndarray] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        按当前后端执行一次转录，统一返回 openai-whisper 格式的结果字典
+
+        Args:
+            audio_path: 音频文件路径
+            options: openai-whisper 风格的转录选项
+            audio: 已解码的 16kHz 单声道采样，None 则读取音频文件
+            partial_callback: 每解码出一个片段即以其文本调用 (仅 faster_whisper 后端)
+
+        Returns:
+            Dict[str, Any]: 含 text / language / segments 的结果
+        """
+        # 只读取一次模型引用，卸载模型不会影响进行中的转录
+        model = self.model
+        if model is None:
+            raise Exception("模型未加载，请先调用load_model()")
+
+        # 统一解码一次，各后端都直接使用采样
+        if audio is None:
+            audio = self._load_audio_cached(audio_path)
+
+        if self.backend == "onnx":
+            return self._run_transcribe_onnx(model, audio_path, options, audio)
+
+        if self.backend != "faster_whisper":
+            speech_map = None
+            if self.vad_filter and self._vad is not None and isinstance(audio, np.ndarray):
+                audio, speech_map = self._remove_silence(audio)
+                if not speech_map:
+                    logger.info("VAD 未检测到语音")
+                    return {
+                        "text": "",
+                        "segments": [],
+                        "language": options.get("language") or "unknown",
+                        "no_speech_prob": 1.0
+                    }
+
+            # inference_mode 省去 autograd 的版本计数与视图追踪
+            with torch.inference_mode():
+                result = model.transcribe(
+                    self._load_audio_for_model(audio_path, audio), fp16=self._fp16, **options
+                )
+            if speech_map:
+                self._restore_timeline(result, speech_map)
+            return result
+
+        transcribe_kwargs = {
+            "language": options.get("language"),
+            "task": options.get("task", "transcribe"),
+            "temperature": options.get("temperature", 0.0),
+            # 结果只保留片段级时间，不请求词级时间戳，省去 CTranslate2 的词对齐计算
+            "vad_filter": self.vad_filter,
+            "beam_size": 1,
+        }
+        if self.vad_filter:
+            transcribe_kwargs["vad_parameters"] = {"min_silence_duration_ms": _VAD_MIN_SILENCE_MS}
+
+        batch_size = options.get("batch_size")
+        if batch_size:
+            # VAD 切出的片段按 batch_size 合批，一次前向处理多个片段
+            batched_pipeline = self._batched_pipeline
+            if batched_pipeline is None or batched_pipeline.model is not model:
+                batched_pipeline = self._batched_pipeline = BatchedInferencePipeline(model=model)
+            segments_gen, info = batched_pipeline.transcribe(
+                audio, batch_size=batch_size, **transcribe_kwargs
+            )
+        else:
+            segments_gen, info = model.transcribe(audio, **transcribe_kwargs)
+
+        # 生成器在迭代时才真正解码，每得到一个片段即可回调部分结果
+        segments = []
+        for segment in segments_gen:
+            segments.append({
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "no_speech_prob": segment.no_speech_prob
+            })
+            if partial_callback:
+                partial_callback(segment.text)
+
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "language": info.language,
+            "segments": segments,
+            # 无片段时结果处理用 no_speech_prob 估算置信度，全为静音时应为 0
+            "no_speech_prob": 0.0 if segments else 1.0
+        }
+
+    def _run_transcribe_onnx(
+        self,
+        model: Any,
+        audio_path: str,
+        options: Dict[str, Any],
+        audio: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """
+        用 ONNX Runtime pipeline 转录，结果转换为 openai-whisper 格式
+
+        Args:
+            model: ONNX Runtime 语音识别 pipeline
+            audio_path: 音频文件路径
+            options: openai-whisper 风格的转录选项
+            audio: 已解码的 16kHz 单声道采样，None 则读取音频文件
+
+        Returns:
+            Dict[str, Any]: 含 text / language / segments 的结果
+        """
+        if audio is None:
+            audio = _load_audio(audio_path)
+
+        generate_kwargs = {"task": options.get("task", "transcribe")}
+        if options.get("language"):
+            generate_kwargs["language"] = options["language"]
+
+        output = model(
+            {"raw": audio, "sampling_rate": _SAMPLE_RATE},
+            return_timestamps=True,
+            generate_kwargs=generate_kwargs
+        )
+
+        segments = []
+        for chunk in output.get("chunks", []):
+            start, end = chunk["timestamp"]
+            segments.append({
+                "start": start,
+                # 最后一段可能没有结束时间戳
+                "end": end if end is not None else len(audio) / _SAMPLE_RATE,
+                "text": chunk["text"]
+            })
+
+        return {
+            "text": output["text"],
+            "language": options.get("language") or "unknown",
+            "segments": segments
+        }
+
     def _process_transcription_result(
         self,
         whisper_result: Dict[str, Any],
@@ -273,24 +1076,24 @@ class SpeechTranscriber:
             language = whisper_result.get("language", "unknown")
 
             # 处理片段信息
-            segments = []
             whisper_segments = whisper_result.get("segments", [])
 
-            for segment in whisper_segments:
-                # 计算片段置信度 (从logprob转换)
-                segment_logprob = segment.get("avg_logprob", -5.0)
-                segment_confidence = self._logprob_to_confidence(segment_logprob)
+            # 一次性计算所有片段置信度 (从logprob转换)
+            confidences = self._logprobs_to_confidences(whisper_segments)
 
-                segments.append(TranscriptionSegment(
+            segments = [
+                TranscriptionSegment(
                     start_time=float(segment.get("start", 0)),
                     end_time=float(segment.get("end", 0)),
                     text=segment.get("text", "").strip(),
                     confidence=segment_confidence
-                ))
+                )
+                for segment, segment_confidence in zip(whisper_segments, confidences.tolist())
+            ]
 
             # 计算整体置信度 (基于片段的平均置信度)
             if segments:
-                confidence = sum(seg.confidence for seg in segments) / len(segments)
+                confidence = float(confidences.mean())
             else:
                 # 如果没有片段，使用整体结果的no_speech_prob来估算
                 no_speech_prob = whisper_result.get("no_speech_prob", 0.0)
@@ -307,7 +1110,24 @@ class SpeechTranscriber:
 
         except Exception as e:
             logger.error(f"转录结果处理失败: {e}")
-            raise Exception(f"转录结果处理失败: {str(e)}")
+            raise RuntimeError(f"转录结果处理失败: {e}") from e
+
+    def _logprobs_to_confidences(self, whisper_segments: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        批量将片段的 avg_logprob 转换为置信度 (分段规则见 _logprob_to_confidence)
+
+        Args:
+            whisper_segments: Whisper 片段列表
+
+        Returns:
+            np.ndarray: 各片段的置信度
+        """
+        logprobs = np.fromiter(
+            (segment.get("avg_logprob", -5.0) for segment in whisper_segments),
+            dtype=np.float64,
+            count=len(whisper_segments)
+        )
+        return _logprobs_to_confidence_array(logprobs)
 
     def _logprob_to_confidence(self, logprob: float) -> float:
         """
@@ -326,29 +1146,7 @@ class SpeechTranscriber:
         Returns:
             float: 0-1 范围的置信度
         """
-        import math
-
-        # 限制 logprob 范围避免极端值
-        logprob = max(-10.0, min(0.0, logprob))
-
-        # 使用分段函数进行转换
-        if logprob >= -1.0:
-            # 优秀范围: 线性映射到 0.85-1.0
-            confidence = 1.0 - (logprob + 0.5) * 0.1
-        elif logprob >= -2.0:
-            # 良好范围: 线性映射到 0.75-0.85
-            confidence = 0.85 - (logprob + 1.0) * 0.1
-        elif logprob >= -3.0:
-            # 一般范围: 线性映射到 0.60-0.75
-            confidence = 0.75 - (logprob + 2.0) * 0.15
-        elif logprob >= -5.0:
-            # 较差范围: 线性映射到 0.30-0.60
-            confidence = 0.60 - (logprob + 3.0) * 0.15
-        else:
-            # 很差范围: 线性映射到 0.0-0.30
-            confidence = max(0.0, 0.30 - (logprob + 5.0) * 0.1)
-
-        return max(0.0, min(1.0, confidence))
+        return float(_logprobs_to_confidence_array(np.array([logprob], dtype=np.float64))[0])
 
     async def transcribe_audio_with_chunking(
         self,
@@ -365,7 +1163,8 @@ class SpeechTranscriber:
         """
         使用分块处理转录音频文件（适用于长音频）
 
-        分块处理可以避免 Whisper 在长音频上的重复/卡顿问题
+        分块处理可以避免 Whisper 在长音频上的重复/卡顿问题。整段音频只解码一次，
+        各块直接切片采样，不再为每块启动 ffmpeg 写临时文件再重新解码。
 
         Args:
             audio_path: 音频文件路径
@@ -381,8 +1180,6 @@ class SpeechTranscriber:
         Returns:
             TranscriptionResult: 转录结果
         """
-        from utils.audio import get_audio_chunker
-
         start_time = time.time()
 
         # 创建分块器
@@ -406,13 +1203,15 @@ class SpeechTranscriber:
 
         logger.info(f"启用音频分块处理: {audio_path}")
 
-        chunks = []  # 在 try 块外初始化，确保 finally 块可访问
         try:
-            # 分割音频
+            # 解码整段音频并规划分块
             if progress_callback:
                 progress_callback(5)
 
-            chunks = await chunker.split_audio(audio_path)
+            loop = asyncio.get_running_loop()
+            audio = await loop.run_in_executor(None, self._load_audio_cached, audio_path)
+            sample_rate = _SAMPLE_RATE
+            chunks = chunker.plan_chunks(len(audio) / sample_rate)
             total_chunks = len(chunks)
 
             logger.info(f"音频已分割为 {total_chunks} 块")
@@ -424,44 +1223,85 @@ class SpeechTranscriber:
             if self.model is None:
                 await self.load_model()
 
-            # 转录每个块
-            chunk_results = []
-            for i, (chunk_path, start_time, end_time) in enumerate(chunks):
+            # openai 后端在 CUDA 上且不做 VAD 时，整段音频一次拷入显存，各块切片即为显存视图，
+            # 梅尔频谱直接在 GPU 上计算，不再逐块拷贝
+            if self.backend == "openai" and self.device == "cuda" and not (self.vad_filter and self._vad is not None):
+                audio = await loop.run_in_executor(
+                    self._get_gpu_executor(),
+                    _run_on_gpu_stream,
+                    self._load_audio_for_model,
+                    audio_path,
+                    audio
+                )
+
+            # 逐块转录，边转录边合并：片段直接构建为 TranscriptionSegment，不经过中间字典
+            merged_text: List[str] = []
+            merged_segments: List[TranscriptionSegment] = []
+            detected_language = "unknown"
+            confidence_total = 0.0
+            confidence_count = 0
+
+            for i, (chunk_start, chunk_end) in enumerate(chunks):
                 # 计算进度
                 base_progress = 10 + (i / total_chunks) * 80
 
                 if progress_callback:
                     progress_callback(base_progress)
 
-                # 转录当前块
-                chunk_result = await self._transcribe_audio_sync(
-                    chunk_path,
+                # 转录当前块 (切片为视图，不复制采样)
+                whisper_result = await self._transcribe_audio_sync(
+                    audio_path,
                     language,
                     with_timestamps,
-                    temperature
+                    temperature,
+                    audio=audio[int(chunk_start * sample_rate):int(chunk_end * sample_rate)]
                 )
-
-                # 添加时间信息用于合并
-                chunk_result["start_time"] = start_time
-                chunk_result["end_time"] = end_time
-
-                chunk_results.append(chunk_result)
+                chunk_text = whisper_result.get("text", "").strip()
+                chunk_segments = whisper_result.get("segments", [])
+
+                if i == 0:
+                    # 使用第一个块的语言作为总体语言，第一个块全部保留
+                    detected_language = whisper_result.get("language", "unknown")
+                    kept_segments = chunk_segments
+                    if chunk_text:
+                        merged_text.append(chunk_text)
+                elif len(chunk_segments) > 1:
+                    # 跳过可能在重叠区域的第一段
+                    kept_segments = chunk_segments[1:]
+                    merged_text.extend(
+                        text for text in (seg.get("text", "").strip() for seg in kept_segments) if text
+                    )
+                else:
+                    # 只有文本没有可用片段时保留文本，可能有少量重叠重复，但比丢失数据好
+                    kept_segments = []
+                    if chunk_text:
+                        merged_text.append(chunk_text)
+
+                # 块内时间加上块起点即为原始时间轴
+                confidences = self._logprobs_to_confidences(kept_segments).tolist()
+                for seg, confidence in zip(kept_segments, confidences):
+                    merged_segments.append(TranscriptionSegment(
+                        start_time=float(seg.get("start", 0)) + chunk_start,
+                        end_time=float(seg.get("end", 0)) + chunk_start,
+                        text=seg.get("text", "").strip(),
+                        confidence=confidence
+                    ))
+                    if confidence:
+                        confidence_total += confidence
+                        confidence_count += 1
 
                 logger.debug(f"块 {i + 1}/{total_chunks} 转录完成")
 
             if progress_callback:
                 progress_callback(95)
 
-            # 合并结果
-            merged_result = chunker.merge_results(
-                chunk_results,
-                overlap_seconds=chunk_overlap
-            )
-
-            # 转换为 TranscriptionResult
-            result = self._dict_to_transcription_result(
-                merged_result,
-                time.time() - start_time
+            result = TranscriptionResult(
+                text=" ".join(merged_text).strip(),
+                language=detected_language,
+                confidence=confidence_total / confidence_count if confidence_count else 0.5,
+                segments=merged_segments,
+                processing_time=time.time() - start_time,
+                whisper_model=self.model_name
             )
 
             if progress_callback:
@@ -485,46 +1325,16 @@ class SpeechTranscriber:
             except Exception as fallback_error:
                 logger.error(f"普通转录也失败: {fallback_error}")
                 raise
-        finally:
-            # 确保清理临时文件
-            if chunks:
-                try:
-                    await chunker.cleanup_chunks([c[0] for c in chunks])
-                except Exception as cleanup_error:
-                    logger.warning(f"清理临时文件失败: {cleanup_error}")
-
-    def _dict_to_transcription_result(
-        self,
-        result_dict: dict,
-        processing_time: float
-    ) -> TranscriptionResult:
-        """将字典结果转换为 TranscriptionResult 对象"""
-        segments = []
-        for seg in result_dict.get("segments", []):
-            segments.append(TranscriptionSegment(
-                start_time=float(seg.get("start", 0)),
-                end_time=float(seg.get("end", 0)),
-                text=seg.get("text", "").strip(),
-                confidence=float(seg.get("confidence", result_dict.get("confidence", 0.5)))
-            ))
-
-        return TranscriptionResult(
-            text=result_dict.get("text", "").strip(),
-            language=result_dict.get("language", "unknown"),
-            confidence=float(result_dict.get("confidence", 0.5)),
-            segments=segments,
-            processing_time=processing_time,
-            whisper_model=self.model_name
-        )
 
     async def _transcribe_audio_sync(
         self,
         audio_path: str,
         language: Language,
         with_timestamps: bool,
-        temperature: float
+        temperature: float,
+        audio: Optional[np.ndarray] = None
     ) -> dict:
-        """同步转录音频（返回字典格式，带重试机制）"""
+        """同步转录音频（返回 Whisper 格式的结果，带重试机制），audio 为已解码的采样时不再读取文件"""
         # 准备转录选项
         transcribe_options = {
             "language": language.value if language != Language.AUTO else None,
@@ -538,79 +1348,47 @@ class SpeechTranscriber:
             transcribe_options["word_timestamps"] = True
 
         # 使用带重试的转录
-        result = await self._sync_transcribe_with_retry(
+        return await self._sync_transcribe_with_retry(
             audio_path=audio_path,
             options=transcribe_options,
             max_retries=2,
-            retry_delay=2.0
+            retry_delay=2.0,
+            audio=audio
         )
 
-        # 处理结果
-        return self._process_whisper_result_to_dict(result)
-
-    def _process_whisper_result_to_dict(self, whisper_result: dict) -> dict:
-        """将 Whisper 结果转换为字典格式"""
-        text = whisper_result.get("text", "").strip()
-        language = whisper_result.get("language", "unknown")
-
-        # 处理片段
-        segments = []
-        whisper_segments = whisper_result.get("segments", [])
-
-        for segment in whisper_segments:
-            segment_logprob = segment.get("avg_logprob", -5.0)
-            segment_confidence = self._logprob_to_confidence(segment_logprob)
-
-            segments.append({
-                "start": float(segment.get("start", 0)),
-                "end": float(segment.get("end", 0)),
-                "text": segment.get("text", "").strip(),
-                "confidence": segment_confidence
-            })
-
-        # 计算整体置信度
-        if segments:
-            avg_confidence = sum(s["confidence"] for s in segments) / len(segments)
-            confidence = avg_confidence
-        else:
-            # 使用 no_speech_prob
-            no_speech_prob = whisper_result.get("no_speech_prob", 0.0)
-            confidence = 1.0 - no_speech_prob
-
-        return {
-            "text": text,
-            "segments": segments,
-            "language": language,
-            "confidence": confidence
-        }
-
     async def _sync_transcribe_with_retry(
         self,
         audio_path: str,
         options: dict,
         max_retries: int = 2,
-        retry_delay: float = 2.0
+        retry_delay: float = 2.0,
+        audio: Optional[np.ndarray] = None
     ) -> dict:
         """
         带重试机制的同步 Whisper 转录
 
+        只重试 I/O 类错误，显存不足已在 GPU 线程内就地恢复。音频只在首次尝试时解码，
+        重试直接复用已解码的采样 (或已在显存中的张量)。
+
         Args:
             audio_path: 音频文件路径
             options: Whisper 转录选项
             max_retries: 最大重试次数
             retry_delay: 重试延迟（秒）
+            audio: 已解码的 16kHz 单声道采样，None 则读取音频文件
 
         Returns:
             dict: Whisper 转录结果
         """
         # 定义可能需要重试的异常类型
         retryable_exceptions = (
-            RuntimeError,  # CUDA OOM 等
             OSError,  # 文件读取错误
             TimeoutError,  # 超时
             ConnectionError,  # 连接错误
         )
 
+        decoded = audio
+
         @retry_on_exception(
             max_retries=max_retries,
             delay=retry_delay,
@@ -618,12 +1396,18 @@ class SpeechTranscriber:
             exceptions=retryable_exceptions
         )
         async def _transcribe():
+            nonlocal decoded
             loop = asyncio.get_running_loop()
+            if decoded is None:
+                decoded = await loop.run_in_executor(None, self._load_audio_cached, audio_path)
+
             return await loop.run_in_executor(
-                None,
+                self._get_gpu_executor(),
+                _run_on_gpu_stream,
                 self._sync_transcribe,
                 audio_path,
-                options
+                options,
+                decoded
             )
 
         try:
@@ -633,25 +1417,72 @@ class SpeechTranscriber:
             logger.error(f"Whisper 转录失败（已重试 {max_retries} 次）: {e}")
             raise
 
-    def _sync_transcribe(self, audio_path: str, options: dict) -> dict:
-        """同步执行 Whisper 转录（不带重试）"""
-        return self.model.transcribe(audio_path, **options)
+    def _sync_transcribe(
+        self,
+        audio_path: str,
+        options: dict,
+        audio: Optional[np.ndarray] = None
+    ) -> dict:
+        """同步执行 Whisper 转录（I/O 错误不重试，显存不足时就地恢复一次）"""
+        return self._run_transcribe_with_oom_recovery(audio_path, options, audio)
+
+    def _run_transcribe_with_oom_recovery(
+        self,
+        audio_path: str,
+        options: Dict[str, Any],
+        audio: Optional[np.ndarray] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        执行转录，显存不足时在当前 GPU 线程内释放缓存并以更省显存的设置重试一次
+
+        Args:
+            audio_path: 音频文件路径
+            options: openai-whisper 风格的转录选项
+            audio: 已解码的 16kHz 单声道采样
+            partial_callback: 部分结果回调 (仅 faster_whisper 后端)
+
+        Returns:
+            Dict[str, Any]: 转录结果
+        """
+        try:
+            return self._run_transcribe(audio_path, options, audio, partial_callback)
+        except RuntimeError as e:
+            # torch.cuda.OutOfMemoryError 是 RuntimeError 的子类；CTranslate2 的显存不足只体现在消息中
+            if self.device != "cuda" or "out of memory" not in str(e).lower():
+                raise
+            logger.warning(f"显存不足，释放缓存后重试: {e}")
+
+        # 在 except 块外重试：异常及其栈帧引用的中间张量此时已释放
+        torch.cuda.empty_cache()
+        retry_options = dict(options)
+        if retry_options.get("batch_size"):
+            retry_options["batch_size"] = max(1, retry_options["batch_size"] // 2)
+        return self._run_transcribe(audio_path, retry_options, audio, partial_callback)
 
     async def transcribe_batch(
         self,
         audio_paths: List[str],
         language: Language = Language.AUTO,
         max_concurrent: int = 3,
-        progress_callback: Optional[Callable[[str, float], None]] = None
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        batch_size: int = 8
     ) -> List[TranscriptionResult]:
         """
         批量转录音频文件
+
+        以流水线方式执行：后台任务在线程池中用 ffmpeg 预先解码后续文件，
+        GPU 执行器按顺序逐个转录已解码的文件，解码与推理重叠进行。
+        faster_whisper 后端下每个文件的语音片段还会合批推理；openai 后端下
+        队列中已解码的短音频 (不超过一个 30 秒窗口) 合成一批，编码器只前向一次。
+        配置了多张 GPU 时，每张 GPU 的副本各自从解码队列取文件转录。
         
         Args:
             audio_paths: 音频文件路径列表
             language: 目标语言
-            max_concurrent: 最大并发数
+            max_concurrent: 最多预先解码、等待转录的文件数
             progress_callback: 进度回调函数 (文件路径, 进度)
+            batch_size: 合批推理的片段数 (faster_whisper 后端) 或短音频文件数 (openai 后端)
             
         Returns:
             List[TranscriptionResult]: 转录结果列表
@@ -662,31 +1493,99 @@ class SpeechTranscriber:
             # 确保模型已加载
             if self.model is None:
                 await self.load_model()
+            workers = [self] + await self._get_replicas()
             
-            # 创建信号量限制并发数
-            semaphore = asyncio.Semaphore(max_concurrent)
-            
-            async def transcribe_single(audio_path: str) -> TranscriptionResult:
-                async with semaphore:
-                    def single_progress(progress: float):
-                        if progress_callback:
-                            progress_callback(audio_path, progress)
-                    
-                    return await self.transcribe_audio(
-                        audio_path=audio_path,
-                        language=language,
-                        progress_callback=single_progress
-                    )
-            
-            # 并发执行转录任务
-            tasks = [transcribe_single(path) for path in audio_paths]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async def transcribe_single(
+                worker: "SpeechTranscriber",
+                audio_path: str,
+                audio: np.ndarray
+            ) -> TranscriptionResult:
+                def single_progress(progress: float):
+                    if progress_callback:
+                        progress_callback(audio_path, progress)
+
+                return await worker.transcribe_audio(
+                    audio_path=audio_path,
+                    language=language,
+                    progress_callback=single_progress,
+                    batch_size=batch_size,
+                    audio=audio
+                )
+
+            # 解码队列：容量限制内存中等待转录的音频数
+            decoded_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_concurrent))
+
+            async def decode_all() -> None:
+                loop = asyncio.get_running_loop()
+                for index, path in enumerate(audio_paths):
+                    try:
+                        audio = await loop.run_in_executor(None, self._load_audio_cached, path)
+                    except Exception as e:
+                        audio = e
+                    await decoded_queue.put((index, path, audio))
+                # 每个 GPU 工作协程一个结束标记
+                for _ in workers:
+                    await decoded_queue.put(None)
+
+            results: List[Any] = [None] * len(audio_paths)
+
+            async def run_worker(worker: "SpeechTranscriber") -> None:
+                # 空闲的 GPU 先取下一个文件，长短不一的文件也能均衡分配
+                finished = False
+                while not finished:
+                    items = [await decoded_queue.get()]
+                    # openai 后端顺带取出队列中已解码好的文件，短音频合批转录；
+                    # 遇到结束标记即停止，每个工作协程只取走一个标记
+                    if worker.backend == "openai":
+                        while items[-1] is not None and len(items) < batch_size and not decoded_queue.empty():
+                            items.append(decoded_queue.get_nowait())
+
+                    short_items = []
+                    for item in items:
+                        if item is None:
+                            finished = True
+                            continue
+                        index, path, audio = item
+                        if isinstance(audio, Exception):
+                            results[index] = audio
+                        elif worker.backend == "openai" and len(audio) <= _N_SAMPLES:
+                            short_items.append(item)
+                        else:
+                            try:
+                                results[index] = await transcribe_single(worker, path, audio)
+                            except Exception as e:
+                                results[index] = e
+
+                    if len(short_items) == 1:
+                        index, path, audio = short_items[0]
+                        try:
+                            results[index] = await transcribe_single(worker, path, audio)
+                        except Exception as e:
+                            results[index] = e
+                    elif short_items:
+                        try:
+                            batch_results = await worker._transcribe_short_batch(
+                                [audio for _, _, audio in short_items], language
+                            )
+                        except Exception as e:
+                            batch_results = [e] * len(short_items)
+                        for (index, path, _), result in zip(short_items, batch_results):
+                            results[index] = result
+                            if progress_callback and not isinstance(result, Exception):
+                                progress_callback(path, 100)
+
+            decoder = asyncio.ensure_future(decode_all())
+            try:
+                await asyncio.gather(*(run_worker(worker) for worker in workers))
+            finally:
+                decoder.cancel()
             
-            # 处理结果，将异常转换为错误结果
+            # 处理结果，将异常转换为错误结果，同时统计成功数
             processed_results = []
-            for i, result in enumerate(results):
+            success_count = 0
+            for path, result in zip(audio_paths, results):
                 if isinstance(result, Exception):
-                    logger.error(f"文件 {audio_paths[i]} 转录失败: {result}")
+                    logger.error(f"文件 {path} 转录失败: {result}")
                     # 创建错误结果
                     error_result = TranscriptionResult(
                         text=f"转录失败: {str(result)}",
@@ -698,15 +1597,161 @@ class SpeechTranscriber:
                     )
                     processed_results.append(error_result)
                 else:
+                    success_count += 1
                     processed_results.append(result)
             
-            logger.info(f"批量转录完成，成功: {len([r for r in results if not isinstance(r, Exception)])}")
+            logger.info(f"批量转录完成，成功: {success_count}")
             return processed_results
             
         except Exception as e:
             logger.error(f"批量转录失败: {e}")
-            raise Exception(f"批量转录失败: {str(e)}")
+            raise RuntimeError(f"批量转录失败: {e}") from e
     
+    async def _transcribe_short_batch(
+        self,
+        audios: List[np.ndarray],
+        language: Language = Language.AUTO,
+        temperature: float = 0.0
+    ) -> List[TranscriptionResult]:
+        """
+        合批转录多个不超过 30 秒的短音频 (openai 后端)
+
+        Args:
+            audios: 已解码的 16kHz 单声道采样列表
+            language: 目标语言
+            temperature: 采样温度
+
+        Returns:
+            List[TranscriptionResult]: 与输入顺序一致的转录结果
+        """
+        start_time = time.time()
+        options = {
+            "language": language.value if language != Language.AUTO else None,
+            "task": "transcribe",
+            "temperature": temperature,
+        }
+
+        loop = asyncio.get_running_loop()
+        whisper_results = await loop.run_in_executor(
+            self._get_gpu_executor(),
+            _run_on_gpu_stream,
+            self._batch_transcribe_sync,
+            audios,
+            options
+        )
+
+        # 批次耗时平摊到每个文件
+        processing_time = (time.time() - start_time) / len(audios)
+        return [
+            self._process_transcription_result(result, processing_time)
+            for result in whisper_results
+        ]
+
+    def _batch_transcribe_sync(
+        self,
+        audios: List[np.ndarray],
+        options: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        把多个短音频的梅尔频谱堆叠为 [B, n_mels, 3000]，编码器一次前向后逐条解码
+
+        短音频只有一个窗口，整段作为一个片段返回，不含片段内时间戳。
+
+        Args:
+            audios: 已解码的 16kHz 单声道采样列表，每条不超过 30 秒
+            options: openai-whisper 风格的转录选项
+
+        Returns:
+            List[Dict[str, Any]]: openai-whisper 格式的结果，与输入顺序一致
+        """
+        model = self.model
+        if model is None:
+            raise Exception("模型未加载，请先调用load_model()")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(audios)
+        positions, durations, mels = [], [], []
+        for position, audio in enumerate(audios):
+            duration = len(audio) / _SAMPLE_RATE
+            if self.vad_filter and self._vad is not None:
+                audio, speech_map = self._remove_silence(audio)
+                if not speech_map:
+                    results[position] = {
+                        "text": "",
+                        "segments": [],
+                        "language": options.get("language") or "unknown",
+                        "no_speech_prob": 1.0
+                    }
+                    continue
+            mel = whisper.log_mel_spectrogram(self._load_audio_for_model("", audio), model.dims.n_mels)
+            mels.append(whisper.pad_or_trim(mel, whisper.audio.N_FRAMES))
+            positions.append(position)
+            durations.append(duration)
+
+        if not mels:
+            return results
+
+        mel_batch = torch.stack(mels)
+        if self._fp16:
+            mel_batch = mel_batch.half()
+
+        decode_options = whisper.DecodingOptions(
+            task=options.get("task", "transcribe"),
+            language=options.get("language"),
+            temperature=options.get("temperature", 0.0),
+            without_timestamps=True,
+            fp16=self._fp16
+        )
+        with torch.inference_mode():
+            decoded = whisper.decode(model, mel_batch, decode_options)
+
+        for position, duration, result in zip(positions, durations, decoded):
+            text = result.text
+            segments = []
+            if text.strip() and duration > 0:
+                segments.append({
+                    "start": 0.0,
+                    "end": duration,
+                    "text": text,
+                    "avg_logprob": result.avg_logprob,
+                    "no_speech_prob": result.no_speech_prob
+                })
+            results[position] = {
+                "text": text,
+                "language": result.language,
+                "segments": segments,
+                "no_speech_prob": result.no_speech_prob
+            }
+        return results
+
+    async def _get_replicas(self) -> List["SpeechTranscriber"]:
+        """
+        获取其余 GPU 上的转录器副本 (首次调用时创建并加载模型)
+
+        Returns:
+            List[SpeechTranscriber]: 副本列表，单 GPU 或 CPU 时为空
+        """
+        if not self._replica_device_indices:
+            return []
+        if self._replicas is None:
+            self._replicas = [
+                SpeechTranscriber(
+                    model_name=self.model_name,
+                    device=[index],
+                    model_cache_dir=self.model_cache_dir,
+                    compile_model=self.compile_model,
+                    backend=self.backend,
+                    compute_type=self.compute_type,
+                    vad_filter=self.vad_filter,
+                    audio_cache_dir=self.audio_cache_dir
+                )
+                for index in self._replica_device_indices
+            ]
+            logger.info(f"已创建 {len(self._replicas)} 个 GPU 副本: {self._replica_device_indices}")
+        for replica in self._replicas:
+            replica.model_name = self.model_name
+        await asyncio.gather(*(replica.load_model() for replica in self._replicas))
+        return self._replicas
+
     def format_output(
         self, 
         result: TranscriptionResult, 
@@ -729,8 +1774,8 @@ class SpeechTranscriber:
                 return self._format_srt(result)
             elif format_type == OutputFormat.VTT:
                 return self._format_vtt(result)
-            else:  # JSON
-                return result.model_dump_json(indent=2)
+            else:  # JSON（与 CLI 输出共用 orjson 序列化路径）
+                return format_output(result, OutputFormat.JSON)
                 
         except Exception as e:
             logger.error(f"输出格式化失败: {e}")
@@ -738,55 +1783,45 @@ class SpeechTranscriber:
     
     def _format_srt(self, result: TranscriptionResult) -> str:
         """格式化为SRT字幕格式"""
-        srt_content = []
-        
-        for i, segment in enumerate(result.segments, 1):
-            start_time = self._seconds_to_srt_time(segment.start_time)
-            end_time = self._seconds_to_srt_time(segment.end_time)
-            
-            srt_content.append(f"{i}")
-            srt_content.append(f"{start_time} --> {end_time}")
-            srt_content.append(segment.text)
-            srt_content.append("")  # 空行
-        
-        return "\n".join(srt_content)
+        segments = result.segments
+        starts = format_timestamps([segment.start_time for segment in segments], ",")
+        ends = format_timestamps([segment.end_time for segment in segments], ",")
+
+        # 每个字幕块以空行分隔
+        return "\n".join(
+            f"{i}\n{start} --> {end}\n{segment.text}\n"
+            for i, (segment, start, end) in enumerate(zip(segments, starts, ends), 1)
+        )
     
     def _format_vtt(self, result: TranscriptionResult) -> str:
         """格式化为VTT字幕格式"""
+        segments = result.segments
+        starts = format_timestamps([segment.start_time for segment in segments], ".")
+        ends = format_timestamps([segment.end_time for segment in segments], ".")
+
         vtt_content = ["WEBVTT", ""]
-        
-        for segment in result.segments:
-            start_time = self._seconds_to_vtt_time(segment.start_time)
-            end_time = self._seconds_to_vtt_time(segment.end_time)
-            
-            vtt_content.append(f"{start_time} --> {end_time}")
-            vtt_content.append(segment.text)
-            vtt_content.append("")  # 空行
-        
+        vtt_content.extend(
+            f"{start} --> {end}\n{segment.text}\n"
+            for segment, start, end in zip(segments, starts, ends)
+        )
         return "\n".join(vtt_content)
     
     def _seconds_to_srt_time(self, seconds: float) -> str:
         """转换秒数为SRT时间格式"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        return format_timestamps([seconds], ",")[0]
     
     def _seconds_to_vtt_time(self, seconds: float) -> str:
         """转换秒数为VTT时间格式"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        return format_timestamps([seconds], ".")[0]
     
     def get_model_info(self) -> Dict[str, Any]:
         """获取当前模型信息"""
         return {
             "name": self.model_name.value,
             "device": self.device,
+            "device_indices": [self.device_index] + self._replica_device_indices,
+            "backend": self.backend,
+            "trt_available": TENSORRT_AVAILABLE,
             "info": self.model_info.get(self.model_name, {}),
             "loaded": self.model is not None,
             "cache_dir": self.model_cache_dir
@@ -796,37 +1831,103 @@ class SpeechTranscriber:
         """获取可用模型列表"""
         return {model.value: info for model, info in self.model_info.items()}
     
+    async def warmup(self) -> None:
+        """加载模型并用一秒静音推理一次，预热 CUDA 上下文与内核自动调优"""
+        await self.load_model()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_gpu_executor(), _run_on_gpu_stream, self._warmup_sync)
+
+    def _warmup_sync(self) -> None:
+        """在 GPU 执行器中完成预热推理，跳过 VAD 以确保静音也经过编码器"""
+        model = self.model
+        silence = np.zeros(_SAMPLE_RATE, dtype=np.float32)
+        if self.backend == "faster_whisper":
+            segments, _ = model.transcribe(silence, beam_size=1, vad_filter=False)
+            list(segments)
+        elif self.backend == "openai":
+            with torch.inference_mode():
+                model.transcribe(self._load_audio_for_model("", silence), fp16=self._fp16, verbose=None)
+        else:
+            self._run_transcribe("", {"task": "transcribe"}, silence)
+
     async def unload_model(self) -> None:
         """卸载模型以释放内存"""
+        # 只在替换引用时持有锁；进行中的转录持有自己的引用，结束后模型才真正释放
         with self.model_lock:
-            if self.model is not None:
-                del self.model
-                self.model = None
-                self._model_loaded = False
-
-                # 清理GPU内存
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
+            model, self.model = self.model, None
+            self._batched_pipeline = None
+            self._model_loaded = False
+
+        # 释放解码音频缓存
+        with self._audio_cache_lock:
+            self._audio_cache.clear()
+            self._audio_cache_bytes = 0
+        self._pinned_staging = None
+        self._staging_copied = None
+
+        # 卸载其余 GPU 上的副本
+        replicas, self._replicas = self._replicas or [], None
+        for replica in replicas:
+            await replica.unload_model()
+
+        # 关闭 GPU 执行器，下次加载模型时重建 (加载失败时执行器也已创建)
+        if self._gpu_executor is not None:
+            self._gpu_executor.shutdown(wait=False)
+            self._gpu_executor = None
+
+        if model is not None:
+            del model
+
+            # 清理GPU内存
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
 
-                logger.info("模型已卸载")
+            logger.info("模型已卸载")
     
-    def __del__(self):
-        """析构函数"""
-        try:
-            if self.model is not None:
-                del self.model
-        except Exception:
-            pass
+    async def __aenter__(self) -> "SpeechTranscriber":
+        """进入 async with 时加载模型"""
+        await self.load_model()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """退出 async with 时卸载模型"""
+        await self.unload_model()
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_transcriber() -> SpeechTranscriber:
+    """获取全局默认转录器 (用于简单的单任务场景，首次使用时创建)"""
+    transcriber = SpeechTranscriber()
+    atexit.register(_shutdown_default_transcriber, transcriber)
+    return transcriber
+
+
+def _shutdown_default_transcriber(transcriber: SpeechTranscriber) -> None:
+    """解释器退出时卸载全局默认转录器的模型"""
+    if transcriber.model is None:
+        return
+    try:
+        asyncio.run(transcriber.unload_model())
+    except Exception as e:
+        logger.debug(f"退出时卸载默认模型失败: {e}")
 
 
-# 全局转录器实例 (用于简单的单任务场景)
-speech_transcriber = SpeechTranscriber()
+def __getattr__(name: str) -> Any:
+    # 兼容旧的模块属性 speech_transcriber，访问时才创建实例，导入模块不再触发初始化
+    if name == "speech_transcriber":
+        return get_default_transcriber()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_transcriber(
     model_name: TranscriptionModel = TranscriptionModel.SENSEVOICE_SMALL,
-    device: Optional[str] = None,
-    model_cache_dir: Optional[str] = None
+    device: Optional[Union[str, List[int]]] = None,
+    model_cache_dir: Optional[str] = None,
+    compile_model: bool = True,
+    backend: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    vad_filter: bool = True,
+    audio_cache_dir: Optional[str] = None
 ) -> SpeechTranscriber:
     """
     创建新的转录器实例 (线程安全)
@@ -835,8 +1936,13 @@ def create_transcriber(
 
     Args:
         model_name: Whisper模型名称
-        device: 计算设备 ('cpu', 'cuda', 'auto')
+        device: 计算设备 ('cpu', 'cuda', 'auto')，或 GPU 编号列表 (如 [0, 1])
         model_cache_dir: 模型缓存目录
+        compile_model: 是否在 CUDA 上用 torch.compile 编译模型
+        backend: 推理后端 ('faster_whisper', 'openai', 'onnx')，None 则自动选择
+        compute_type: 计算精度，None 则按设备自动选择
+        vad_filter: 是否在解码前用 VAD 跳过静音区域
+        audio_cache_dir: 已解码音频的磁盘缓存目录，None 则不使用磁盘缓存
 
     Returns:
         SpeechTranscriber: 新的转录器实例
@@ -844,10 +1950,72 @@ def create_transcriber(
     return SpeechTranscriber(
         model_name=model_name,
         device=device,
-        model_cache_dir=model_cache_dir
+        model_cache_dir=model_cache_dir,
+        compile_model=compile_model,
+        backend=backend,
+        compute_type=compute_type,
+        vad_filter=vad_filter,
+        audio_cache_dir=audio_cache_dir
     )
 
 
+class ModelRegistry:
+    """
+    已加载转录器的 LRU 缓存
+
+    按模型名保存转录器实例，切换模型时直接复用已加载的模型，
+    超出容量时卸载最久未使用的模型。
+    """
+
+    def __init__(self, max_models: int = 2):
+        """
+        初始化模型缓存
+
+        Args:
+            max_models: 最多同时保留的已加载模型数
+        """
+        self.max_models = max_models
+        self._transcribers: "OrderedDict[TranscriptionModel, SpeechTranscriber]" = OrderedDict()
+
+    def register(self, transcriber: SpeechTranscriber) -> None:
+        """登记已有的转录器实例"""
+        self._transcribers[transcriber.model_name] = transcriber
+        self._transcribers.move_to_end(transcriber.model_name)
+
+    async def get_transcriber(self, model_name: TranscriptionModel) -> SpeechTranscriber:
+        """
+        获取指定模型的转录器，不存在时创建
+
+        Args:
+            model_name: 模型名称
+
+        Returns:
+            SpeechTranscriber: 转录器实例
+        """
+        transcriber = self._transcribers.get(model_name)
+        if transcriber is not None:
+            self._transcribers.move_to_end(model_name)
+            return transcriber
+
+        # 默认模型复用全局默认转录器
+        if model_name == TranscriptionModel.SENSEVOICE_SMALL:
+            transcriber = get_default_transcriber()
+        else:
+            transcriber = create_transcriber(model_name=model_name)
+        self._transcribers[model_name] = transcriber
+
+        while len(self._transcribers) > self.max_models:
+            evicted_name, evicted = self._transcribers.popitem(last=False)
+            logger.info(f"模型缓存已满，卸载模型: {evicted_name}")
+            await evicted.unload_model()
+
+        return transcriber
+
+
+# 全局模型缓存，默认模型使用全局默认转录器
+model_registry = ModelRegistry()
+
+
 async def transcribe_audio_file(
     audio_path: str,
     model: TranscriptionModel = TranscriptionModel.SENSEVOICE_SMALL,
@@ -870,13 +2038,11 @@ async def transcribe_audio_file(
     Returns:
         TranscriptionResult或格式化的字符串
     """
-    # 如果需要不同的模型，重新初始化转录器
-    if speech_transcriber.model_name != model:
-        speech_transcriber.model_name = model
-        speech_transcriber.model = None  # 强制重新加载
+    # 从缓存获取对应模型的转录器，已加载的模型不会重新加载
+    transcriber = await model_registry.get_transcriber(model)
     
     # 执行转录
-    result = await speech_transcriber.transcribe_audio(
+    result = await transcriber.transcribe_audio(
         audio_path=audio_path,
         language=language,
         with_timestamps=with_timestamps,
@@ -887,7 +2053,7 @@ async def transcribe_audio_file(
     if output_format == OutputFormat.JSON:
         return result
     else:
-        return speech_transcriber.format_output(result, output_format)
+        return transcriber.format_output(result, output_format)
 
 
 if __name__ == "__main__":
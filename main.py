@@ -6,11 +6,15 @@ Video Transcriber - 音视频转文本工具
 
 import os
 import sys
+import time
 import asyncio
 import argparse
+import contextlib
+import functools
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
+import aiofiles
 import click
 from rich.console import Console
 from rich.progress import Progress, TaskID
@@ -19,14 +23,20 @@ from rich.panel import Panel
 from rich.text import Text
 from dotenv import load_dotenv
 
+# uvloop (Linux/macOS) - optional，更快的 asyncio 事件循环
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent))
 
-from models.schemas import TranscriptionModel, Language, OutputFormat, ProcessOptions
+from models.schemas import TranscriptionModel, Language, OutputFormat, ProcessOptions, TranscriptionResult, TaskInfo
 from config import settings
-from services import TranscriptionService
 from utils.logging import setup_default_logger
-from utils.file import format_duration, format_file_size
+from utils.file import format_duration, format_file_size, sanitize_filename
 from utils.ffmpeg import check_ffmpeg_installed, get_ffmpeg_help_message
 
 # 加载环境变量
@@ -35,6 +45,12 @@ load_dotenv()
 # 初始化控制台
 console = Console()
 
+# --turbo 预设：(模型, 计算精度)
+TURBO_PRESET = (TranscriptionModel.LARGE_V3_TURBO.value, "int8_float16")
+
+# 批量进度输出的最小间隔（秒），合并并发任务的高频进度更新
+BATCH_PROGRESS_INTERVAL = 0.5
+
 
 # ============================================================================
 # 依赖检查
@@ -75,6 +91,12 @@ def check_startup_dependencies(exit_on_error: bool = True) -> bool:
     return all_ok
 
 
+def read_path_list(file_path: str) -> List[str]:
+    """读取批量处理的路径列表文件，跳过空行和 # 开头的注释行"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
 class ProgressCallback:
     """进度回调处理器"""
 
@@ -90,8 +112,9 @@ class ProgressCallback:
         )
 
 
-def print_banner():
-    """打印程序横幅"""
+@functools.lru_cache(maxsize=1)
+def _banner_panel() -> Panel:
+    """构建程序横幅（内容固定，只构建一次）"""
     banner = """
 ╭─────────────────────────────────────────╮
 │          Video Transcriber              │
@@ -102,11 +125,25 @@ def print_banner():
 │    🔒 本地处理，保护隐私                   │
 ╰─────────────────────────────────────────╯
 """
-    console.print(Panel(banner, style="bright_blue"))
+    return Panel(banner, style="bright_blue")
 
 
-def print_model_info():
-    """打印模型信息"""
+def print_banner():
+    """打印程序横幅"""
+    console.print(_banner_panel())
+
+
+def make_result_formatter(output_format: str) -> Callable[[TranscriptionResult], str]:
+    """按输出格式构建结果格式化函数（格式只解析一次，逐个结果调用）"""
+    from utils.output_formatter import format_output
+
+    fmt = OutputFormat(output_format)
+    return lambda result: format_output(result, fmt)
+
+
+@functools.lru_cache(maxsize=1)
+def _model_table() -> Table:
+    """构建模型信息表（内容固定，只构建一次）"""
     table = Table(title="🤖 可用的语音识别模型", show_header=True, header_style="bold magenta")
     table.add_column("模型", style="cyan")
     table.add_column("大小", style="green")
@@ -115,32 +152,43 @@ def print_model_info():
     table.add_column("推荐场景", style="blue")
 
     model_data = [
-        ("sensevoice-small", "244MB", "~4x", "★★★★☆", "多语言支持，中文优化")
+        ("sensevoice-small", "244MB", "~4x", "★★★★☆", "多语言支持，中文优化"),
+        ("large-v3-turbo (--turbo)", "809MB", "~8x", "★★★★☆", "faster-whisper 推理，多语言快速转录")
     ]
 
     for model, size, speed, accuracy, scene in model_data:
         table.add_row(model, size, speed, accuracy, scene)
 
-    console.print(table)
+    return table
+
+
+def print_model_info():
+    """打印模型信息"""
+    console.print(_model_table())
 
 
 @click.group()
 @click.option('--debug', is_flag=True, help='启用调试模式')
 @click.option('--log-level', default='INFO', help='日志级别')
 @click.option('--skip-deps-check', is_flag=True, help='跳过依赖检查（不推荐）')
+@click.option('--no-console-log', is_flag=True, help='不在控制台输出日志（仍写入日志文件）')
 @click.pass_context
-def cli(ctx, debug, log_level, skip_deps_check):
+def cli(ctx, debug, log_level, skip_deps_check, no_console_log):
     """Video Transcriber - 音视频转文本工具"""
     ctx.ensure_object(dict)
     ctx.obj['debug'] = debug
 
+    # 子命令中的 asyncio.run 使用 uvloop 事件循环（已安装时）
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # 设置日志
     if debug:
         log_level = 'DEBUG'
 
     setup_default_logger(
         log_level=log_level,
-        log_to_console=True,
+        log_to_console=not no_console_log,
         log_file='./logs/app.log' if not debug else None
     )
 
@@ -150,10 +198,14 @@ def cli(ctx, debug, log_level, skip_deps_check):
 
 
 @cli.command()
-@click.argument('file_path', type=click.Path(exists=True))
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
 @click.option('--model', '-m',
               type=click.Choice(['sensevoice-small']),
               default='sensevoice-small', help='语音识别模型 (默认: sensevoice-small)')
+@click.option('--compute-type',
+              type=click.Choice(['float32', 'float16', 'bfloat16', 'int8', 'int8_float16']),
+              default=None, help='计算精度 (默认: 按设备自动选择)')
+@click.option('--turbo', is_flag=True, help='使用 large-v3-turbo (faster-whisper, int8_float16) 快速转录')
 @click.option('--language', '-l',
               type=click.Choice(['auto', 'zh', 'en', 'ja', 'ko', 'es', 'fr', 'de', 'ru']),
               default='auto', help='目标语言 (默认: auto)')
@@ -163,27 +215,22 @@ def cli(ctx, debug, log_level, skip_deps_check):
               default='txt', help='输出格式 (默认: txt)')
 @click.option('--timestamps', is_flag=True, help='包含时间戳')
 @click.option('--quiet', '-q', is_flag=True, help='静默模式')
-def transcribe(file_path, model, language, output, output_format, timestamps, quiet):
+def transcribe(file_path, model, compute_type, turbo, language, output, output_format, timestamps, quiet):
     """转录单个媒体文件（视频/音频）"""
-    asyncio.run(_transcribe_single(file_path, model, language, output, output_format, timestamps, quiet))
+    if turbo:
+        model, compute_type = TURBO_PRESET
+    asyncio.run(_transcribe_single(file_path, model, compute_type, language, output, output_format, timestamps, quiet))
 
 
-async def _transcribe_single(file_path, model, language, output, output_format, timestamps, quiet):
+async def _transcribe_single(file_path, model, compute_type, language, output, output_format, timestamps, quiet):
     """异步转录单个媒体文件"""
     try:
         if not quiet:
             print_banner()
             console.print(f"[bold green]开始处理文件:[/bold green] {file_path}")
 
-        # 验证文件
+        # 文件存在且不是目录已由 click.Path 校验
         file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            console.print("[bold red]错误:[/bold red] 文件不存在")
-            sys.exit(1)
-
-        if not file_path_obj.is_file():
-            console.print("[bold red]错误:[/bold red] 路径不是文件")
-            sys.exit(1)
 
         # 设置选项
         options = ProcessOptions(
@@ -192,41 +239,46 @@ async def _transcribe_single(file_path, model, language, output, output_format,
             with_timestamps=timestamps,
             output_format=OutputFormat(output_format),
             enable_gpu=settings.ENABLE_GPU,
-            temperature=settings.DEFAULT_TEMPERATURE
+            temperature=settings.DEFAULT_TEMPERATURE,
+            compute_type=compute_type
         )
 
-        # 使用服务层
+        # 使用服务层（按需导入，models / check 等子命令无需加载 numpy / pydub）
+        from services import TranscriptionService
         service = TranscriptionService(settings)
 
-        # 创建进度条
-        with Progress() as progress:
-            if not quiet:
+        # 创建进度条（静默模式下不创建，免去 Rich 刷新线程和逐次更新的加锁）
+        progress = None if quiet else Progress()
+        callback = None
+        partial_callback = None
+        with progress if progress is not None else contextlib.nullcontext():
+            if progress is not None:
                 task = progress.add_task("[cyan]处理中...", total=100)
                 callback = ProgressCallback(progress, task)
-            else:
-                callback = None
+
+                # 未指定输出文件时边转录边显示已识别的文本，完成后再显示完整结果
+                if not output:
+                    partial_callback = lambda text: progress.console.print(text, style="dim", markup=False, highlight=False)
 
             # 执行转录
             result = await service.transcribe_file(
                 file_path=str(file_path_obj.absolute()),
                 options=options,
-                progress_callback=callback
+                progress_callback=callback,
+                partial_callback=partial_callback
             )
 
-        # 处理输出
-        if output_format == 'json':
-            output_text = result.model_dump_json(indent=2)
-        else:
-            from utils.output_formatter import format_output
-            output_text = format_output(result, OutputFormat(output_format))
+        # 处理输出（长转录的序列化在线程中执行，不阻塞事件循环）
+        loop = asyncio.get_running_loop()
+        output_text = await loop.run_in_executor(None, make_result_formatter(output_format), result)
 
         # 保存或显示结果
         if output:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(output_text)
+            async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                await f.write(output_text)
 
             if not quiet:
                 console.print(f"[bold green]结果已保存到:[/bold green] {output}")
@@ -258,10 +310,14 @@ async def _transcribe_single(file_path, model, language, output, output_format,
 
 
 @cli.command()
-@click.argument('file_path', type=click.Path(exists=True))
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
 @click.option('--model', '-m',
               type=click.Choice(['sensevoice-small']),
               default='sensevoice-small', help='语音识别模型')
+@click.option('--compute-type',
+              type=click.Choice(['float32', 'float16', 'bfloat16', 'int8', 'int8_float16']),
+              default=None, help='计算精度 (默认: 按设备自动选择)')
+@click.option('--turbo', is_flag=True, help='使用 large-v3-turbo (faster-whisper, int8_float16) 快速转录')
 @click.option('--language', '-l',
               type=click.Choice(['auto', 'zh', 'en', 'ja', 'ko']),
               default='auto', help='目标语言')
@@ -270,21 +326,29 @@ async def _transcribe_single(file_path, model, language, output, output_format,
               type=click.Choice(['json', 'txt', 'srt', 'vtt']),
               default='txt', help='输出格式')
 @click.option('--max-concurrent', '-c', default=3, help='最大并发数')
+@click.option('--encoder-batch-size', type=click.IntRange(min=1), default=None,
+              help='编码器合批推理的片段数 (默认: GPU 为 4，CPU 逐段解码)')
 @click.option('--quiet', '-q', is_flag=True, help='静默模式')
-def batch(file_path, model, language, output_dir, output_format, max_concurrent, quiet):
+def batch(file_path, model, compute_type, turbo, language, output_dir, output_format, max_concurrent,
+          encoder_batch_size, quiet):
     """批量转录媒体文件（从文件读取文件路径列表）"""
-    asyncio.run(_transcribe_batch(file_path, model, language, output_dir, output_format, max_concurrent, quiet))
+    if turbo:
+        model, compute_type = TURBO_PRESET
+    asyncio.run(_transcribe_batch(file_path, model, compute_type, language, output_dir, output_format, max_concurrent,
+                                  encoder_batch_size, quiet))
 
 
-async def _transcribe_batch(file_path, model, language, output_dir, output_format, max_concurrent, quiet):
+async def _transcribe_batch(file_path, model, compute_type, language, output_dir, output_format, max_concurrent,
+                            encoder_batch_size, quiet):
     """异步批量转录"""
     try:
         if not quiet:
             print_banner()
 
-        # 读取文件路径列表
-        with open(file_path, 'r', encoding='utf-8') as f:
-            paths = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        loop = asyncio.get_running_loop()
+
+        # 读取文件路径列表（读取和过滤都在线程中完成，逐行迭代不保留原始行列表）
+        paths = await loop.run_in_executor(None, read_path_list, file_path)
 
         if not paths:
             console.print("[bold red]错误:[/bold red] 文件中没有找到有效的路径")
@@ -292,10 +356,12 @@ async def _transcribe_batch(file_path, model, language, output_dir, output_forma
 
         console.print(f"[bold green]找到 {len(paths)} 个文件路径[/bold green]")
 
-        # 验证文件路径
+        # 验证文件路径：每个路径只 stat 一次，各自在线程池中并行执行，
+        # 网络盘上元数据查询互相重叠，也不阻塞事件循环
+        is_valid = await asyncio.gather(*(loop.run_in_executor(None, os.path.isfile, path) for path in paths))
         valid_paths = []
-        for path in paths:
-            if Path(path).exists() and Path(path).is_file():
+        for path, ok in zip(paths, is_valid):
+            if ok:
                 valid_paths.append(path)
             else:
                 console.print(f"[yellow]跳过无效路径:[/yellow] {path}")
@@ -311,7 +377,9 @@ async def _transcribe_batch(file_path, model, language, output_dir, output_forma
             with_timestamps=False,
             output_format=OutputFormat(output_format),
             enable_gpu=True,
-            temperature=0.0
+            temperature=0.0,
+            compute_type=compute_type,
+            batch_size=encoder_batch_size
         )
 
         # 设置输出目录
@@ -325,45 +393,71 @@ async def _transcribe_batch(file_path, model, language, output_dir, output_forma
         # 执行批量处理
         console.print(f"[bold blue]开始批量处理 {len(valid_paths)} 个媒体文件...[/bold blue]")
 
-        # 使用服务层
+        # 使用服务层（按需导入，models / check 等子命令无需加载 numpy / pydub）
+        from services import TranscriptionService
         service = TranscriptionService(settings)
 
+        last_progress_print = 0.0
+
         def batch_progress(batch_id: str, status_info: dict):
-            if not quiet:
-                completed = status_info.get('success', 0)
-                failed = status_info.get('failed', 0)
-                total = status_info.get('total', 0)
-                console.print(f"进度: {completed + failed}/{total} (成功: {completed}, 失败: {failed})")
-
-        batch_info = await service.transcribe_batch(
-            file_paths=valid_paths,
-            options=options,
-            max_concurrent=max_concurrent,
-            progress_callback=batch_progress
-        )
+            nonlocal last_progress_print
+            if quiet:
+                return
+            # 处理中的进度以 completed 上报，整批结束时以 success 上报
+            completed = status_info.get('success', status_info.get('completed', 0))
+            failed = status_info.get('failed', 0)
+            total = status_info.get('total', 0)
+
+            # 每个文件的每次进度变化都会触发回调，按间隔合并输出，全部完成时总是输出
+            now = time.monotonic()
+            if completed + failed < total and now - last_progress_print < BATCH_PROGRESS_INTERVAL:
+                return
+            last_progress_print = now
+            console.print(f"进度: {completed + failed}/{total} (成功: {completed}, 失败: {failed})")
+
+        formatter = make_result_formatter(output_format)
+
+        async def write_output(task_info: TaskInfo) -> None:
+            # 生成输出文件名
+            safe_title = sanitize_filename(task_info.media_info.file_name if task_info.media_info else "unknown")
+            output_file = output_path / f"{safe_title}_{task_info.task_id[-8:]}.{output_format}"
+
+            try:
+                # 格式化在线程中执行，与其他文件的写入并行
+                output_text = await loop.run_in_executor(None, formatter, task_info.result)
+                async with aiofiles.open(output_file, 'w', encoding='utf-8') as f:
+                    await f.write(output_text)
+            except Exception as e:
+                # 单个文件保存失败不影响其余文件
+                console.print(f"[yellow]保存结果失败:[/yellow] {output_file} ({e})")
+                return
 
-        # 保存结果
-        success_count = batch_info.get('success', 0)
-        task_service = service.task_service
+            if not quiet:
+                console.print(f"[green]已保存:[/green] {output_file}")
 
-        for task_id, task_info in task_service.tasks.items():
-            if task_info.result:
-                # 生成输出文件名
-                safe_title = task_info.media_info.file_name if task_info.media_info else "unknown"
-                safe_title = "".join(c for c in safe_title if c.isalnum() or c in (' ', '-', '_')).strip()
+        # 每个文件转录完成即入队，由写入协程立即保存，不必等整批结束
+        finished: asyncio.Queue = asyncio.Queue()
 
-                output_file = output_path / f"{safe_title}_{task_info.task_id[-8:]}.{output_format}"
+        async def save_results() -> None:
+            writes = []
+            while (task_info := await finished.get()) is not None:
+                writes.append(asyncio.create_task(write_output(task_info)))
+            await asyncio.gather(*writes)
 
-                # 格式化输出
-                if output_format == 'json':
-                    output_text = task_info.result.model_dump_json(indent=2)
-                else:
-                    from utils.output_formatter import format_output
-                    output_text = format_output(task_info.result, OutputFormat(output_format))
+        writer = asyncio.create_task(save_results())
+        try:
+            batch_info = await service.transcribe_batch(
+                file_paths=valid_paths,
+                options=options,
+                max_concurrent=max_concurrent,
+                progress_callback=batch_progress,
+                result_callback=finished.put_nowait
+            )
+        finally:
+            finished.put_nowait(None)
+            await writer
 
-                # 保存文件
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(output_text)
+        success_count = batch_info.get('success', 0)
 
         # 显示结果统计
         console.print(f"\n[bold green]批量处理完成![/bold green]")
@@ -417,6 +511,7 @@ def info():
     console.print(info_table)
 
     # 统计信息 - 使用服务层
+    from services import TranscriptionService
     service = TranscriptionService(settings)
     stats = service.get_statistics()
     stats_table = Table(title="📊 使用统计", show_header=False)
@@ -436,7 +531,8 @@ def cleanup(hours):
     try:
         console.print("[bold blue]开始清理...[/bold blue]")
 
-        # 使用服务层
+        # 使用服务层（按需导入，models / check 等子命令无需加载 numpy / pydub）
+        from services import TranscriptionService
         service = TranscriptionService(settings)
 
         # 清理任务记录
@@ -6,7 +6,7 @@ Video Transcriber 数据模型定义
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 import os
 from pydantic import BaseModel, Field, validator
 
@@ -24,6 +24,7 @@ class TaskStatus(str, Enum):
 class TranscriptionModel(str, Enum):
     """语音识别模型类型"""
     SENSEVOICE_SMALL = "sensevoice-small"  # SenseVoice多语言模型，中文优化
+    LARGE_V3_TURBO = "large-v3-turbo"  # Whisper large-v3-turbo，经 faster-whisper 推理
 
 
 class OutputFormat(str, Enum):
@@ -159,6 +160,10 @@ class TranscriptionResult(BaseModel):
 # 请求/响应模型
 # =============================================================================
 
+# 推理计算精度，与 CTranslate2 的 compute_type 取值一致
+ComputeType = Literal["float32", "float16", "bfloat16", "int8", "int8_float16"]
+
+
 class ProcessOptions(BaseModel):
     """处理选项"""
     model: TranscriptionModel = Field(TranscriptionModel.SENSEVOICE_SMALL, description="语音识别模型")
@@ -167,9 +172,15 @@ class ProcessOptions(BaseModel):
     output_format: OutputFormat = Field(OutputFormat.JSON, description="输出格式")
     enable_gpu: Optional[bool] = Field(None, description="是否启用GPU")
     temperature: float = Field(0.0, ge=0.0, le=1.0, description="采样温度")
+    compute_type: Optional[ComputeType] = Field(None, description="计算精度，None则按设备自动选择")
+    vad_filter: bool = Field(True, description="是否用VAD跳过静音区域")
+    warmup: bool = Field(True, description="批量处理前是否用静音预热模型")
+    batch_size: Optional[int] = Field(None, ge=1, description="编码器合批推理的片段数，None则GPU上为4、CPU上逐段解码")
 
     class Config:
         use_enum_values = True
+        # 构建后只读：同一实例在批量任务间共享传递，无需复制
+        frozen = True
 
 
 class TranscribeRequest(BaseModel):
@@ -6,7 +6,7 @@
 import os
 import asyncio
 import mimetypes
-import re
+import stat
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -15,6 +15,13 @@ from loguru import logger
 from config import settings, Settings
 
 
+# get_safe_filename 的映射表：非法字符替换为下划线，控制字符删除
+_SAFE_FILENAME_TABLE = str.maketrans({
+    **dict.fromkeys(map(ord, '<>:"/\\|?*'), '_'),
+    **dict.fromkeys(range(32)),
+})
+
+
 class FileService:
     """
     文件服务
@@ -105,12 +112,14 @@ class FileService:
         """
         path = Path(file_path)
 
-        # 检查文件是否存在
-        if not path.exists():
+        # 检查文件是否存在（一次 stat 同时取得类型和大小）
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return False, "文件不存在"
 
         # 检查是否为文件
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False, "路径不是文件"
 
         # 检查文件格式
@@ -118,7 +127,7 @@ class FileService:
             return False, f"不支持的文件格式: {path.suffix}"
 
         # 检查文件大小
-        file_size = path.stat().st_size
+        file_size = st.st_size
         max_size = (max_size_mb or self.config.MAX_FILE_SIZE) * 1024 * 1024
         if file_size > max_size:
             return False, f"文件大小超过限制 ({max_size / 1024 / 1024}MB)"
@@ -141,19 +150,19 @@ class FileService:
         """
         path = Path(file_path)
 
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return {}
 
-        stat = path.stat()
-
         return {
             "name": path.name,
             "stem": path.stem,
             "suffix": path.suffix,
-            "size": stat.st_size,
-            "size_mb": round(stat.st_size / 1024 / 1024, 2),
-            "created": stat.st_ctime,
-            "modified": stat.st_mtime,
+            "size": st.st_size,
+            "size_mb": round(st.st_size / 1024 / 1024, 2),
+            "created": st.st_ctime,
+            "modified": st.st_mtime,
             "is_video": self.is_supported_video_file(file_path),
             "is_audio": self.is_supported_audio_file(file_path),
             "mime_type": mimetypes.guess_type(file_path)[0],
@@ -188,12 +197,8 @@ class FileService:
         Returns:
             str: 安全的文件名
         """
-        # 移除非法字符
-        illegal_chars = r'[<>:"/\\|?*]'
-        safe_name = re.sub(illegal_chars, '_', filename)
-
-        # 移除控制字符
-        safe_name = ''.join(char for char in safe_name if ord(char) >= 32)
+        # 一次 translate 替换非法字符并移除控制字符
+        safe_name = filename.translate(_SAFE_FILENAME_TABLE)
 
         # 限制长度
         if len(safe_name) > max_length:
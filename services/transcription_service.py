@@ -4,6 +4,7 @@
 """
 
 import asyncio
+import contextlib
 import uuid
 import time
 from datetime import datetime
@@ -23,6 +24,9 @@ from .file_service import FileService
 from .task_service import TaskService
 from utils.paragraph_formatter import format_paragraphs
 
+# 批量处理未指定 batch_size 时 GPU 上每次编码器前向合并的片段数
+_DEFAULT_GPU_BATCH_SIZE = 4
+
 
 class TranscriptionService:
     """
@@ -61,7 +65,10 @@ class TranscriptionService:
         options: Optional[ProcessOptions] = None,
         progress_callback: Optional[Callable[[str, float, str], None]] = None,
         timeout: Optional[int] = None,
-        task_id: Optional[str] = None
+        task_id: Optional[str] = None,
+        transcribe_semaphore: Optional[asyncio.Semaphore] = None,
+        transcriber: Optional[Any] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> TranscriptionResult:
         """
         转录单个媒体文件
@@ -72,6 +79,10 @@ class TranscriptionService:
             progress_callback: 进度回调函数 (task_id, progress, message)
             timeout: 自定义超时时间（秒）
             task_id: 外部预生成的任务ID（由 create_task_id 生成）
+            transcribe_semaphore: 限制转录阶段并发的信号量（批量处理时使用），
+                音频提取阶段不受其限制
+            transcriber: 已预加载的转录器（批量处理时共享），None 则为本任务创建并在完成后卸载
+            partial_callback: 部分结果回调，转录过程中按块/片段以已识别的文本调用
 
         Returns:
             TranscriptionResult: 转录结果
@@ -129,10 +140,11 @@ class TranscriptionService:
             self._register_temp_file(task_id, audio_path)
 
             # 执行转录
-            self.task_service.update_task_status(task_id, TaskStatus.TRANSCRIBING)
-            result = await self._transcribe(
-                audio_path, options, task_id, progress_callback
-            )
+            async with transcribe_semaphore or contextlib.nullcontext():
+                self.task_service.update_task_status(task_id, TaskStatus.TRANSCRIBING)
+                result = await self._transcribe(
+                    audio_path, options, task_id, progress_callback, transcriber, partial_callback
+                )
 
             # 更新任务状态
             task_info.result = result
@@ -192,7 +204,8 @@ class TranscriptionService:
         file_paths: List[str],
         options: Optional[ProcessOptions] = None,
         max_concurrent: Optional[int] = None,
-        progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        result_callback: Optional[Callable[[TaskInfo], None]] = None
     ) -> Dict[str, Any]:
         """
         批量转录媒体文件
@@ -202,6 +215,8 @@ class TranscriptionService:
             options: 处理选项
             max_concurrent: 最大并发数
             progress_callback: 进度回调函数 (batch_id, status_info)
+            result_callback: 结果回调，每个文件转录成功后立即以其 TaskInfo 调用，
+                调用方可边处理边保存结果，而不必等待整批完成
 
         Returns:
             Dict[str, Any]: 批量处理结果统计
@@ -221,34 +236,86 @@ class TranscriptionService:
         if max_concurrent is None:
             max_concurrent = self.config.MAX_CONCURRENT_TASKS
 
+        # 编码器合批只作为批量处理的默认值：未指定时 GPU 上按默认批大小合并片段，
+        # 单文件转录仍按调用方传入的 batch_size（默认逐段解码）
+        if options.batch_size is None and options.enable_gpu:
+            options = options.model_copy(update={"batch_size": _DEFAULT_GPU_BATCH_SIZE})
+
         logger.info(f"开始批量处理 {len(file_paths)} 个媒体文件")
 
-        # 创建信号量限制并发数
-        semaphore = asyncio.Semaphore(max_concurrent)
+        if not file_paths:
+            # 没有文件时不加载模型，直接返回空统计
+            batch_result = {"batch_id": batch_id, "total": 0, "success": 0, "failed": 0, "success_rate": 0}
+            if progress_callback:
+                progress_callback(batch_id, batch_result)
+            return batch_result
 
-        async def process_single(file_path: str) -> Optional[TranscriptionResult]:
-            async with semaphore:
+        # max_concurrent 个工作协程限制并发数：音频提取最多 max_concurrent 个并行，
+        # 转录阶段用信号量单独限流，下一个文件的提取与当前文件的推理重叠进行
+        transcribe_semaphore = asyncio.Semaphore(
+            min(max_concurrent, getattr(self.config, 'MAX_CONCURRENT_TRANSCRIPTIONS', 1))
+        )
+
+        # 在分发任务前加载（并按需预热）一次模型，所有文件共享同一转录器
+        transcriber = None
+        try:
+            transcriber = self._create_transcriber(options, "cuda" if options.enable_gpu else "cpu")
+            if options.warmup:
+                await transcriber.warmup()
+            else:
+                await transcriber.load_model()
+        except Exception as e:
+            logger.warning(f"批量处理预加载模型失败: {e}，改为按文件加载")
+            if transcriber is not None:
+                # 预热失败时模型可能已部分加载，先释放再退回按文件加载
                 try:
-                    def single_progress(task_id: str, progress: float, message: str):
-                        if progress_callback:
-                            # 更新批量任务进度
-                            self._update_batch_progress(batch_id, progress_callback)
-
-                    return await self.transcribe_file(
-                        file_path=file_path,
-                        options=options,
-                        progress_callback=single_progress
-                    )
-                except Exception as e:
-                    logger.error(f"文件处理失败: {file_path}, 错误: {e}")
-                    return None
+                    await transcriber.unload_model()
+                except Exception as unload_error:
+                    logger.warning(f"释放预加载模型失败: {unload_error}")
+            transcriber = None
+
+        async def process_single(file_path: str) -> Optional[TranscriptionResult]:
+            try:
+                def single_progress(task_id: str, progress: float, message: str):
+                    if progress_callback:
+                        # 更新批量任务进度
+                        self._update_batch_progress(batch_id, progress_callback)
+
+                task_id = self.create_task_id()
+                result = await self.transcribe_file(
+                    file_path=file_path,
+                    options=options,
+                    progress_callback=single_progress,
+                    task_id=task_id,
+                    transcribe_semaphore=transcribe_semaphore,
+                    transcriber=transcriber
+                )
+                if result_callback:
+                    result_callback(self.task_service.get_task(task_id))
+                return result
+            except Exception as e:
+                logger.error(f"文件处理失败: {file_path}, 错误: {e}")
+                return None
 
-        # 并发执行处理任务
-        tasks = [process_single(path) for path in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 工作协程从队列中依次取文件处理：同时存在的任务数等于并发数，
+        # 而不是为每个文件各创建一个等待信号量的任务
+        pending: asyncio.Queue = asyncio.Queue()
+        for path in file_paths:
+            pending.put_nowait(path)
+        results: List[Optional[TranscriptionResult]] = []
+
+        async def worker() -> None:
+            while not pending.empty():
+                results.append(await process_single(pending.get_nowait()))
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(file_paths)))))
+        finally:
+            if transcriber is not None:
+                await transcriber.unload_model()
 
         # 统计结果
-        success_count = sum(1 for r in results if r is not None and not isinstance(r, Exception))
+        success_count = sum(1 for r in results if r is not None)
         failed_count = len(results) - success_count
 
         batch_result = {
@@ -280,13 +347,14 @@ class TranscriptionService:
         if progress_callback:
             progress_callback(task_id, 5, "正在验证文件...")
 
-        # 检查文件是否存在
+        # 检查文件是否存在（一次 stat 同时取得大小）
         path = Path(file_path)
-        if not path.exists():
+        try:
+            file_size = path.stat().st_size
+        except FileNotFoundError:
             raise Exception(f"文件不存在: {file_path}")
 
         # 检查文件大小
-        file_size = path.stat().st_size
         max_size = self.config.MAX_FILE_SIZE * 1024 * 1024  # MB to bytes
         if file_size > max_size:
             raise Exception(
@@ -321,15 +389,46 @@ class TranscriptionService:
 
         return audio_path
 
+    def _create_transcriber(self, options: ProcessOptions, device: str) -> Any:
+        """按模型创建转录器实例（SenseVoice 或 faster-whisper 后端的 Whisper）"""
+        model_name = options.model.value if hasattr(options.model, 'value') else str(options.model)
+        if model_name == TranscriptionModel.SENSEVOICE_SMALL.value:
+            from core.sensevoice_transcriber import create_sensevoice_transcriber
+            return create_sensevoice_transcriber(
+                model_name=model_name,
+                device=device,
+                model_cache_dir=self.config.MODEL_CACHE_DIR,
+                enable_punctuation=getattr(self.config, 'ENABLE_PUNCTUATION', True),
+                clean_special_tokens=getattr(self.config, 'CLEAN_SPECIAL_TOKENS', True),
+                # 音频分块处理配置
+                enable_chunking=getattr(self.config, 'ENABLE_AUDIO_CHUNKING', True),
+                chunk_duration_seconds=getattr(self.config, 'CHUNK_DURATION_SECONDS', 180),
+                chunk_overlap_seconds=getattr(self.config, 'CHUNK_OVERLAP_SECONDS', 2),
+                min_duration_for_chunking=getattr(self.config, 'MIN_DURATION_FOR_CHUNKING', 300),
+                compute_type=options.compute_type
+            )
+
+        # Whisper 系列模型使用 faster-whisper 后端
+        from core.transcriber import create_transcriber
+        return create_transcriber(
+            model_name=TranscriptionModel(model_name),
+            device=device,
+            model_cache_dir=self.config.MODEL_CACHE_DIR,
+            backend="faster_whisper",
+            compute_type=options.compute_type,
+            vad_filter=options.vad_filter
+        )
+
     async def _transcribe(
         self,
         audio_path: str,
         options: ProcessOptions,
         task_id: str,
-        progress_callback: Optional[Callable[[str, float, str], None]]
+        progress_callback: Optional[Callable[[str, float, str], None]],
+        transcriber: Optional[Any] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> TranscriptionResult:
-        """执行转录 (使用独立转录器实例)"""
-        from core.sensevoice_transcriber import create_sensevoice_transcriber
+        """执行转录 (未传入共享转录器时使用独立转录器实例)"""
         from utils.audio.chunking import AudioChunker
 
         # 获取音频时长
@@ -349,19 +448,10 @@ class TranscriptionService:
 
         logger.info(f"音频时长: {audio_duration:.1f}s, 使用设备: {device}")
 
-        # 创建独立的转录器实例
-        transcriber = create_sensevoice_transcriber(
-            model_name=options.model.value if hasattr(options.model, 'value') else str(options.model),
-            device=device,
-            model_cache_dir=self.config.MODEL_CACHE_DIR,
-            enable_punctuation=getattr(self.config, 'ENABLE_PUNCTUATION', True),
-            clean_special_tokens=getattr(self.config, 'CLEAN_SPECIAL_TOKENS', True),
-            # 音频分块处理配置
-            enable_chunking=getattr(self.config, 'ENABLE_AUDIO_CHUNKING', True),
-            chunk_duration_seconds=getattr(self.config, 'CHUNK_DURATION_SECONDS', 180),
-            chunk_overlap_seconds=getattr(self.config, 'CHUNK_OVERLAP_SECONDS', 2),
-            min_duration_for_chunking=getattr(self.config, 'MIN_DURATION_FOR_CHUNKING', 300)
-        )
+        # 共享转录器按 enable_gpu 选择的设备创建，长音频回退 CPU 时改用独立实例
+        owns_transcriber = transcriber is None or device != ("cuda" if options.enable_gpu else "cpu")
+        if owns_transcriber:
+            transcriber = self._create_transcriber(options, device)
 
         def update_progress(progress: float):
             if progress_callback:
@@ -374,14 +464,17 @@ class TranscriptionService:
             language=options.language,
             with_timestamps=options.with_timestamps,
             temperature=options.temperature,
-            progress_callback=update_progress
+            progress_callback=update_progress,
+            partial_callback=partial_callback,
+            batch_size=options.batch_size
         )
 
         if progress_callback:
             progress_callback(task_id, 95, "转录完成")
 
-        # 卸载模型释放内存
-        await transcriber.unload_model()
+        # 卸载模型释放内存（共享转录器由批量处理结束时统一卸载）
+        if owns_transcriber:
+            await transcriber.unload_model()
 
         # 段落格式化
         if getattr(self.config, 'ENABLE_PARAGRAPH_FORMATTING', True):
@@ -0,0 +1,25 @@
+"""文件辅助函数测试。"""
+
+from services.file_service import FileService
+from utils.file import clean_filename, sanitize_filename
+
+
+def test_sanitize_filename_matches_character_filter():
+    """与逐字符过滤结果一致：保留字母数字、空格、连字符和下划线。"""
+    names = ["我的 视频-01_final.mp4", "  a/b\\c:d*e?  ", "Ünïcödé (1) [HD].mkv", ""]
+    for name in names:
+        expected = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+        assert sanitize_filename(name) == expected
+
+    assert sanitize_filename("我的 视频-01_final.mp4") == "我的 视频-01_finalmp4"
+
+
+def test_clean_filename_replaces_illegal_characters():
+    """非法字符替换为下划线，连续下划线折叠，首尾空格和点号去除。"""
+    assert clean_filename(' a<b>:c"d/e\\f|g?h*i. ') == "a_b_c_d_e_f_g_h_i"
+    assert clean_filename("...") == "untitled"
+
+
+def test_get_safe_filename_drops_control_characters():
+    """上传文件名中的非法字符替换为下划线，控制字符直接删除。"""
+    assert FileService().get_safe_filename("re\x00port\t<v2>.mp4") == "report_v2_.mp4"
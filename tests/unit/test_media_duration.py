@@ -0,0 +1,27 @@
+"""媒体时长探测测试。"""
+
+import subprocess
+
+from core import downloader
+from core.downloader import AudioExtractor
+
+
+def test_media_duration_reads_header_once(tmp_path, monkeypatch):
+    """只解析头部（不解码到 null 输出），未变化的文件复用缓存结果。"""
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"\x00")
+    calls = []
+
+    def fake_run(args, capture_output, timeout):
+        calls.append(args)
+        stderr = b"  Duration: 00:01:02.50, start: 0.000000, bitrate: 128 kb/s\n"
+        return subprocess.CompletedProcess(args, 1, stdout=b"", stderr=stderr)
+
+    monkeypatch.setattr(downloader.subprocess, "run", fake_run)
+    downloader._probe_media_duration.cache_clear()
+    extractor = AudioExtractor(temp_dir=str(tmp_path / "temp"))
+
+    assert extractor._get_media_duration(str(media)) == 62.5
+    assert extractor._get_media_duration(str(media)) == 62.5
+    assert len(calls) == 1
+    assert "-f" not in calls[0]
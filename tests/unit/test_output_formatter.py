@@ -0,0 +1,51 @@
+"""输出格式化测试。"""
+
+from models.schemas import OutputFormat, TranscriptionResult, TranscriptionSegment
+from utils.output_formatter import _format_srt_time, _format_vtt_time, format_output, format_timestamps
+
+
+def _result() -> TranscriptionResult:
+    segments = [
+        TranscriptionSegment(start_time=0.0, end_time=1.5, text="第一句", confidence=0.9),
+        TranscriptionSegment(start_time=3661.25, end_time=3662.0, text="第二句", confidence=0.9),
+    ]
+    return TranscriptionResult(text="第一句第二句", language="zh", confidence=0.9,
+                               segments=segments, processing_time=0.1)
+
+
+def test_timestamps_use_exact_milliseconds():
+    """时间戳按整数毫秒拆分，不受浮点取模误差影响。"""
+    assert _format_srt_time(19.889) == "00:00:19,889"
+    assert _format_vtt_time(3723.5) == "01:02:03.500"
+    assert _format_srt_time(59.9996) == "00:01:00,000"
+
+
+def test_format_timestamps_batch():
+    """批量格式化一次拆分所有时间，结果保持输入顺序。"""
+    assert format_timestamps([0.0, 19.889, 59.9996, 36000.001], ",") == [
+        "00:00:00,000", "00:00:19,889", "00:01:00,000", "10:00:00,001"
+    ]
+    assert format_timestamps([], ".") == []
+
+
+def test_format_srt():
+    """SRT 字幕块以空行分隔。"""
+    assert format_output(_result(), OutputFormat.SRT) == (
+        "1\n00:00:00,000 --> 00:00:01,500\n第一句\n\n"
+        "2\n01:01:01,250 --> 01:01:02,000\n第二句\n"
+    )
+
+
+def test_format_vtt():
+    """VTT 以文件头开头，字幕块以空行分隔。"""
+    assert format_output(_result(), OutputFormat.VTT) == (
+        "WEBVTT\n\n"
+        "00:00:00.000 --> 00:00:01.500\n第一句\n\n"
+        "01:01:01.250 --> 01:01:02.000\n第二句\n"
+    )
+
+
+def test_format_json_matches_pydantic_output():
+    """JSON 输出与 pydantic 缩进序列化结果逐字节一致。"""
+    result = _result()
+    assert format_output(result, OutputFormat.JSON) == result.model_dump_json(indent=2)
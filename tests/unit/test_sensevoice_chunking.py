@@ -0,0 +1,232 @@
+"""SenseVoice 分块转录流水线测试。"""
+
+import asyncio
+import time
+import wave
+
+import numpy as np
+import pytest
+import torch
+
+from core.sensevoice_transcriber import SenseVoiceTranscriber
+from utils.audio.chunking import AudioChunker
+
+
+@pytest.fixture
+def transcriber(tmp_path) -> SenseVoiceTranscriber:
+    """绕过 __init__（无需 funasr / 模型）构造带分块器的转录器。"""
+    instance = object.__new__(SenseVoiceTranscriber)
+    instance.model_name = "sensevoice-small"
+    instance.model_cache_dir = str(tmp_path)
+    instance.clean_special_tokens = True
+    instance.enable_punctuation = False
+    instance.compute_type = None
+    instance.chunk_overlap_seconds = 2
+    instance.audio_chunker = AudioChunker(chunk_duration=100, overlap=2, min_duration_for_chunking=30)
+    instance.audio_chunker.get_audio_duration = lambda path: 250.0
+
+    def fake_transcribe_chunk(chunk_path, language, with_timestamps, chunk_start, chunk_end, samples=None):
+        return {
+            "text": chunk_path,
+            "segments": [],
+            "language": language,
+            "confidence": 0.95,
+            "processing_time": 0.0,
+            "start_time": chunk_start,
+            "end_time": chunk_end,
+        }
+
+    instance._transcribe_single_chunk_sync = fake_transcribe_chunk
+    return instance
+
+
+def test_single_chunk_cleans_special_tokens(transcriber):
+    """单块结果在合并前即清理特殊标记。"""
+    class FakeModel:
+        def generate(self, input, **kwargs):
+            return [{"key": "chunk_0", "text": "<|zh|><|NEUTRAL|><|Speech|>你好 <|HAPPY|>世界"}]
+
+    del transcriber._transcribe_single_chunk_sync
+    transcriber.model = FakeModel()
+    transcriber.device = "cpu"
+
+    result = transcriber._transcribe_single_chunk_sync(
+        "chunk_0.wav", "zh", False, 0.0, 100.0, samples=np.zeros(16, dtype=np.float32)
+    )
+
+    assert result["text"] == "你好 世界"
+
+
+def test_generate_uses_autocast_only_on_cuda(transcriber, monkeypatch):
+    """GPU 上按 compute_type 进入 autocast，CPU 上直接推理。"""
+    contexts = []
+
+    class FakeAutocast:
+        def __init__(self, device_type, dtype):
+            contexts.append((device_type, dtype))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    class FakeModel:
+        def generate(self, **kwargs):
+            return kwargs["input"]
+
+    monkeypatch.setattr("core.sensevoice_transcriber.torch.autocast", FakeAutocast)
+    transcriber.model = FakeModel()
+    transcriber.compute_type = "int8_float16"
+
+    transcriber.device = "cpu"
+    assert transcriber._generate(input="a.wav") == "a.wav"
+    assert contexts == []
+
+    transcriber.device = "cuda"
+    assert transcriber._generate(input="a.wav") == "a.wav"
+    assert contexts == [("cuda", torch.float16)]
+
+
+def test_plan_chunks():
+    """分块边界按块长与重叠计算。"""
+    chunker = AudioChunker(chunk_duration=100, overlap=2)
+    assert chunker.plan_chunks(250.0) == [(0.0, 100.0), (98.0, 198.0), (196.0, 250.0)]
+    assert chunker.plan_chunks(5.0) == []
+
+
+def test_chunked_transcription_streams_chunks_in_order(transcriber):
+    """边分割边转录，结果按块顺序合并，进度覆盖全部块，每块完成即回调部分结果。"""
+    transcriber.audio_chunker.iter_chunks = lambda path, temp_dir=None, total_duration=None: (
+        (f"chunk_{i}", start, end)
+        for i, (start, end) in enumerate(transcriber.audio_chunker.plan_chunks(total_duration))
+    )
+    progress = []
+    partials = []
+
+    result = transcriber._transcribe_with_chunking_sync(
+        "audio.wav", "zh", False, progress.append, 0.0, partials.append
+    )
+
+    assert result.text == "chunk_0 chunk_1 chunk_2"
+    assert progress[-1] == 80
+    assert partials == ["chunk_0", "chunk_1", "chunk_2"]
+
+
+async def test_async_chunked_transcription_streams_chunks_in_order(transcriber):
+    """异步分块路径同样边分割边转录，结果按块顺序合并。"""
+    transcriber.audio_chunker.iter_chunks = lambda path, temp_dir=None, total_duration=None: (
+        (f"chunk_{i}", start, end)
+        for i, (start, end) in enumerate(transcriber.audio_chunker.plan_chunks(total_duration))
+    )
+
+    async def fake_transcribe_chunk(chunk_path, language, with_timestamps, chunk_start, chunk_end):
+        return transcriber._transcribe_single_chunk_sync(chunk_path, language, with_timestamps, chunk_start, chunk_end)
+
+    transcriber._transcribe_single_chunk = fake_transcribe_chunk
+    progress = []
+
+    result = await transcriber._transcribe_with_chunking("audio.wav", "zh", False, progress.append, 0.0)
+
+    assert result.text == "chunk_0 chunk_1 chunk_2"
+    assert progress[-1] == 80
+
+
+async def test_async_chunked_transcription_cleans_up_in_flight_chunk_on_cancel(transcriber, tmp_path):
+    """取消异步分块转录时等待正在进行的分割结束，清理它写出的块并关闭分割生成器。"""
+    state = {"closed": False}
+
+    def slow_iter_chunks(path, temp_dir=None, total_duration=None):
+        try:
+            for i, (start, end) in enumerate(transcriber.audio_chunker.plan_chunks(total_duration)):
+                if i:
+                    # 后续块分割期间转录任务被取消
+                    time.sleep(0.1)
+                chunk = tmp_path / f"chunk_test_{i}.wav"
+                chunk.write_bytes(b"")
+                yield (str(chunk), start, end)
+        finally:
+            state["closed"] = True
+
+    started = asyncio.Event()
+
+    async def stuck_transcribe_chunk(chunk_path, language, with_timestamps, chunk_start, chunk_end):
+        started.set()
+        await asyncio.Event().wait()
+
+    cleaners = []
+    cleanup_chunks_in_background = transcriber.audio_chunker.cleanup_chunks_in_background
+    transcriber.audio_chunker.cleanup_chunks_in_background = lambda paths: cleaners.append(
+        cleanup_chunks_in_background(paths)
+    )
+    transcriber.audio_chunker.iter_chunks = slow_iter_chunks
+    transcriber._transcribe_single_chunk = stuck_transcribe_chunk
+
+    task = asyncio.ensure_future(transcriber._transcribe_with_chunking("audio.wav", "zh", False, None, 0.0))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    for cleaner in cleaners:
+        cleaner.join()
+
+    assert state["closed"]
+    assert list(tmp_path.glob("chunk_test_*")) == []
+
+
+def test_chunked_transcription_falls_back_to_whole_file(transcriber):
+    """首块分割失败时回退为整段处理。"""
+    def failing_iter_chunks(path, temp_dir=None, total_duration=None):
+        raise Exception("ffmpeg 分割失败")
+        yield
+
+    transcriber.audio_chunker.iter_chunks = failing_iter_chunks
+
+    result = transcriber._transcribe_with_chunking_sync("audio.wav", "zh", False, None, 0.0)
+
+    assert result.text == "audio.wav"
+
+
+def test_cleanup_chunks_in_background_only_removes_chunk_files(tmp_path):
+    """后台清理只删除块文件，保留原始音频。"""
+    chunk = tmp_path / "chunk_ab12cd34_0.wav"
+    original = tmp_path / "audio.wav"
+    chunk.write_bytes(b"")
+    original.write_bytes(b"")
+
+    cleaner = AudioChunker().cleanup_chunks_in_background([str(chunk), str(original), str(tmp_path / "chunk_missing.wav")])
+    # 非守护线程：解释器退出前会等待清理完成
+    assert not cleaner.daemon
+    cleaner.join()
+
+    assert not chunk.exists()
+    assert original.exists()
+
+
+def test_load_chunk_samples(tmp_path):
+    """块文件预读为归一化的 float32 采样。"""
+    chunk = tmp_path / "chunk_0.wav"
+    with wave.open(str(chunk), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(np.array([0, 16384, -32768], dtype="<i2").tobytes())
+
+    samples = AudioChunker().load_chunk_samples(str(chunk))
+
+    assert samples.dtype == np.float32
+    assert samples.tolist() == [0.0, 0.5, -1.0]
+
+
+def test_merge_results_averages_segment_confidence():
+    """合并时按实际保留的片段计算平均置信度，跳过重叠区的首段。"""
+    chunk_results = [
+        {"text": "a", "segments": [{"text": "a", "confidence": 0.9}], "start_time": 0.0, "end_time": 100.0},
+        {"text": "b c", "segments": [{"text": "b", "confidence": 0.1}, {"text": "c", "confidence": 0.7}],
+         "start_time": 98.0, "end_time": 150.0},
+    ]
+
+    merged = AudioChunker().merge_results(chunk_results, overlap_seconds=2)
+
+    assert merged["text"] == "a c"
+    assert merged["confidence"] == pytest.approx(0.8)
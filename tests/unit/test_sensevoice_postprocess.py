@@ -0,0 +1,103 @@
+"""SenseVoice 转录结果后处理测试。"""
+
+import functools
+
+import pytest
+
+from core.sensevoice_transcriber import SenseVoiceTranscriber, _build_segment
+from models.schemas import TranscriptionResult, TranscriptionSegment
+
+
+@pytest.fixture
+def transcriber() -> SenseVoiceTranscriber:
+    """绕过 __init__（无需 funasr / 模型）构造转录器。"""
+    instance = object.__new__(SenseVoiceTranscriber)
+    instance.clean_special_tokens = True
+    return instance
+
+
+def test_clean_special_tokens(transcriber):
+    """删除特殊标记并折叠空白。"""
+    raw = "<|zh|><|NEUTRAL|><|Speech|><|woitn|>你好  <|HAPPY|> 世界\n"
+    assert transcriber._clean_special_tokens(raw) == "你好 世界"
+
+
+def test_clean_special_tokens_disabled(transcriber):
+    """关闭清理时原样返回。"""
+    transcriber.clean_special_tokens = False
+    raw = "<|zh|>你好"
+    assert transcriber._clean_special_tokens(raw) == raw
+    assert transcriber._clean_special_tokens(raw, with_index_map=True) == (raw, list(range(len(raw) + 1)))
+
+
+def test_clean_special_tokens_index_map_slices_segments(transcriber):
+    """整段清理一次后按下标映射切分，结果与逐片段清理一致。"""
+    parts = ["<|zh|><|NEUTRAL|>第一句 ", " <|en|>second  part", "<|Speech|>", "第三句<|BGM|>"]
+    raw = "".join(parts)
+
+    cleaned, index_map = transcriber._clean_special_tokens(raw, with_index_map=True)
+
+    assert cleaned == transcriber._clean_special_tokens(raw)
+    assert len(index_map) == len(raw) + 1
+
+    pos = 0
+    for part in parts:
+        start = pos + len(part) - len(part.lstrip())
+        end = start + len(part.strip())
+        pos += len(part)
+        assert cleaned[index_map[start]:index_map[end]].strip() == transcriber._clean_special_tokens(part.strip())
+
+
+def test_clean_special_tokens_without_tokens(transcriber):
+    """不含特殊标记时只折叠空白，未变化的文本返回恒等映射。"""
+    assert transcriber._clean_special_tokens("  hello \t\n world ") == "hello world"
+    assert transcriber._clean_special_tokens("hello world", with_index_map=True) == (
+        "hello world", list(range(len("hello world") + 1))
+    )
+
+
+def test_add_punctuation_cached_reuses_short_segments(transcriber):
+    """短片段的标点结果被缓存复用，长文本不走缓存。"""
+    calls = []
+
+    def fake_add_punctuation(text, lang="zh"):
+        calls.append(text)
+        return text + "。"
+
+    transcriber._add_punctuation = fake_add_punctuation
+    transcriber._punctuation_cache = functools.lru_cache(maxsize=16)(fake_add_punctuation)
+
+    assert transcriber._add_punctuation_cached("嗯", "zh") == "嗯。"
+    assert transcriber._add_punctuation_cached("嗯", "zh") == "嗯。"
+    assert calls == ["嗯"]
+
+    long_text = "长" * 64
+    transcriber._add_punctuation_cached(long_text, "zh")
+    transcriber._add_punctuation_cached(long_text, "zh")
+    assert calls.count(long_text) == 2
+
+
+def test_extract_text_from_result(transcriber):
+    """分块结果只提取拼接后的文本。"""
+    result = [[
+        {"sentence": "第一句", "timestamp": [0, 1000]},
+        {"text": "第二句"},
+        "第三句",
+        42,
+    ]]
+    assert transcriber._extract_text_from_result(result) == "第一句第二句第三句"
+    assert transcriber._extract_text_from_result([{"text": "整段"}]) == "整段"
+    assert transcriber._extract_text_from_result(None) == ""
+
+
+def test_build_segment_keeps_time_order_check():
+    """快速构建的片段与校验构建结果一致，时间顺序约束仍然生效。"""
+    segment = _build_segment(1.0, 2.5, "你好")
+    assert segment == TranscriptionSegment(start_time=1.0, end_time=2.5, text="你好", confidence=0.95)
+
+    result = TranscriptionResult(text="你好", language="zh", confidence=0.95,
+                                 segments=[segment], processing_time=0.1)
+    assert result.segments[0].text == "你好"
+
+    with pytest.raises(ValueError):
+        _build_segment(0.0, 0.0, "无效")
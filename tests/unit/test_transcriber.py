@@ -0,0 +1,265 @@
+"""Whisper 转录器 (core.transcriber) 测试，推理后端以桩代替。"""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import core.transcriber as transcriber_module
+from core.transcriber import ModelRegistry, SpeechTranscriber, _SAMPLE_RATE
+from models.schemas import TranscriptionModel, TranscriptionResult
+
+
+def _make_transcriber(backend: str = "openai", device: str = "cpu") -> SpeechTranscriber:
+    """绕过 __init__（无需加载模型）构造转录器。"""
+    instance = object.__new__(SpeechTranscriber)
+    instance.model_name = TranscriptionModel.SENSEVOICE_SMALL
+    instance.backend = backend
+    instance._device = device
+    instance._device_indices = [0]
+    instance._replicas = None
+    instance.vad_filter = True
+    instance._vad = None
+    instance.model = object()
+    return instance
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(text=text, language="zh", confidence=0.9, segments=[], processing_time=0.0)
+
+
+@pytest.fixture
+def transcriber() -> SpeechTranscriber:
+    return _make_transcriber()
+
+
+def test_faster_whisper_result_uses_openai_format(transcriber):
+    """faster-whisper 的片段转换为 openai-whisper 格式，不请求结果中用不到的词级时间戳。"""
+    calls = []
+
+    class FakeModel:
+        def transcribe(self, audio, **kwargs):
+            calls.append(kwargs)
+            segment = SimpleNamespace(start=0.0, end=1.5, text="你好", avg_logprob=-0.2, no_speech_prob=0.01)
+            return iter([segment]), SimpleNamespace(language="zh")
+
+    transcriber.backend = "faster_whisper"
+    transcriber.model = FakeModel()
+    transcriber._load_audio_cached = lambda path: np.zeros(_SAMPLE_RATE, dtype=np.float32)
+
+    result = transcriber._run_transcribe("a.wav", {"language": "zh", "word_timestamps": True})
+
+    assert not calls[0].get("word_timestamps")
+    assert result["text"] == "你好"
+    assert result["language"] == "zh"
+    assert [(s["start"], s["end"], s["text"]) for s in result["segments"]] == [(0.0, 1.5, "你好")]
+
+
+def test_remove_silence_concatenates_speech_regions(transcriber):
+    """只保留 VAD 判定的语音区域并拼接，记录每段在拼接后与原始音频中的起点。"""
+    def fake_get_speech_timestamps(audio, model, sampling_rate, min_silence_duration_ms):
+        return [{"start": _SAMPLE_RATE, "end": 2 * _SAMPLE_RATE}, {"start": 3 * _SAMPLE_RATE, "end": 3 * _SAMPLE_RATE + 8000}]
+
+    transcriber._vad = (None, fake_get_speech_timestamps)
+    audio = np.arange(4 * _SAMPLE_RATE, dtype=np.float32)
+
+    speech, speech_map = transcriber._remove_silence(audio)
+
+    assert len(speech) == _SAMPLE_RATE + 8000
+    assert speech[0] == _SAMPLE_RATE and speech[_SAMPLE_RATE] == 3 * _SAMPLE_RATE
+    assert speech_map == [(0.0, 1.0, 1.0), (1.0, 3.0, 0.5)]
+
+
+def test_remove_silence_without_speech(transcriber):
+    """整段静音时返回空采样和空映射。"""
+    transcriber._vad = (None, lambda *args, **kwargs: [])
+    speech, speech_map = transcriber._remove_silence(np.zeros(_SAMPLE_RATE, dtype=np.float32))
+    assert len(speech) == 0
+    assert speech_map == []
+
+
+def test_restore_timeline_maps_back_to_original_audio(transcriber):
+    """片段与词的时间映射回原始时间轴，恰好落在区域边界的结束时间归入前一个区域。"""
+    speech_map = [(0.0, 1.0, 1.0), (1.0, 3.0, 0.5)]
+    result = {"segments": [
+        {"start": 0.2, "end": 1.0, "words": [{"start": 0.2, "end": 0.6}]},
+        {"start": 1.0, "end": 1.4, "words": None},
+    ]}
+
+    transcriber._restore_timeline(result, speech_map)
+
+    first, second = result["segments"]
+    assert (first["start"], first["end"]) == pytest.approx((1.2, 2.0))
+    assert (first["words"][0]["start"], first["words"][0]["end"]) == pytest.approx((1.2, 1.6))
+    assert (second["start"], second["end"]) == pytest.approx((3.0, 3.4))
+
+
+def test_oom_retry_halves_batch_size(monkeypatch):
+    """GPU 显存不足时释放缓存，以减半的批大小重试一次。"""
+    transcriber = _make_transcriber(backend="faster_whisper", device="cuda")
+    calls = []
+    emptied = []
+
+    def fake_run_transcribe(audio_path, options, audio=None, partial_callback=None):
+        calls.append(options.get("batch_size"))
+        if len(calls) == 1:
+            raise RuntimeError("CUDA failed with error out of memory")
+        return {"text": "ok"}
+
+    transcriber._run_transcribe = fake_run_transcribe
+    monkeypatch.setattr(transcriber_module.torch.cuda, "empty_cache", lambda: emptied.append(True))
+
+    result = transcriber._run_transcribe_with_oom_recovery("a.wav", {"batch_size": 8})
+
+    assert result == {"text": "ok"}
+    assert calls == [8, 4]
+    assert emptied == [True]
+
+
+def test_oom_retry_only_on_gpu_out_of_memory():
+    """CPU 上或非显存不足的错误直接抛出，不重试。"""
+    for device, message in (("cpu", "out of memory"), ("cuda", "shape mismatch")):
+        transcriber = _make_transcriber(backend="faster_whisper", device=device)
+        calls = []
+
+        def fake_run_transcribe(audio_path, options, audio=None, partial_callback=None):
+            calls.append(options)
+            raise RuntimeError(message)
+
+        transcriber._run_transcribe = fake_run_transcribe
+        with pytest.raises(RuntimeError, match=message):
+            transcriber._run_transcribe_with_oom_recovery("a.wav", {"batch_size": 8})
+        assert len(calls) == 1
+
+
+async def test_transcribe_batch_decodes_ahead_of_transcription(transcriber):
+    """转录当前文件时后续文件已在后台解码，解码失败的文件按原顺序返回错误结果。"""
+    events = []
+
+    def fake_load_audio(path):
+        events.append(("decoded", path))
+        if path == "broken.wav":
+            raise OSError("无法解码")
+        return np.zeros(_SAMPLE_RATE, dtype=np.float32)
+
+    async def fake_transcribe_audio(audio_path, language, progress_callback, batch_size, audio):
+        await asyncio.sleep(0.01)
+        events.append(("transcribed", audio_path))
+        return _result(audio_path)
+
+    transcriber._load_audio_cached = fake_load_audio
+    transcriber.transcribe_audio = fake_transcribe_audio
+
+    results = await transcriber.transcribe_batch(["a.wav", "broken.wav", "c.wav"], max_concurrent=2)
+
+    assert [r.text for r in results] == ["a.wav", "转录失败: 无法解码", "c.wav"]
+    assert events.index(("decoded", "c.wav")) < events.index(("transcribed", "a.wav"))
+
+
+async def test_transcribe_batch_batches_short_clips(transcriber):
+    """openai 后端把队列中已解码的短音频合成一批，长音频单独转录，解码失败的文件返回错误结果。"""
+    audios = {
+        "long.wav": np.zeros(40 * _SAMPLE_RATE, dtype=np.float32),
+        "a.wav": np.zeros(_SAMPLE_RATE, dtype=np.float32),
+        "b.wav": np.zeros(_SAMPLE_RATE, dtype=np.float32),
+        "c.wav": np.zeros(_SAMPLE_RATE, dtype=np.float32),
+    }
+    single_calls = []
+    short_batches = []
+
+    def fake_load_audio_cached(path):
+        if path == "broken.wav":
+            raise OSError("无法解码")
+        return audios[path]
+
+    async def fake_transcribe_audio(audio_path, language, progress_callback, batch_size, audio):
+        single_calls.append(audio_path)
+        # 长音频转录期间解码器把其余文件放入队列
+        await asyncio.sleep(0.05)
+        return _result(audio_path)
+
+    async def fake_transcribe_short_batch(batch, language):
+        short_batches.append(len(batch))
+        return [_result(f"short_{i}") for i in range(len(batch))]
+
+    transcriber._load_audio_cached = fake_load_audio_cached
+    transcriber.transcribe_audio = fake_transcribe_audio
+    transcriber._transcribe_short_batch = fake_transcribe_short_batch
+
+    results = await transcriber.transcribe_batch(
+        ["long.wav", "a.wav", "broken.wav", "b.wav", "c.wav"], max_concurrent=8, batch_size=8
+    )
+
+    assert single_calls == ["long.wav"]
+    assert short_batches == [3]
+    assert [r.text for r in results] == ["long.wav", "short_0", "转录失败: 无法解码", "short_1", "short_2"]
+
+
+async def test_transcribe_batch_each_worker_stops_at_its_sentinel(transcriber):
+    """多个 GPU 副本各自取文件转录，每个副本取走一个结束标记后退出，所有文件都被转录。"""
+    transcriber.backend = "faster_whisper"
+    replica = _make_transcriber(backend="faster_whisper")
+    handled = {"primary": [], "replica": []}
+
+    def make_transcribe_audio(name):
+        async def fake_transcribe_audio(audio_path, language, progress_callback, batch_size, audio):
+            handled[name].append(audio_path)
+            await asyncio.sleep(0.01)
+            return _result(audio_path)
+        return fake_transcribe_audio
+
+    async def fake_get_replicas():
+        return [replica]
+
+    transcriber._load_audio_cached = lambda path: np.zeros(_SAMPLE_RATE, dtype=np.float32)
+    transcriber._get_replicas = fake_get_replicas
+    transcriber.transcribe_audio = make_transcribe_audio("primary")
+    replica.transcribe_audio = make_transcribe_audio("replica")
+
+    paths = [f"{i}.wav" for i in range(6)]
+    results = await asyncio.wait_for(transcriber.transcribe_batch(paths, max_concurrent=2), timeout=5)
+
+    assert [r.text for r in results] == paths
+    assert sorted(handled["primary"] + handled["replica"]) == paths
+    assert handled["primary"] and handled["replica"]
+
+
+class _FakeTranscriber:
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.unloaded = False
+
+    async def unload_model(self):
+        self.unloaded = True
+
+
+async def test_model_registry_evicts_least_recently_used(monkeypatch):
+    """命中时复用已加载的转录器，超出容量时卸载最久未使用的模型。"""
+    created = []
+
+    def fake_create_transcriber(model_name):
+        created.append(_FakeTranscriber(model_name))
+        return created[-1]
+
+    monkeypatch.setattr(transcriber_module, "create_transcriber", fake_create_transcriber)
+    registry = ModelRegistry(max_models=2)
+
+    base = await registry.get_transcriber("base")
+    small = await registry.get_transcriber("small")
+    assert await registry.get_transcriber("base") is base
+    await registry.get_transcriber("medium")
+
+    assert small.unloaded and not base.unloaded
+    assert list(registry._transcribers) == ["base", "medium"]
+    assert len(created) == 3
+
+
+def test_module_getattr_creates_default_transcriber_lazily(monkeypatch):
+    """旧的模块属性 speech_transcriber 访问时才创建，未知属性仍抛出 AttributeError。"""
+    default = object()
+    monkeypatch.setattr(transcriber_module, "get_default_transcriber", lambda: default)
+
+    assert transcriber_module.speech_transcriber is default
+    with pytest.raises(AttributeError):
+        transcriber_module.no_such_attribute
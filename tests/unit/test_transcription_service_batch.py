@@ -0,0 +1,231 @@
+"""批量转录流水线测试。"""
+
+import asyncio
+
+import pytest
+
+from models.schemas import ProcessOptions, TranscriptionResult
+from services.transcription_service import TranscriptionService, _DEFAULT_GPU_BATCH_SIZE
+
+
+def _result(text: str = "ok") -> TranscriptionResult:
+    return TranscriptionResult(text=text, language="zh", confidence=0.9, segments=[], processing_time=0.0)
+
+
+async def _validate(file_path, task_id, progress_callback):
+    return None
+
+
+async def _extract(file_path, task_id, progress_callback):
+    return ""
+
+
+async def _transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+    return _result()
+
+
+@pytest.fixture
+def service() -> TranscriptionService:
+    return TranscriptionService()
+
+
+@pytest.fixture
+def patch_pipeline(service, monkeypatch):
+    """以桩替换校验、音频提取、转录和转录器创建，未传入的步骤使用默认的成功实现。"""
+    def patch(validate=_validate, extract=_extract, transcribe=_transcribe,
+              create_transcriber=lambda options, device: None):
+        monkeypatch.setattr(service, "_validate_file", validate)
+        monkeypatch.setattr(service, "_extract_audio", extract)
+        monkeypatch.setattr(service, "_transcribe", transcribe)
+        monkeypatch.setattr(service.audio_extractor, "get_media_info", lambda path: None)
+        monkeypatch.setattr(service, "_create_transcriber", create_transcriber)
+
+    return patch
+
+
+async def test_batch_overlaps_extraction_with_transcription(service, patch_pipeline, monkeypatch):
+    """转录阶段单独限流，其余任务的音频提取不被推理阻塞。"""
+    monkeypatch.setattr(service.config, "MAX_CONCURRENT_TRANSCRIPTIONS", 1)
+    state = {"extracted": 0, "transcribing": 0, "max_transcribing": 0, "extracted_while_transcribing": 0}
+
+    async def fake_extract(file_path, task_id, progress_callback):
+        state["extracted"] += 1
+        if state["transcribing"]:
+            state["extracted_while_transcribing"] += 1
+        return ""
+
+    async def fake_transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+        state["transcribing"] += 1
+        state["max_transcribing"] = max(state["max_transcribing"], state["transcribing"])
+        await asyncio.sleep(0.01)
+        state["transcribing"] -= 1
+        return _result()
+
+    patch_pipeline(extract=fake_extract, transcribe=fake_transcribe)
+
+    result = await service.transcribe_batch(
+        ["a.mp4", "b.mp4", "c.mp4"], options=ProcessOptions(), max_concurrent=3
+    )
+
+    assert result["success"] == 3
+    assert state["max_transcribing"] == 1
+    assert state["extracted_while_transcribing"] >= 1
+
+
+async def test_batch_preloads_one_shared_transcriber(service, patch_pipeline):
+    """批量处理前预热一次模型，所有文件共享同一转录器和同一选项实例，结束后统一卸载。"""
+    calls = []
+
+    class FakeTranscriber:
+        device = "cpu"
+
+        async def warmup(self):
+            calls.append("warmup")
+
+        async def unload_model(self):
+            calls.append("unload")
+
+    shared = FakeTranscriber()
+    used = []
+
+    async def fake_transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+        used.append((transcriber, options))
+        return _result()
+
+    patch_pipeline(transcribe=fake_transcribe, create_transcriber=lambda options, device: shared)
+
+    options = ProcessOptions(enable_gpu=False)
+    await service.transcribe_batch(["a.mp4", "b.mp4"], options=options, max_concurrent=2)
+
+    assert calls == ["warmup", "unload"]
+    assert [transcriber for transcriber, _ in used] == [shared, shared]
+    assert all(passed is options for _, passed in used)
+
+
+async def test_batch_preload_skips_warmup_when_disabled(service, patch_pipeline):
+    """关闭 warmup 时只加载模型，不做预热推理。"""
+    calls = []
+
+    class FakeTranscriber:
+        async def warmup(self):
+            calls.append("warmup")
+
+        async def load_model(self):
+            calls.append("load")
+
+        async def unload_model(self):
+            calls.append("unload")
+
+    patch_pipeline(create_transcriber=lambda options, device: FakeTranscriber())
+
+    await service.transcribe_batch(["a.mp4"], options=ProcessOptions(warmup=False), max_concurrent=1)
+
+    assert calls == ["load", "unload"]
+
+
+async def test_batch_without_files_skips_model_loading(service, patch_pipeline):
+    """文件列表为空时直接返回空统计，不创建也不加载模型。"""
+    created = []
+    reported = []
+    patch_pipeline(create_transcriber=lambda options, device: created.append(device))
+
+    result = await service.transcribe_batch(
+        [], options=ProcessOptions(), progress_callback=lambda batch_id, info: reported.append(info)
+    )
+
+    assert created == []
+    assert result["total"] == 0 and result["success_rate"] == 0
+    assert reported == [result]
+
+
+async def test_batch_unloads_transcriber_when_warmup_fails(service, patch_pipeline):
+    """预热失败时先卸载已部分加载的模型，再退回按文件加载。"""
+    calls = []
+    used = []
+
+    class FakeTranscriber:
+        async def warmup(self):
+            calls.append("warmup")
+            raise RuntimeError("CUDA out of memory")
+
+        async def unload_model(self):
+            calls.append("unload")
+
+    async def fake_transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+        used.append(transcriber)
+        return _result()
+
+    patch_pipeline(transcribe=fake_transcribe, create_transcriber=lambda options, device: FakeTranscriber())
+
+    result = await service.transcribe_batch(["a.mp4"], options=ProcessOptions(), max_concurrent=1)
+
+    assert calls == ["warmup", "unload"]
+    assert used == [None]
+    assert result["success"] == 1
+
+
+async def test_batch_reports_each_result_as_it_completes(service, patch_pipeline):
+    """每个文件转录成功后立即回调其 TaskInfo，失败的文件不回调。"""
+    finished = []
+
+    async def fake_validate(file_path, task_id, progress_callback):
+        if file_path == "bad.mp4":
+            raise Exception("文件不存在")
+
+    async def fake_transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+        return _result(task_id)
+
+    patch_pipeline(validate=fake_validate, transcribe=fake_transcribe)
+
+    result = await service.transcribe_batch(
+        ["a.mp4", "bad.mp4", "c.mp4"], options=ProcessOptions(), max_concurrent=3,
+        result_callback=finished.append
+    )
+
+    assert result["success"] == 2
+    assert sorted(task_info.file_path for task_info in finished) == ["a.mp4", "c.mp4"]
+    assert all(task_info.result.text == task_info.task_id for task_info in finished)
+
+
+async def test_batch_workers_bound_concurrency(service, patch_pipeline, monkeypatch):
+    """文件数多于并发数时，同时处理的文件不超过 max_concurrent，所有文件都被处理。"""
+    monkeypatch.setattr(service.config, "MAX_CONCURRENT_TRANSCRIPTIONS", 2)
+    state = {"active": 0, "max_active": 0}
+
+    async def fake_validate(file_path, task_id, progress_callback):
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+
+    async def fake_extract(file_path, task_id, progress_callback):
+        await asyncio.sleep(0.01)
+        return ""
+
+    async def fake_transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+        state["active"] -= 1
+        return _result()
+
+    patch_pipeline(validate=fake_validate, extract=fake_extract, transcribe=fake_transcribe)
+
+    result = await service.transcribe_batch(
+        [f"{i}.mp4" for i in range(7)], options=ProcessOptions(), max_concurrent=2
+    )
+
+    assert result["success"] == 7
+    assert state["max_active"] == 2
+
+
+async def test_batch_applies_default_gpu_batch_size(service, patch_pipeline):
+    """批量处理未指定 batch_size 时 GPU 上使用默认批大小，显式指定或 CPU 上保持不变。"""
+    seen = []
+
+    async def fake_transcribe(audio_path, options, task_id, progress_callback, transcriber=None, partial_callback=None):
+        seen.append(options.batch_size)
+        return _result()
+
+    patch_pipeline(transcribe=fake_transcribe)
+
+    for options in (ProcessOptions(enable_gpu=True), ProcessOptions(enable_gpu=True, batch_size=2),
+                    ProcessOptions(enable_gpu=False)):
+        await service.transcribe_batch(["a.mp4"], options=options, max_concurrent=1)
+
+    assert seen == [_DEFAULT_GPU_BATCH_SIZE, 2, None]
@@ -7,9 +7,13 @@
 import os
 import subprocess
 import tempfile
+import threading
+import uuid
+import wave
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 
+import numpy as np
 from loguru import logger
 from utils.ffmpeg import get_ffmpeg_path, get_ffprobe_path
 
@@ -78,6 +82,111 @@ class AudioChunker:
             logger.error(f"获取音频时长失败: {e}")
             return 0.0
 
+    def plan_chunks(self, total_duration: float) -> List[Tuple[float, float]]:
+        """
+        计算分块边界
+
+        Args:
+            total_duration: 音频总时长（秒）
+
+        Returns:
+            List[Tuple[float, float]]: (开始时间, 结束时间) 列表
+        """
+        bounds = []
+        start_time = 0.0
+
+        while start_time < total_duration:
+            # 计算块的结束时间
+            end_time = min(start_time + self.chunk_duration, total_duration)
+
+            # 跳过太小的块（小于10秒）
+            if end_time - start_time < 10:
+                logger.debug(f"跳过太小的块: {start_time:.1f}s - {end_time:.1f}s")
+                break
+
+            bounds.append((start_time, end_time))
+
+            # 移动到下一块（减去重叠时间）
+            # 如果到达末尾，退出循环
+            if end_time >= total_duration - 1:
+                logger.debug(f"到达音频末尾，停止分割")
+                break
+
+            start_time = end_time - self.overlap
+
+        return bounds
+
+    def iter_chunks(
+        self,
+        audio_path: str,
+        temp_dir: str = None,
+        total_duration: Optional[float] = None
+    ) -> Iterator[Tuple[str, float, float]]:
+        """
+        逐块分割音频，每写完一块立即产出，调用方可以边分割边转录
+
+        Args:
+            audio_path: 音频文件路径
+            temp_dir: 临时目录
+            total_duration: 音频总时长（秒），None 则通过 ffprobe 获取
+
+        Yields:
+            Tuple[str, float, float]: (块文件路径, 开始时间, 结束时间)
+        """
+        temp_dir = temp_dir or tempfile.gettempdir()
+        temp_path = Path(temp_dir)
+        temp_path.mkdir(parents=True, exist_ok=True)
+
+        if total_duration is None:
+            total_duration = self.get_audio_duration(audio_path)
+
+        ffmpeg = get_ffmpeg_path() or "ffmpeg"
+        # 每次分割使用独立的文件名前缀，避免与仍在后台清理的上一批块文件冲突
+        run_id = uuid.uuid4().hex[:8]
+
+        for chunk_index, (start_time, end_time) in enumerate(self.plan_chunks(total_duration)):
+            # 输出文件路径
+            chunk_path = temp_path / f"chunk_{run_id}_{chunk_index}.wav"
+
+            # 使用 ffmpeg 提取音频片段
+            duration = end_time - start_time
+            cmd = [
+                ffmpeg, '-y', '-v', 'error',
+                '-i', audio_path,
+                '-ss', str(start_time),
+                '-t', str(duration),
+                '-ar', '16000',
+                '-ac', '1',
+                '-c:a', 'pcm_s16le',
+                str(chunk_path)
+            ]
+
+            logger.info(f"创建块 {chunk_index}: {start_time:.1f}s - {end_time:.1f}s (时长 {duration:.1f}s)")
+
+            result = subprocess.run(cmd, capture_output=True, timeout=120)
+            if result.returncode != 0:
+                stderr_text = result.stderr.decode("utf-8", errors="replace")
+                logger.error(f"ffmpeg 分割块 {chunk_index} 失败: {stderr_text}")
+                raise Exception(f"ffmpeg 分割失败: {stderr_text}")
+
+            yield (str(chunk_path), start_time, end_time)
+
+    def load_chunk_samples(self, chunk_path: str) -> np.ndarray:
+        """
+        读取 iter_chunks 生成的块文件（16kHz 单声道 16-bit PCM WAV）
+
+        Args:
+            chunk_path: 块文件路径
+
+        Returns:
+            np.ndarray: float32 采样，取值范围 [-1, 1)
+        """
+        with wave.open(chunk_path, "rb") as wav:
+            if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+                raise ValueError(f"不支持的块文件格式: {chunk_path}")
+            frames = wav.readframes(wav.getnframes())
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
     async def split_audio(
         self,
         audio_path: str,
@@ -97,63 +206,12 @@ class AudioChunker:
             # 不需要分块，返回原文件
             return [(audio_path, 0.0, self.get_audio_duration(audio_path))]
 
-        temp_dir = temp_dir or tempfile.gettempdir()
-        temp_path = Path(temp_dir)
-        temp_path.mkdir(parents=True, exist_ok=True)
-
         try:
             # 获取音频总时长
             total_duration = self.get_audio_duration(audio_path)
             logger.info(f"开始分割音频: 总时长 {total_duration:.1f} 秒")
 
-            chunks = []
-            start_time = 0.0
-            chunk_index = 0
-
-            while start_time < total_duration:
-                # 计算块的结束时间
-                end_time = min(start_time + self.chunk_duration, total_duration)
-
-                # 跳过太小的块（小于10秒）
-                if end_time - start_time < 10:
-                    logger.debug(f"跳过太小的块: {start_time:.1f}s - {end_time:.1f}s")
-                    break
-
-                # 输出文件路径
-                chunk_path = temp_path / f"chunk_{chunk_index}.wav"
-
-                # 使用 ffmpeg 提取音频片段
-                ffmpeg = get_ffmpeg_path() or "ffmpeg"
-                duration = end_time - start_time
-                cmd = [
-                    ffmpeg, '-y', '-v', 'error',
-                    '-i', audio_path,
-                    '-ss', str(start_time),
-                    '-t', str(duration),
-                    '-ar', '16000',
-                    '-ac', '1',
-                    '-c:a', 'pcm_s16le',
-                    str(chunk_path)
-                ]
-
-                logger.info(f"创建块 {chunk_index}: {start_time:.1f}s - {end_time:.1f}s (时长 {duration:.1f}s)")
-
-                result = subprocess.run(cmd, capture_output=True, timeout=120)
-                if result.returncode != 0:
-                    stderr_text = result.stderr.decode("utf-8", errors="replace")
-                    logger.error(f"ffmpeg 分割块 {chunk_index} 失败: {stderr_text}")
-                    raise Exception(f"ffmpeg 分割失败: {stderr_text}")
-
-                chunks.append((str(chunk_path), start_time, end_time))
-
-                # 移动到下一块（减去重叠时间）
-                # 如果到达末尾，退出循环
-                if end_time >= total_duration - 1:
-                    logger.debug(f"到达音频末尾，停止分割")
-                    break
-
-                start_time = end_time - self.overlap
-                chunk_index += 1
+            chunks = list(self.iter_chunks(audio_path, temp_dir, total_duration))
 
             logger.info(f"音频分割完成: 共 {len(chunks)} 块")
             return chunks
@@ -195,7 +253,9 @@ class AudioChunker:
         merged_segments = []
         total_time = 0.0
         detected_language = "unknown"
-        all_confidences = []
+        # 置信度在添加片段时累加，省去合并后的再次遍历
+        confidence_total = 0.0
+        confidence_count = 0
 
         # 用于跟踪时间偏移
         time_offset = 0.0
@@ -220,6 +280,10 @@ class AudioChunker:
                     merged_text.append(chunk_text)
                 for seg in chunk_segments:
                     merged_segments.append(seg)
+                    conf = seg.get("confidence", 0)
+                    if conf:
+                        confidence_total += conf
+                        confidence_count += 1
             else:
                 # 对于后续块，需要处理重叠
                 # 调整时间戳
@@ -234,6 +298,10 @@ class AudioChunker:
                     segments_to_add = chunk_segments[1:]
                     for seg in segments_to_add:
                         merged_segments.append(seg)
+                        conf = seg.get("confidence", 0)
+                        if conf:
+                            confidence_total += conf
+                            confidence_count += 1
                         if seg.get("text"):
                             merged_text.append(seg.get("text", ""))
                 # 如果没有 segments 但有 text，直接添加 text
@@ -257,14 +325,9 @@ class AudioChunker:
             logger.info(f"  块 {i}: {len(chunk_text)} 字符")
 
         # 计算平均置信度
-        for seg in merged_segments:
-            conf = seg.get("confidence", 0)
-            if conf:
-                all_confidences.append(conf)
-
         avg_confidence = (
-            sum(all_confidences) / len(all_confidences)
-            if all_confidences else 0.5
+            confidence_total / confidence_count
+            if confidence_count else 0.5
         )
 
         result = {
@@ -278,22 +341,55 @@ class AudioChunker:
         logger.info(f"合并完成: 总文本长度 {len(final_text)} 字符")
         return result
 
-    async def cleanup_chunks(self, chunk_paths: List[str]):
+    def remove_chunks(self, chunk_paths: List[str]):
         """
-        清理临时的音频块文件
+        删除临时的音频块文件（同步）
 
         Args:
             chunk_paths: 块文件路径列表
         """
         for chunk_path in chunk_paths:
+            # 只删除临时生成的块文件（不删除原始文件）
+            if "chunk_" not in os.path.basename(chunk_path):
+                continue
             try:
-                # 只删除临时生成的块文件（不删除原始文件）
-                if "chunk_" in os.path.basename(chunk_path):
-                    Path(chunk_path).unlink(missing_ok=True)
-                    logger.debug(f"已清理音频块: {chunk_path}")
+                os.unlink(chunk_path)
+                logger.debug(f"已清理音频块: {chunk_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"清理音频块失败 {chunk_path}: {e}")
 
+    def cleanup_chunks_in_background(self, chunk_paths: List[str]) -> threading.Thread:
+        """
+        在后台线程中清理临时的音频块文件，不阻塞调用方返回转录结果
+
+        清理线程不是守护线程，解释器退出前会等待删除完成，CLI 转录完最后一个
+        文件后立即退出也不会残留块文件。
+
+        Args:
+            chunk_paths: 块文件路径列表
+
+        Returns:
+            threading.Thread: 清理线程
+        """
+        cleaner = threading.Thread(
+            target=self.remove_chunks,
+            args=(list(chunk_paths),),
+            name="audio-chunk-cleanup"
+        )
+        cleaner.start()
+        return cleaner
+
+    async def cleanup_chunks(self, chunk_paths: List[str]):
+        """
+        清理临时的音频块文件
+
+        Args:
+            chunk_paths: 块文件路径列表
+        """
+        self.remove_chunks(chunk_paths)
+
 
 # 创建全局实例
 audio_chunker = AudioChunker()
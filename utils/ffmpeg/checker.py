@@ -4,6 +4,7 @@ FFmpeg 检测模块
 """
 
 import shutil
+import functools
 import subprocess
 import platform
 from pathlib import Path
@@ -26,16 +27,23 @@ def _find_local_ffmpeg(name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_ffmpeg_path() -> Optional[str]:
-    """获取 ffmpeg 可执行文件路径（本地优先，回退到 PATH）"""
+    """
+    获取 ffmpeg 可执行文件路径（本地优先，回退到 PATH）
+
+    进程内只解析一次：批量处理时每个文件的时长探测、音频提取和分块
+    都会调用，结果缓存后不再重复扫描本地目录和 PATH。
+    """
     local = _find_local_ffmpeg("ffmpeg.exe")
     if local:
         return local
     return shutil.which("ffmpeg")
 
 
+@functools.lru_cache(maxsize=None)
 def get_ffprobe_path() -> Optional[str]:
-    """获取 ffprobe 可执行文件路径（本地优先，回退到 PATH）"""
+    """获取 ffprobe 可执行文件路径（本地优先，回退到 PATH，进程内缓存）"""
     local = _find_local_ffmpeg("ffprobe.exe")
     if local:
         return local
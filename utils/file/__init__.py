@@ -7,6 +7,7 @@ from .helpers import (
     format_duration,
     format_file_size,
     clean_filename,
+    sanitize_filename,
     get_file_hash,
     async_get_file_hash,
     get_mime_type,
@@ -21,6 +22,7 @@ __all__ = [
     "format_duration",
     "format_file_size",
     "clean_filename",
+    "sanitize_filename",
     "get_file_hash",
     "async_get_file_hash",
     "get_mime_type",
@@ -62,6 +62,10 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_float:.1f} {size_names[i]}"
 
 
+# clean_filename 使用的映射表：非法字符替换为下划线
+_ILLEGAL_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+
 def clean_filename(filename: str, max_length: int = 255) -> str:
     """
     清理文件名，移除非法字符
@@ -74,9 +78,7 @@ def clean_filename(filename: str, max_length: int = 255) -> str:
         str: 清理后的文件名
     """
     # 移除非法字符
-    illegal_chars = r'<>:"/\\|?*'
-    for char in illegal_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_ILLEGAL_FILENAME_TABLE)
 
     # 移除连续的空格和下划线
     filename = re.sub(r'\s+', ' ', filename)
@@ -94,6 +96,35 @@ def clean_filename(filename: str, max_length: int = 255) -> str:
     return filename or "untitled"
 
 
+class _FilenameCharTable(dict):
+    """
+    sanitize_filename 使用的 str.translate 映射表
+
+    按码位惰性判定并缓存：字母数字及空格、连字符、下划线映射为自身，其余映射为 None（删除）。
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        self[codepoint] = result = codepoint if char.isalnum() or char in " -_" else None
+        return result
+
+
+_FILENAME_CHAR_TABLE = _FilenameCharTable()
+
+
+def sanitize_filename(name: str) -> str:
+    """
+    只保留字母数字、空格、连字符和下划线，用于由标题生成输出文件名
+
+    Args:
+        name: 原始名称
+
+    Returns:
+        str: 过滤并去除首尾空白后的名称
+    """
+    return name.translate(_FILENAME_CHAR_TABLE).strip()
+
+
 def get_file_hash(file_path: str, algorithm: str = "md5") -> Optional[str]:
     """
     计算文件哈希值
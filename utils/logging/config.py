@@ -69,12 +69,8 @@ class LoggerConfig:
                 diagnose=True
             )
         
-        # 文件输出
+        # 文件输出：delay 推迟到首条日志写入时才创建目录和文件
         if self.log_file:
-            # 确保日志目录存在
-            log_path = Path(self.log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
             logger.add(
                 self.log_file,
                 format=self.log_format,
@@ -84,7 +80,8 @@ class LoggerConfig:
                 compression="zip",
                 backtrace=True,
                 diagnose=True,
-                encoding="utf-8"
+                encoding="utf-8",
+                delay=True
             )
     
     def set_level(self, level: str):
@@ -110,13 +107,17 @@ class LoggerConfig:
         )
 
 
+# 模块级别的日志器配置
+_logger_config = None
+
+
 def setup_default_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = "./logs/app.log",
     log_to_console: bool = True
 ) -> LoggerConfig:
     """
-    设置默认日志配置
+    设置默认日志配置（幂等：配置相同时复用已有处理器，不重复移除和添加）
     
     Args:
         log_level: 日志级别
@@ -126,11 +127,23 @@ def setup_default_logger(
     Returns:
         LoggerConfig: 日志配置实例
     """
-    return LoggerConfig(
+    global _logger_config
+
+    config = _logger_config
+    if (
+        config is not None
+        and config.log_level == log_level.upper()
+        and config.log_file == log_file
+        and config.log_to_console == log_to_console
+    ):
+        return config
+
+    _logger_config = LoggerConfig(
         log_level=log_level,
         log_file=log_file,
         log_to_console=log_to_console
     )
+    return _logger_config
 
 
 def get_logger(name: Optional[str] = None):
@@ -148,10 +161,6 @@ def get_logger(name: Optional[str] = None):
     return logger
 
 
-# 模块级别的日志器配置
-_logger_config = None
-
-
 def init_logger_from_env():
     """从环境变量初始化日志器"""
     global _logger_config
@@ -3,9 +3,18 @@
 将转录结果格式化为不同格式 (TXT, SRT, VTT, JSON)
 """
 
+from typing import List, Sequence
+
+import numpy as np
 from loguru import logger
 from models.schemas import TranscriptionResult, OutputFormat
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def format_output(result: TranscriptionResult, format_type: OutputFormat = OutputFormat.JSON) -> str:
     """
@@ -26,13 +35,20 @@ def format_output(result: TranscriptionResult, format_type: OutputFormat = Outpu
         elif format_type == OutputFormat.VTT:
             return _format_vtt(result)
         else:  # JSON
-            return result.model_dump_json(indent=2)
+            return _format_json(result)
 
     except Exception as e:
         logger.error(f"输出格式化失败: {e}")
         return result.text  # 回退到纯文本
 
 
+def _format_json(result: TranscriptionResult) -> str:
+    """格式化为缩进 JSON，orjson 可用时走 C 实现的序列化"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result.model_dump(), option=orjson.OPT_INDENT_2).decode()
+    return result.model_dump_json(indent=2)
+
+
 def _format_txt(result: TranscriptionResult) -> str:
     """格式化为纯文本，段落间双换行"""
     if result.paragraphs:
@@ -45,16 +61,15 @@ def _format_srt(result: TranscriptionResult) -> str:
     if not result.segments:
         return result.text
 
-    srt_content = []
-    for i, segment in enumerate(result.segments, 1):
-        start_time = _format_srt_time(segment.start_time)
-        end_time = _format_srt_time(segment.end_time)
-        srt_content.append(f"{i}")
-        srt_content.append(f"{start_time} --> {end_time}")
-        srt_content.append(segment.text)
-        srt_content.append("")  # 空行
+    segments = result.segments
+    starts = format_timestamps([segment.start_time for segment in segments], ",")
+    ends = format_timestamps([segment.end_time for segment in segments], ",")
 
-    return "\n".join(srt_content)
+    # 每个字幕块以空行分隔
+    return "\n".join(
+        f"{i}\n{start} --> {end}\n{segment.text}\n"
+        for i, (segment, start, end) in enumerate(zip(segments, starts, ends), 1)
+    )
 
 
 def _format_vtt(result: TranscriptionResult) -> str:
@@ -62,30 +77,46 @@ def _format_vtt(result: TranscriptionResult) -> str:
     if not result.segments:
         return result.text
 
-    vtt_content = ["WEBVTT", ""]
-    for segment in result.segments:
-        start_time = _format_vtt_time(segment.start_time)
-        end_time = _format_vtt_time(segment.end_time)
-        vtt_content.append(f"{start_time} --> {end_time}")
-        vtt_content.append(segment.text)
-        vtt_content.append("")  # 空行
+    segments = result.segments
+    starts = format_timestamps([segment.start_time for segment in segments], ".")
+    ends = format_timestamps([segment.end_time for segment in segments], ".")
 
+    vtt_content = ["WEBVTT", ""]
+    vtt_content.extend(
+        f"{start} --> {end}\n{segment.text}\n"
+        for segment, start, end in zip(segments, starts, ends)
+    )
     return "\n".join(vtt_content)
 
 
+def format_timestamps(seconds: Sequence[float], millis_separator: str) -> List[str]:
+    """
+    批量格式化时间戳 (HH:MM:SS<分隔符>mmm)
+
+    所有时间一次性取整到毫秒并用 numpy 拆分时、分、秒，每个时间戳只剩一次字符串格式化。
+
+    Args:
+        seconds: 秒数序列
+        millis_separator: 秒与毫秒之间的分隔符，SRT 为 ","，VTT 为 "."
+
+    Returns:
+        List[str]: 与输入顺序一致的时间戳
+    """
+    millis = np.rint(np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+    hours, millis = np.divmod(millis, 3_600_000)
+    minutes, millis = np.divmod(millis, 60_000)
+    secs, millis = np.divmod(millis, 1000)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}{millis_separator}{ms:03d}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    ]
+
+
 def _format_srt_time(seconds: float) -> str:
     """格式化SRT时间戳 (HH:MM:SS,mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return format_timestamps([seconds], ",")[0]
 
 
 def _format_vtt_time(seconds: float) -> str:
     """格式化VTT时间戳 (HH:MM:SS.mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    return format_timestamps([seconds], ".")[0]